@@ -0,0 +1,134 @@
+"""Command line interface of the benchmark suite
+
+Run benchmarks and write the results as JSON::
+
+    python -m benchmarks run --output results.json
+
+Time the startup of interpreters importing the package and of spawned workers::
+
+    python -m benchmarks startup --output startup.json
+
+Compare two runs, the exit code is 1 if any case regressed::
+
+    python -m benchmarks compare baseline.json results.json --threshold 0.1
+"""
+from __future__ import annotations
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import sys
+
+import numpy
+
+from .compare import compare_runs
+from .pipeline import run_benchmarks
+from .startup import run_startup_benchmarks
+
+
+def int_list(value: str):
+    return [int(item) for item in value.split(",") if item]
+
+
+def str_list(value: str):
+    return [item for item in value.split(",") if item]
+
+
+def run(arguments: argparse.Namespace) -> int:
+    cases = run_benchmarks(
+        sizes=arguments.sizes, lengths=arguments.lengths, workers=arguments.workers,
+        granularities=arguments.granularities, max_cell_size=arguments.max_cell_size, repeat=arguments.repeat,
+        processings=arguments.processings)
+    return write_report(cases=cases, path=arguments.output)
+
+
+def startup(arguments: argparse.Namespace) -> int:
+    cases = run_startup_benchmarks(modules=arguments.modules, workers=arguments.workers, repeat=arguments.repeat)
+    return write_report(cases=cases, path=arguments.output)
+
+
+def write_report(cases: list, path: str) -> int:
+    report = {
+        "metadata": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": numpy.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "cases": cases,
+    }
+    output = open(path, mode="w") if path != "-" else sys.stdout
+    try:
+        json.dump(report, output, indent=2)
+        output.write("\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+def compare(arguments: argparse.Namespace) -> int:
+    with open(arguments.baseline, mode="r") as baseline_file, open(arguments.current, mode="r") as current_file:
+        baseline, current = json.load(baseline_file), json.load(current_file)
+    comparisons = compare_runs(baseline=baseline, current=current, threshold=arguments.threshold, metric=arguments.metric,
+                               min_delta=arguments.min_delta)
+    json.dump(comparisons, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    regressions = [comparison for comparison in comparisons if comparison["regression"]]
+    for regression in regressions:
+        print(f"REGRESSION {regression['name']} {json.dumps(regression['params'], sort_keys=True)}: "
+              f"{regression['baseline']:.6f}s -> {regression['current']:.6f}s", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="matrix multiplication pipeline benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run benchmarks and write results as JSON")
+    run_parser.add_argument("--output", default="-", help="output file, stdout by default")
+    run_parser.add_argument("--sizes", type=int_list, default=[32, 128, 256], help="comma separated square matrix sizes")
+    run_parser.add_argument("--lengths", type=int_list, default=[2, 4], help="comma separated chain lengths")
+    run_parser.add_argument("--workers", type=int_list, default=[multiprocessing.cpu_count()],
+                            help="comma separated worker counts")
+    run_parser.add_argument("--granularities", type=str_list, default=["cell", "block:32", "block:64"],
+                            help="comma separated task granularities: cell or block:<tile size>")
+    run_parser.add_argument("--processings", type=str_list, default=["streaming", "threads"],
+                            help="comma separated task processings: batch, streaming (processes) or threads")
+    run_parser.add_argument("--max-cell-size", type=int, default=128,
+                            help="largest matrix size benchmarked with cell granularity")
+    run_parser.add_argument("--repeat", type=int, default=5, help="number of timed repetitions of each case")
+    run_parser.set_defaults(handler=run)
+
+    startup_parser = subparsers.add_parser(
+        "startup", help="time interpreters importing the package and spawned workers, write results as JSON")
+    startup_parser.add_argument("--output", default="-", help="output file, stdout by default")
+    startup_parser.add_argument(
+        "--modules", type=lambda value: value.split(","),
+        default=["", "numpy", "matrix_multiplication", "matrix_multiplication.kernel",
+                 "matrix_multiplication.commands.matrix_multiplication", "matrix_multiplication.utils.matrix_multiplication"],
+        help="comma separated modules imported by fresh interpreters, empty name times the bare interpreter")
+    startup_parser.add_argument("--workers", type=int_list, default=[1, multiprocessing.cpu_count()],
+                                help="comma separated numbers of spawned workers")
+    startup_parser.add_argument("--repeat", type=int, default=5, help="number of timed repetitions of each case")
+    startup_parser.set_defaults(handler=startup)
+
+    compare_parser = subparsers.add_parser("compare", help="compare two benchmark runs")
+    compare_parser.add_argument("baseline", help="baseline results file")
+    compare_parser.add_argument("current", help="current results file")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="relative slowdown flagged as regression")
+    compare_parser.add_argument("--min-delta", type=float, default=0.0005,
+                                help="absolute slowdown in seconds below which cases are never flagged")
+    compare_parser.add_argument("--metric", choices=("min", "median", "max"), default="min")
+    compare_parser.set_defaults(handler=compare)
+
+    arguments = parser.parse_args()
+    return arguments.handler(arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""Module with comparison of two benchmark runs
+"""
+from __future__ import annotations
+import json
+import typing
+
+
+def case_key(case: typing.Dict[str, object]) -> str:
+    return json.dumps({"name": case["name"], "params": case["params"]}, sort_keys=True)
+
+
+def compare_runs(baseline: typing.Dict[str, object], current: typing.Dict[str, object], threshold: float = 0.1,
+                 metric: str = "min", min_delta: float = 0.0) -> typing.List[typing.Dict[str, object]]:
+    """Compares the cases present in both runs
+
+    A case is flagged as a regression if its ``metric`` grew by more than ``threshold`` (relative)
+    and by more than ``min_delta`` seconds (absolute), the latter filters out the noise of very fast cases
+
+    Returns:
+        List[Dict[str, object]]: comparison of every common case
+    """
+    baseline_cases = {case_key(case=case): case for case in baseline["cases"]}
+    comparisons = list()
+    for case in current["cases"]:
+        baseline_case = baseline_cases.get(case_key(case=case))
+        if baseline_case is None:
+            continue
+        ratio = case[metric] / baseline_case[metric] if baseline_case[metric] > 0 else float("inf")
+        comparisons.append({
+            "name": case["name"], "params": case["params"], "baseline": baseline_case[metric], "current": case[metric],
+            "ratio": ratio, "regression": ratio > 1 + threshold and case[metric] - baseline_case[metric] > min_delta})
+    return comparisons
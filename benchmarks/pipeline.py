@@ -0,0 +1,93 @@
+"""Module with benchmark cases for the matrix multiplication pipeline
+"""
+from __future__ import annotations
+import itertools
+import multiprocessing
+import typing
+
+import numpy
+
+from matrix_multiplication.containers import MatrixMultiplicationCommandsContainer
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter
+from matrix_multiplication.utils.compiled import CompiledMatrixMultiplication
+from .timing import measure
+
+Case = typing.Dict[str, object]
+
+
+def granularity_options(granularity: str) -> typing.Dict[str, object]:
+    """Converts granularity specification ("cell" or "block:<tile size>") to container options
+    """
+    name, _, tile_size = granularity.partition(":")
+    options = {"granularity": name}
+    if tile_size:
+        options["tile_size"] = int(tile_size)
+    return options
+
+
+def random_chain(size: int, length: int) -> typing.List[NDArrayMatrixAdapter]:
+    return [NDArrayMatrixAdapter(matrix=numpy.random.rand(size, size)) for _ in range(length)]
+
+
+def build_container(pool: multiprocessing.Pool, options: typing.Dict[str, object]) -> MatrixMultiplicationCommandsContainer:
+    container = MatrixMultiplicationCommandsContainer()
+    container.config.from_dict(options)
+    container.pool.override(pool)
+    return container
+
+
+def benchmark_entry_point(pool: multiprocessing.Pool, size: int, length: int, options: typing.Dict[str, object],
+                          repeat: int) -> typing.Dict[str, float]:
+    """Times planning and multiplication of the whole chain through the compiled commands the utils entry point uses,
+    so the dispatch overhead of the entry point is included
+    """
+    compiled = CompiledMatrixMultiplication(container=build_container(pool=pool, options=options))
+    matrices = random_chain(size=size, length=length)
+    return measure(function=lambda: compiled.multiply(pool=pool, matrices=matrices), repeat=repeat)
+
+
+def benchmark_stages(pool: multiprocessing.Pool, size: int, options: typing.Dict[str, object],
+                     repeat: int) -> typing.Dict[str, typing.Dict[str, float]]:
+    """Times the whole matrix pair multiplication and each of its stages separately
+    """
+    container = build_container(pool=pool, options=options)
+    matrix1, matrix2 = random_chain(size=size, length=2)
+    multiply_matrix_pair = container.multiply_matrix_pair()
+    build_tasks = container.build_tasks()
+    task_processor = container.task_processor()
+    aggregate_result = container.aggregate_result()
+    tasks = list(build_tasks(matrix1=matrix1, matrix2=matrix2))
+    results = list(task_processor(tasks=tasks))
+    shape = (matrix1.column_len(), matrix2.row_len())
+    return {
+        "multiply_matrix_pair": measure(function=lambda: multiply_matrix_pair(matrix1=matrix1, matrix2=matrix2), repeat=repeat),
+        "build_tasks": measure(function=lambda: list(build_tasks(matrix1=matrix1, matrix2=matrix2)), repeat=repeat),
+        "process_tasks": measure(function=lambda: list(task_processor(tasks=tasks)), repeat=repeat),
+        "aggregate_result": measure(function=lambda: aggregate_result(shape=shape, results=results), repeat=repeat),
+    }
+
+
+def run_benchmarks(sizes: typing.Iterable[int], lengths: typing.Iterable[int], workers: typing.Iterable[int],
+                   granularities: typing.Iterable[str], max_cell_size: int, repeat: int,
+                   processings: typing.Iterable[str] = ("streaming",)) -> typing.List[Case]:
+    """Runs every combination of the parameters and returns the list of timed cases
+
+    Each processing ("batch", "streaming" or "threads") is run with the same number of workers,
+    processes of the pool or threads of the current process
+    """
+    cases = list()
+    for worker_count in workers:
+        with multiprocessing.Pool(processes=worker_count) as pool:
+            for granularity, processing in itertools.product(granularities, processings):
+                options = {**granularity_options(granularity=granularity), "processing": processing, "threads": worker_count}
+                for size in sizes:
+                    if options["granularity"] == "cell" and size > max_cell_size:
+                        continue
+                    params = {"size": size, "workers": worker_count, "granularity": granularity, "processing": processing}
+                    for stage, timing in benchmark_stages(pool=pool, size=size, options=options, repeat=repeat).items():
+                        cases.append({"name": stage, "params": params, **timing})
+                    for length in lengths:
+                        timing = benchmark_entry_point(pool=pool, size=size, length=length, options=options, repeat=repeat)
+                        cases.append({"name": "multiprocess_matrices_multiplication",
+                                      "params": {**params, "length": length}, **timing})
+    return cases
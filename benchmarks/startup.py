@@ -0,0 +1,50 @@
+"""Module with benchmark cases for the startup of the interpreters importing the package and of spawned workers
+"""
+from __future__ import annotations
+import subprocess
+import sys
+import typing
+
+from .timing import measure
+
+Case = typing.Dict[str, object]
+
+_SPAWN_WORKERS_SCRIPT = """
+import multiprocessing
+import numpy
+from matrix_multiplication.commands.matrix_multiplication import CalculateBlock
+
+task = CalculateBlock(rows=numpy.ones((8, 8)), columns=numpy.ones((8, 8)))
+with multiprocessing.get_context("spawn").Pool(processes={workers}) as pool:
+    for result in [pool.apply_async(task) for _ in range({workers})]:
+        result.get()
+"""
+
+
+def benchmark_import(module: str, repeat: int) -> typing.Dict[str, float]:
+    """Times a fresh interpreter importing the module, the empty module name times the bare interpreter
+    """
+    command = [sys.executable, "-c", f"import {module}" if module else "pass"]
+    return measure(function=lambda: subprocess.run(command, check=True), repeat=repeat)
+
+
+def benchmark_spawn_workers(workers: int, repeat: int) -> typing.Dict[str, float]:
+    """Times a fresh interpreter starting the pool of spawned workers, each of them unpickling and running one tile task
+
+    The pool is started by a fresh interpreter, otherwise the workers would import the main module of the benchmarks
+    """
+    command = [sys.executable, "-c", _SPAWN_WORKERS_SCRIPT.format(workers=workers)]
+    return measure(function=lambda: subprocess.run(command, check=True), repeat=repeat)
+
+
+def run_startup_benchmarks(modules: typing.Iterable[str], workers: typing.Iterable[int],
+                           repeat: int) -> typing.List[Case]:
+    """Runs the import and the spawned workers benchmarks and returns the list of timed cases
+    """
+    cases = list()
+    for module in modules:
+        cases.append({"name": "import", "params": {"module": module}, **benchmark_import(module=module, repeat=repeat)})
+    for worker_count in workers:
+        cases.append({"name": "spawn_workers", "params": {"workers": worker_count},
+                      **benchmark_spawn_workers(workers=worker_count, repeat=repeat)})
+    return cases
@@ -0,0 +1,22 @@
+"""Module with helpers for timing benchmark cases
+"""
+from __future__ import annotations
+import statistics
+import time
+import typing
+
+
+def measure(function: typing.Callable[[], object], repeat: int = 5, warmup: int = 1) -> typing.Dict[str, float]:
+    """Calls the function ``warmup + repeat`` times and returns statistics of the last ``repeat`` wall times
+
+    Returns:
+        Dict[str, float]: minimal, median and maximal wall time in seconds
+    """
+    for _ in range(warmup):
+        function()
+    times = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return {"min": min(times), "median": statistics.median(times), "max": max(times)}
@@ -1,3 +1,37 @@
-from matrix_multiplication.utils import multiprocess_matrices_multiplication
+"""Parallel matrix multiplication
 
-__all__ = ["multiprocess_matrices_multiplication"]
+The public functions are imported on first access, so the processes which only unpickle tasks and kernels
+(spawned workers) do not import the containers and their dependencies
+"""
+from __future__ import annotations
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from matrix_multiplication.utils import (
+        multiprocess_matrices_multiplication, multiprocess_matrices_batch_multiplication,
+        async_multiprocess_matrices_multiplication, MatrixMultiplicationEngine, CompiledMatrixMultiplication)
+
+# public names and the modules they are defined in
+_LAZY_ATTRIBUTES = {
+    "multiprocess_matrices_multiplication": "matrix_multiplication.utils.matrix_multiplication",
+    "multiprocess_matrices_batch_multiplication": "matrix_multiplication.utils.matrix_multiplication",
+    "async_multiprocess_matrices_multiplication": "matrix_multiplication.utils.matrix_multiplication",
+    "MatrixMultiplicationEngine": "matrix_multiplication.utils.engine",
+    "CompiledMatrixMultiplication": "matrix_multiplication.utils.compiled",
+}
+
+__all__ = ["multiprocess_matrices_multiplication", "multiprocess_matrices_batch_multiplication", "async_multiprocess_matrices_multiplication", "MatrixMultiplicationEngine", "CompiledMatrixMultiplication"]
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    # the next access does not get here
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,22 @@
+"""Module with abstract classes required for computational kernels
+"""
+from __future__ import annotations
+import abc
+from typing import Any
+
+
+class ABCKernel(abc.ABC):
+    """Computes the product of the left and the right operands
+
+    A pair of vectors (row and column) produces a scalar,
+    a pair of blocks (row block and column block) produces a matrix tile
+    """
+    @abc.abstractmethod
+    def __call__(self, left: Any, right: Any) -> Any:
+        pass
+
+    def accumulating(self) -> ABCKernel:
+        """Returns the kernel keeping the products in the accumulation type of its precision,
+        so they could be summed up further before they are converted to the output type
+        """
+        return self
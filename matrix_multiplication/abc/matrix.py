@@ -13,6 +13,12 @@ class LeftMultipliableMatrix(abc.ABC):
     def get_row(self, index: int) -> Iterable[float]:
         pass
 
+    @abc.abstractmethod
+    def get_row_block(self, start: int, stop: int) -> Iterable[Iterable[float]]:
+        """Returns the rows from ``start`` up to ``stop`` as a two-dimensional block
+        """
+        pass
+
     @abc.abstractmethod
     def column_len(self) -> int:
         pass
@@ -25,12 +31,35 @@ class RightMultipliableMatrix(abc.ABC):
     def get_column(self, index: int) -> Iterable[float]:
         pass
 
+    @abc.abstractmethod
+    def get_column_block(self, start: int, stop: int) -> Iterable[Iterable[float]]:
+        """Returns the columns from ``start`` up to ``stop`` as a two-dimensional block, one column per block column
+        """
+        pass
+
+    @abc.abstractmethod
+    def row_len(self) -> int:
+        pass
+
+
+class ABCMatrixShape(abc.ABC):
+    """Shape descriptor of the matrix, everything required to plan the multiplication without reading the matrix data
+    """
+    @abc.abstractmethod
+    def column_len(self) -> int:
+        pass
+
     @abc.abstractmethod
     def row_len(self) -> int:
         pass
 
+    def itemsize(self) -> int:
+        """Returns the number of bytes per element, double precision unless the matrix tells otherwise
+        """
+        return 8
+
 
-class ABCMatrix(LeftMultipliableMatrix, RightMultipliableMatrix):
+class ABCMatrix(LeftMultipliableMatrix, RightMultipliableMatrix, ABCMatrixShape):
     """Matrix abstract class
     """
 
@@ -40,6 +69,10 @@ class ABCMutableMatrix(ABCMatrix):
     def append(self, row: List[float]) -> None:
         pass
 
+    @abc.abstractmethod
+    def extend(self, rows: Iterable[List[float]]) -> None:
+        pass
+
     @abc.abstractmethod
     def reshape(self, new_shape: Tuple[int, int]) -> None:
         pass
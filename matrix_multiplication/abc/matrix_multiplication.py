@@ -2,34 +2,48 @@
 """
 from __future__ import annotations
 import abc
-from typing import Iterable, List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 from .matrix import (
     ABCMatrix, LeftMultipliableMatrix, RightMultipliableMatrix)
+from .kernel import ABCKernel
+from .storage import ABCArrayReference
 from .task import Task
 
 
 class ABCCalculateCell(Task):
     @abc.abstractmethod
-    def __init__(self, row: Iterable[float], column: Iterable[float]) -> None:
+    def __init__(self, row: Iterable[float], column: Iterable[float], kernel: ABCKernel = None) -> None:
+        pass
+
+
+class ABCCalculateBlock(Task):
+    @abc.abstractmethod
+    def __init__(self, rows: Iterable[Iterable[float]], columns: Iterable[Iterable[float]], kernel: ABCKernel = None) -> None:
         pass
 
 
 class ABCBuildTasks(abc.ABC):
     @abc.abstractmethod
-    def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> List[Task]:
+    def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> Iterator[Task]:
+        pass
+
+
+class ABCBuildSharedTasks(abc.ABC):
+    @abc.abstractmethod
+    def __call__(self, matrix1: ABCArrayReference, matrix2: ABCArrayReference, result: ABCArrayReference) -> Iterator[Task]:
         pass
 
 
 class ABCAggregateResult(abc.ABC):
     @abc.abstractmethod
-    def __call__(self, shape: Tuple[int, int], results: List[float]) -> ABCMatrix:
+    def __call__(self, shape: Tuple[int, int], results: Iterable[float]) -> ABCMatrix:
         pass
 
 
 class ABCTaskManager(abc.ABC):
     @abc.abstractmethod
-    def build_tasks(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> List[ABCCalculateCell]:
+    def build_tasks(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> Iterator[Task]:
         pass
 
     @abc.abstractmethod
@@ -37,12 +51,62 @@ class ABCTaskManager(abc.ABC):
         pass
 
 
+class ABCBuildBatchTasks(abc.ABC):
+    @abc.abstractmethod
+    def __call__(self, chains: Iterable[List[ABCMatrix]]) -> Iterator[Task]:
+        pass
+
+
+class ABCMultiplyMatrixBatch(abc.ABC):
+    @abc.abstractmethod
+    def __call__(self, chains: Iterable[List[ABCMatrix]]) -> List[ABCMatrix]:
+        pass
+
+
 class ABCMultiplyMatrixPair:
     @abc.abstractmethod
     def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
         pass
 
 
+class ABCAsyncMultiplyMatrixPair(abc.ABC):
+    @abc.abstractmethod
+    async def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        pass
+
+
+class ABCMultiplicationPlan(abc.ABC):
+    """Node of the matrix chain multiplication plan tree
+    """
+    @abc.abstractmethod
+    def shape(self) -> Tuple[int, int]:
+        pass
+
+    @abc.abstractmethod
+    def cost(self) -> int:
+        """Estimated number of floating point operations required to evaluate the node
+        """
+        pass
+
+
+class ABCPlanMatrixChain(abc.ABC):
+    @abc.abstractmethod
+    def __call__(self, shapes: List[Tuple[int, int]]) -> ABCMultiplicationPlan:
+        pass
+
+
+class ABCExecutePlan(abc.ABC):
+    @abc.abstractmethod
+    def __call__(self, plan: ABCMultiplicationPlan, matrices: List[ABCMatrix]) -> ABCMatrix:
+        pass
+
+
+class ABCAsyncExecutePlan(abc.ABC):
+    @abc.abstractmethod
+    async def __call__(self, plan: ABCMultiplicationPlan, matrices: List[ABCMatrix]) -> ABCMatrix:
+        pass
+
+
 class ABCValidateMatrixPair:
     @abc.abstractmethod
     def __call__(self, matrix1: ABCMatrix, matrix2: ABCMatrix) -> bool:
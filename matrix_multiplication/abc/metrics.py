@@ -0,0 +1,27 @@
+"""Module with abstract classes required for pipeline instrumentation
+"""
+from __future__ import annotations
+import abc
+
+
+class ABCMetrics(abc.ABC):
+    """Receives timings of the pipeline stages and of the tasks processed by the workers
+
+    Commands check :attr:`enabled` once per call and skip all the measurements if it is False
+    """
+    @property
+    @abc.abstractmethod
+    def enabled(self) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def record_stage(self, name: str, start: float, duration: float, **attributes) -> None:
+        """Records wall time (seconds since the epoch and seconds) of the pipeline stage
+        """
+        pass
+
+    @abc.abstractmethod
+    def record_task(self, name: str, worker: int, submitted: float, started: float, finished: float, size: int) -> None:
+        """Records the task timestamps (seconds since the epoch) and the number of bytes the task is serialized to
+        """
+        pass
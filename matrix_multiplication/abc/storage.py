@@ -0,0 +1,20 @@
+"""Module with abstract classes required for the storages of matrix data shared with the workers
+"""
+from __future__ import annotations
+import abc
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy
+
+
+class ABCArrayReference(abc.ABC):
+    """Lightweight picklable reference to the array data which could be opened by any worker
+    """
+    @abc.abstractmethod
+    def open(self) -> numpy.ndarray:
+        pass
+
+    @abc.abstractmethod
+    def shape(self) -> typing.Tuple[int, int]:
+        pass
@@ -15,3 +15,9 @@ class TaskProcessor(abc.ABC):
     @abc.abstractmethod
     def __call__(self) -> typing.Iterable:
         pass
+
+
+class AsyncTaskProcessor(abc.ABC):
+    @abc.abstractmethod
+    async def __call__(self) -> typing.Iterable:
+        pass
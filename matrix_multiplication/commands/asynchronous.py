@@ -0,0 +1,65 @@
+"""Module for concrete implementations of classes required to multiply matrix sequence from asyncio code
+"""
+from __future__ import annotations
+import asyncio
+import logging
+from typing import Iterable, List
+
+from matrix_multiplication.abc.matrix import ABCMatrix, LeftMultipliableMatrix, RightMultipliableMatrix
+from matrix_multiplication.abc.task import AsyncTaskProcessor
+from matrix_multiplication.abc.matrix_multiplication import (
+    ABCAsyncExecutePlan, ABCAsyncMultiplyMatrixPair, ABCMultiplicationPlan, ABCPlanMatrixChain, ABCTaskManager)
+from matrix_multiplication.commands.planning import LeafPlan
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMultiplyMatrixPair(ABCAsyncMultiplyMatrixPair):
+    """Multiplies two matrices awaiting the task results
+    """
+    __slots__ = ("_task_manager", "_task_processor")
+
+    def __init__(self, task_manager: ABCTaskManager, task_processor: AsyncTaskProcessor) -> None:
+        self._task_manager = task_manager
+        self._task_processor = task_processor
+
+    async def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        tasks = self._task_manager.build_tasks(
+            matrix1=matrix1, matrix2=matrix2)
+        results = await self._task_processor(tasks=tasks)
+        shape = (matrix1.column_len(), matrix2.row_len())
+        return self._task_manager.handle_results(shape=shape, results=results)
+
+
+class AsyncExecutePlan(ABCAsyncExecutePlan):
+    """Executes multiplication plan awaiting independent sub-products at the same time
+    """
+    __slots__ = ("_multiply_matrix_pair",)
+
+    def __init__(self, multiply_matrix_pair: ABCAsyncMultiplyMatrixPair) -> None:
+        self._multiply_matrix_pair = multiply_matrix_pair
+
+    async def __call__(self, plan: ABCMultiplicationPlan, matrices: List[ABCMatrix]) -> ABCMatrix:
+        if isinstance(plan, LeafPlan):
+            return matrices[plan.index]
+        matrix1, matrix2 = await asyncio.gather(
+            self(plan=plan.left, matrices=matrices), self(plan=plan.right, matrices=matrices))
+        return await self._multiply_matrix_pair(matrix1=matrix1, matrix2=matrix2)
+
+
+class AsyncMultiplyMatrixSequence(object):
+    """Multiplies matrix sequence in the order of the plan tree awaiting the sub-products
+    """
+    __slots__ = ("_plan_matrix_chain", "_execute_plan")
+
+    def __init__(self, plan_matrix_chain: ABCPlanMatrixChain, execute_plan: ABCAsyncExecutePlan) -> None:
+        self._plan_matrix_chain = plan_matrix_chain
+        self._execute_plan = execute_plan
+
+    async def __call__(self, matrices: Iterable[ABCMatrix], plan: ABCMultiplicationPlan = None) -> ABCMatrix:
+        matrices = list(matrices)
+        if plan is not None:
+            return await self._execute_plan(plan=plan, matrices=matrices)
+        plan = self._plan_matrix_chain(shapes=[(matrix.column_len(), matrix.row_len()) for matrix in matrices])
+        logger.debug("multiplying matrix chain as %r, estimated cost is %d flops", plan, plan.cost())
+        return await self._execute_plan(plan=plan, matrices=matrices)
@@ -0,0 +1,103 @@
+"""Module for concrete implementations of classes required to multiply many independent matrix chains at once
+"""
+from __future__ import annotations
+import functools
+from typing import Iterable, Iterator, List
+
+import numpy as np
+
+from matrix_multiplication.abc.kernel import ABCKernel
+from matrix_multiplication.abc.matrix import ABCMatrix
+from matrix_multiplication.abc.matrix_multiplication import ABCBuildBatchTasks, ABCMultiplyMatrixBatch
+from matrix_multiplication.abc.task import Task, TaskProcessor
+from matrix_multiplication.commands.planning import product_cost
+from matrix_multiplication.kernel import BLASKernel, Precision
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter
+
+
+class MultiplyChainBatch(Task):
+    """Multiplies each chain of the batch from left to right inside a single worker task
+    """
+    __slots__ = ("_chains", "_kernel")
+
+    def __init__(self, chains: List[List[np.ndarray]], kernel: ABCKernel = None) -> None:
+        self._chains = chains
+        self._kernel = kernel if kernel is not None else BLASKernel()
+
+    def __call__(self) -> List[np.ndarray]:
+        """This command calculates the products of the chains of the batch
+
+        Returns:
+            List[np.ndarray]: chain products in the order of the chains
+        """
+
+        return [functools.reduce(self._kernel, chain) for chain in self._chains]
+
+
+class BuildBatchTasks(ABCBuildBatchTasks):
+    """Lazily packs the chains into batch tasks
+
+    The chains are packed in their order until the estimated cost of the batch reaches ``batch_cost``,
+    so many small products share one round trip to the workers, while a large chain gets a task of its own.
+    The cost of the chain is the number of operations of its left to right evaluation plus the number of
+    its elements sent to the worker. The chains are sent in the compute type of the precision,
+    a chain of one matrix is its own product, so it is sent as a copy in the output type of the precision
+    """
+    __slots__ = ("_batch_cost", "_kernel", "_precision")
+
+    def __init__(self, batch_cost: int = 1 << 22, kernel: ABCKernel = None, precision: Precision = None) -> None:
+        if batch_cost < 1:
+            raise ValueError("batch cost must be positive")
+        self._batch_cost = batch_cost
+        self._kernel = kernel
+        self._precision = precision if precision is not None else Precision()
+
+    def __call__(self, chains: Iterable[List[ABCMatrix]]) -> Iterator[Task]:
+        batch, cost = list(), 0
+        for chain in chains:
+            arrays = [self._astype(array=np.asarray(matrix.get_row_block(0, matrix.column_len()))) for matrix in chain]
+            if len(arrays) == 1:
+                # the product never reaches the kernel, and the caller keeps the matrix of the chain
+                arrays = [np.array(arrays[0], dtype=self._precision.product_dtype(arrays[0].dtype))]
+            chain_cost = self._cost(arrays=arrays)
+            if batch and cost + chain_cost > self._batch_cost:
+                yield self._create_task(chains=batch)
+                batch, cost = list(), 0
+            batch.append(arrays)
+            cost += chain_cost
+        if batch:
+            yield self._create_task(chains=batch)
+
+    @staticmethod
+    def _cost(arrays: List[np.ndarray]) -> int:
+        cost, shape = sum(array.size for array in arrays), arrays[0].shape
+        for array in arrays[1:]:
+            cost += product_cost(shape1=shape, shape2=array.shape)
+            shape = (shape[0], array.shape[1])
+        return cost
+
+    def _astype(self, array: np.ndarray) -> np.ndarray:
+        return array.astype(self._precision.operand_dtype(dtype=array.dtype), copy=False)
+
+    def _create_task(self, chains: List[List[np.ndarray]]) -> Task:
+        return MultiplyChainBatch(chains=chains, kernel=self._kernel)
+
+
+class MultiplyMatrixBatch(ABCMultiplyMatrixBatch):
+    """Multiplies many independent matrix chains, a pair is a chain of two matrices
+
+    Products are returned in the order of the chains.
+    If ``ordered`` is False, the task processor is expected to yield ``(index, products)`` pairs in any order
+    """
+    __slots__ = ("_build_tasks", "_task_processor", "_ordered")
+
+    def __init__(self, build_tasks: ABCBuildBatchTasks, task_processor: TaskProcessor, ordered: bool = True) -> None:
+        self._build_tasks = build_tasks
+        self._task_processor = task_processor
+        self._ordered = ordered
+
+    def __call__(self, chains: Iterable[List[ABCMatrix]]) -> List[ABCMatrix]:
+        results = self._task_processor(tasks=self._build_tasks(chains=chains))
+        batches = dict(enumerate(results) if self._ordered else results)
+        return [NDArrayMatrixAdapter(matrix=product, owned=True)
+                for index in range(len(batches)) for product in batches[index]]
@@ -0,0 +1,154 @@
+"""Module for concrete implementations of classes required to cache matrix products
+"""
+from __future__ import annotations
+import collections
+import hashlib
+import threading
+from typing import Optional
+
+import numpy as np
+
+from matrix_multiplication.abc.matrix import ABCMatrix, LeftMultipliableMatrix, RightMultipliableMatrix
+from matrix_multiplication.abc.matrix_multiplication import ABCAsyncMultiplyMatrixPair, ABCMultiplyMatrixPair
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+from matrix_multiplication.matrix.mapped import MemmapMatrixAdapter
+from matrix_multiplication.matrix.sparse import SparseMatrixAdapter
+
+# operands which are not read into memory as dense arrays to be hashed
+_UNCACHED_TYPES = (SparseMatrixAdapter, MemmapMatrixAdapter)
+
+
+class ProductCache(object):
+    """Thread-safe LRU cache of matrix products bounded by the total size of the cached matrices in bytes
+    """
+    __slots__ = ("_max_bytes", "_entries", "_size", "_hits", "_misses", "_lock")
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024) -> None:
+        if max_bytes < 0:
+            raise ValueError("cache size must not be negative")
+        self._max_bytes = max_bytes
+        self._entries: collections.OrderedDict[bytes, np.ndarray] = collections.OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached matrices in bytes
+        """
+        return self._size
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        with self._lock:
+            matrix = self._entries.get(key)
+            if matrix is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return matrix
+
+    def put(self, key: bytes, matrix: np.ndarray) -> None:
+        if matrix.nbytes > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.nbytes
+            self._entries[key] = matrix
+            self._size += matrix.nbytes
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+def content_hash(matrix: np.ndarray) -> bytes:
+    """Hashes the matrix content along with its shape and dtype
+    """
+    matrix = np.ascontiguousarray(matrix)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(matrix.dtype.str.encode())
+    digest.update(np.asarray(matrix.shape, dtype=np.int64).tobytes())
+    digest.update(matrix.reshape(-1).view(np.uint8))
+    return digest.digest()
+
+
+class _CacheProducts(object):
+    """Looks the products up in the cache keyed by the content hashes of the operands
+    """
+    __slots__ = ()
+
+    @staticmethod
+    def _key(matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> Optional[bytes]:
+        # None for the operands multiplied without the cache
+        if isinstance(matrix1, _UNCACHED_TYPES) or isinstance(matrix2, _UNCACHED_TYPES):
+            return None
+        return content_hash(matrix=to_ndarray(matrix=matrix1)) + content_hash(matrix=to_ndarray(matrix=matrix2))
+
+    def _get(self, key: bytes) -> Optional[ABCMatrix]:
+        product = self._cache.get(key=key)
+        return NDArrayMatrixAdapter(matrix=product) if product is not None else None
+
+    def _put(self, key: bytes, matrix: ABCMatrix) -> ABCMatrix:
+        if not isinstance(matrix, NDArrayMatrixAdapter):
+            return matrix
+        product = np.array(to_ndarray(matrix=matrix))
+        product.setflags(write=False)
+        self._cache.put(key=key, matrix=product)
+        return NDArrayMatrixAdapter(matrix=product)
+
+
+class CachedMultiplyMatrixPair(_CacheProducts, ABCMultiplyMatrixPair):
+    """Decorates matrix pair multiplication with the cache keyed by the content hashes of the operands
+
+    Cached products are read-only, each call returns its own adapter of the cached matrix.
+    Only dense in-memory products are cached: sparse and memory-mapped operands are multiplied without the cache,
+    so they are never densified nor loaded into memory, and products of other types are returned as they are
+    """
+    __slots__ = ("_multiply_matrix_pair", "_cache")
+
+    def __init__(self, multiply_matrix_pair: ABCMultiplyMatrixPair, cache: ProductCache) -> None:
+        self._multiply_matrix_pair = multiply_matrix_pair
+        self._cache = cache
+
+    def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        key = self._key(matrix1=matrix1, matrix2=matrix2)
+        if key is None:
+            return self._multiply_matrix_pair(matrix1=matrix1, matrix2=matrix2)
+        product = self._get(key=key)
+        if product is not None:
+            return product
+        return self._put(key=key, matrix=self._multiply_matrix_pair(matrix1=matrix1, matrix2=matrix2))
+
+
+class AsyncCachedMultiplyMatrixPair(_CacheProducts, ABCAsyncMultiplyMatrixPair):
+    """Awaitable counterpart of :class:`CachedMultiplyMatrixPair`, the cache could be shared with it
+    """
+    __slots__ = ("_multiply_matrix_pair", "_cache")
+
+    def __init__(self, multiply_matrix_pair: ABCAsyncMultiplyMatrixPair, cache: ProductCache) -> None:
+        self._multiply_matrix_pair = multiply_matrix_pair
+        self._cache = cache
+
+    async def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        key = self._key(matrix1=matrix1, matrix2=matrix2)
+        if key is None:
+            return await self._multiply_matrix_pair(matrix1=matrix1, matrix2=matrix2)
+        product = self._get(key=key)
+        if product is not None:
+            return product
+        return self._put(key=key, matrix=await self._multiply_matrix_pair(matrix1=matrix1, matrix2=matrix2))
@@ -0,0 +1,219 @@
+"""Module for concrete implementations of classes required to choose the way each matrix product is evaluated
+"""
+from __future__ import annotations
+import concurrent.futures
+import json
+import logging
+import math
+import multiprocessing
+import os
+import time
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from matrix_multiplication.abc.kernel import ABCKernel
+from matrix_multiplication.abc.matrix import ABCMatrix, ABCMatrixShape, LeftMultipliableMatrix, RightMultipliableMatrix
+from matrix_multiplication.abc.matrix_multiplication import ABCMultiplyMatrixPair
+from matrix_multiplication.abc.metrics import ABCMetrics
+from matrix_multiplication.abc.task import TaskProcessor
+from matrix_multiplication.commands.matrix_multiplication import (
+    AggregateBlockResult, BuildBlockTasks, MultiplyMatrixPair, TaskManager)
+from matrix_multiplication.commands.planning import product_cost
+from matrix_multiplication.kernel import BLASKernel
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter
+from matrix_multiplication.metrics import NullMetrics
+from matrix_multiplication.task import ThreadPoolTaskProcessor
+
+logger = logging.getLogger(__name__)
+
+# execution modes of the matrix product
+INLINE, THREADS, PROCESSES = "inline", "threads", "processes"
+
+
+class CostModel(object):
+    """Estimates the time of the matrix product evaluated inline, by a pool of threads or by a pool of processes
+
+    Each mode is described by its throughput in floating point operations per second and its fixed dispatch overhead
+    in seconds, the data sent to the processes is additionally charged by the transfer rate in bytes per second.
+    If the product is sent to the processes in ``tile_size`` tiles, each task carries its own row and column blocks,
+    so the first matrix is sent once per column of tiles and the second one once per row of tiles
+    """
+    __slots__ = ("inline_rate", "thread_rate", "process_rate", "thread_overhead", "process_overhead", "transfer_rate")
+
+    def __init__(self, inline_rate: float = 1e9, thread_rate: float = 2e9, process_rate: float = 4e9,
+                 thread_overhead: float = 1e-4, process_overhead: float = 1e-3, transfer_rate: float = 1e9) -> None:
+        self.inline_rate = inline_rate
+        self.thread_rate = thread_rate
+        self.process_rate = process_rate
+        self.thread_overhead = thread_overhead
+        self.process_overhead = process_overhead
+        self.transfer_rate = transfer_rate
+
+    def estimate(self, shape1: Tuple[int, int], shape2: Tuple[int, int], mode: str, itemsize: int = 8,
+                 tile_size: int = None) -> float:
+        flops = product_cost(shape1=shape1, shape2=shape2)
+        if mode == INLINE:
+            return flops / self.inline_rate
+        if mode == THREADS:
+            return self.thread_overhead + flops / self.thread_rate
+        if mode == PROCESSES:
+            # the operands are sent to the workers and the result is sent back
+            row_tiles, column_tiles = 1, 1
+            if tile_size is not None:
+                row_tiles, column_tiles = -(-shape1[0] // tile_size), -(-shape2[1] // tile_size)
+            size = itemsize * (column_tiles * shape1[0] * shape1[1] + row_tiles * shape2[0] * shape2[1]
+                               + shape1[0] * shape2[1])
+            return self.process_overhead + size / self.transfer_rate + flops / self.process_rate
+        raise ValueError(f"unknown execution mode {mode!r}")
+
+    def choose(self, shape1: Tuple[int, int], shape2: Tuple[int, int], itemsize: int = 8, tile_size: int = None) -> str:
+        """Returns the execution mode with the least estimated time
+        """
+        return min((INLINE, THREADS, PROCESSES), key=lambda mode: self.estimate(
+            shape1=shape1, shape2=shape2, mode=mode, itemsize=itemsize, tile_size=tile_size))
+
+    def to_dict(self) -> Dict[str, float]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, parameters: Dict[str, float]) -> CostModel:
+        return cls(**{name: float(value) for name, value in parameters.items() if name in cls.__slots__})
+
+    def save(self, path: str) -> None:
+        with open(path, mode="w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> CostModel:
+        with open(path, mode="r") as file:
+            return cls.from_dict(json.load(file))
+
+
+def _itemsize(matrix: object) -> int:
+    return matrix.itemsize() if isinstance(matrix, ABCMatrixShape) else 8
+
+
+def _noop(*args) -> None:
+    pass
+
+
+def _calibration_product(size: int) -> None:
+    # the operands are made by the worker, so only the product is measured
+    np.matmul(np.ones(shape=(size, size)), np.ones(shape=(size, size)))
+
+
+def _best_time(function: Callable[[], object], repeat: int) -> float:
+    times = list()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return max(min(times), 1e-9)
+
+
+def pool_size(pool: multiprocessing.Pool, processes: int = None) -> int:
+    """Returns the given number of processes or the number of the workers of the pool if None
+    """
+    if processes is not None:
+        return processes
+    return getattr(pool, "_processes", None) or os.cpu_count()
+
+
+def calibrate_cost_model(pool: multiprocessing.Pool, processes: int = None, threads: int = None, size: int = 256,
+                         repeat: int = 5) -> CostModel:
+    """Measures the throughput and the overheads of each execution mode with a micro-benchmark
+
+    The throughputs are measured running one product per worker at once, so they account for the contention
+    of the workers (and of the threads of BLAS) for the cores
+    """
+    processes = pool_size(pool=pool, processes=processes)
+    threads = threads if threads is not None else os.cpu_count()
+    flops = product_cost(shape1=(size, size), shape2=(size, size))
+    inline_time = _best_time(lambda: _calibration_product(size), repeat=repeat)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        thread_overhead = _best_time(lambda: executor.submit(_noop).result(), repeat=repeat)
+        thread_time = _best_time(lambda: list(executor.map(_calibration_product, [size] * threads)), repeat=repeat)
+    process_overhead = _best_time(lambda: pool.apply(_noop), repeat=repeat)
+    process_time = _best_time(lambda: [result.get() for result in [
+        pool.apply_async(_calibration_product, (size,)) for _ in range(processes)]], repeat=repeat)
+    payload = np.zeros(shape=1 << 17)
+    transfer_time = _best_time(lambda: pool.apply(_noop, (payload,)), repeat=repeat)
+    model = CostModel(
+        inline_rate=flops / inline_time, thread_rate=threads * flops / thread_time,
+        process_rate=processes * flops / process_time, thread_overhead=thread_overhead,
+        process_overhead=process_overhead, transfer_rate=payload.nbytes / max(transfer_time - process_overhead, 1e-9))
+    logger.debug("calibrated cost model %r", model.to_dict())
+    return model
+
+
+def load_cost_model(pool: multiprocessing.Pool, path: str = None, processes: int = None,
+                    threads: int = None) -> CostModel:
+    """Loads the cost model saved at the given path, the model is calibrated and saved there if it does not exist yet
+    """
+    if path is not None and os.path.exists(path):
+        return CostModel.load(path=path)
+    model = calibrate_cost_model(pool=pool, processes=processes, threads=threads)
+    if path is not None:
+        model.save(path=path)
+    return model
+
+
+class AdaptiveMultiplyMatrixPair(ABCMultiplyMatrixPair):
+    """Multiplies two matrices inline, by a pool of threads or by a pool of processes,
+    whichever is the fastest for the shapes of the matrices according to the cost model
+
+    The pools get tile tasks, the tile size is chosen so that each worker gets about ``tasks_per_worker`` tasks.
+    ``thread_task_processor`` must yield the results in task order, it should be kept for the whole life of the command,
+    a pool of ``threads`` threads is started for each product if it is not given
+    """
+    __slots__ = ("_cost_model", "_task_processor", "_thread_task_processor", "_processes", "_threads", "_kernel",
+                 "_tasks_per_worker", "_ordered", "_metrics")
+
+    def __init__(self, cost_model: CostModel, task_processor: TaskProcessor, processes: int = None, threads: int = None,
+                 kernel: ABCKernel = None, tasks_per_worker: int = 4, ordered: bool = True,
+                 metrics: ABCMetrics = None, thread_task_processor: TaskProcessor = None) -> None:
+        self._cost_model = cost_model
+        self._task_processor = task_processor
+        self._processes = processes if processes is not None else os.cpu_count()
+        self._threads = threads if threads is not None else os.cpu_count()
+        self._kernel = kernel if kernel is not None else BLASKernel()
+        self._tasks_per_worker = tasks_per_worker
+        self._ordered = ordered
+        self._metrics = metrics if metrics is not None else NullMetrics()
+        self._thread_task_processor = thread_task_processor if thread_task_processor is not None else \
+            ThreadPoolTaskProcessor(max_workers=self._threads, metrics=self._metrics)
+
+    def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        shape1, shape2 = (matrix1.column_len(), matrix1.row_len()), (matrix2.column_len(), matrix2.row_len())
+        mode = self._cost_model.choose(
+            shape1=shape1, shape2=shape2, itemsize=max(_itemsize(matrix=matrix1), _itemsize(matrix=matrix2)),
+            tile_size=self._tile_size(shape=(shape1[0], shape2[1]), workers=self._processes))
+        logger.debug("multiplying %s by %s %s", shape1, shape2, mode)
+        start, started = time.time(), time.perf_counter()
+        if mode == INLINE:
+            matrix = NDArrayMatrixAdapter(matrix=self._kernel(
+                np.asarray(matrix1.get_row_block(0, shape1[0])), np.asarray(matrix2.get_column_block(0, shape2[1]))),
+                owned=True)
+        elif mode == THREADS:
+            # kernels release the GIL, so the tiles are calculated by the threads in parallel
+            matrix = self._multiply(matrix1=matrix1, matrix2=matrix2, workers=self._threads,
+                                    task_processor=self._thread_task_processor, ordered=True)
+        else:
+            matrix = self._multiply(matrix1=matrix1, matrix2=matrix2, workers=self._processes,
+                                    task_processor=self._task_processor, ordered=self._ordered)
+        if self._metrics.enabled:
+            self._metrics.record_stage(name="multiply_matrix_pair", start=start, duration=time.perf_counter() - started,
+                                       shape=(shape1[0], shape2[1]), mode=mode)
+        return matrix
+
+    def _multiply(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix, workers: int,
+                  task_processor: TaskProcessor, ordered: bool) -> ABCMatrix:
+        tile_size = self._tile_size(shape=(matrix1.column_len(), matrix2.row_len()), workers=workers)
+        task_manager = TaskManager(build_tasks=BuildBlockTasks(tile_size=tile_size, kernel=self._kernel),
+                                   aggregate_result=AggregateBlockResult(tile_size=tile_size, ordered=ordered))
+        return MultiplyMatrixPair(task_manager=task_manager, task_processor=task_processor)(
+            matrix1=matrix1, matrix2=matrix2)
+
+    def _tile_size(self, shape: Tuple[int, int], workers: int) -> int:
+        return max(int(math.ceil(math.sqrt(shape[0] * shape[1] / (self._tasks_per_worker * workers)))), 1)
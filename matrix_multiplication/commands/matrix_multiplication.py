@@ -2,26 +2,39 @@
 """
 from __future__ import annotations
 import functools
-from typing import Iterable, List, Tuple
+import logging
+import time
+from typing import Iterable, Iterator, List, Tuple
 
 import numpy as np
 
 from matrix_multiplication.abc.matrix import (
     ABCMatrix, ABCMutableMatrix, LeftMultipliableMatrix, RightMultipliableMatrix)
-from matrix_multiplication.abc.task import TaskProcessor
+from matrix_multiplication.abc.kernel import ABCKernel
+from matrix_multiplication.abc.metrics import ABCMetrics
+from matrix_multiplication.abc.storage import ABCArrayReference
+from matrix_multiplication.abc.task import Task, TaskProcessor
 from matrix_multiplication.abc.matrix_multiplication import (
-    ABCCalculateCell, ABCBuildTasks, ABCAggregateResult, ABCTaskManager, ABCMultiplyMatrixPair, ABCValidateMatrixPair)
+    ABCCalculateCell, ABCCalculateBlock, ABCBuildTasks, ABCBuildSharedTasks, ABCAggregateResult, ABCTaskManager,
+    ABCMultiplyMatrixPair, ABCMultiplicationPlan, ABCPlanMatrixChain, ABCExecutePlan, ABCValidateMatrixPair)
+from matrix_multiplication.commands.scheduling import ExecutePlan
+from matrix_multiplication.kernel import NumpyKernel, BLASKernel, Precision
 from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter
+from matrix_multiplication.matrix.shared import SharedArray, SharedMatrixAdapter
+from matrix_multiplication.metrics import NullMetrics, TimedIterator
+
+logger = logging.getLogger(__name__)
 
 
 class CalculateCell(ABCCalculateCell):
     """Calculates the value of the cell based on the first matrix row and the second matrix column
     """
-    __slots__ = ("_row", "_column")
+    __slots__ = ("_row", "_column", "_kernel")
 
-    def __init__(self, row: Iterable[float], column: Iterable[float]) -> None:
+    def __init__(self, row: Iterable[float], column: Iterable[float], kernel: ABCKernel = None) -> None:
         self._row = row
         self._column = column
+        self._kernel = kernel if kernel is not None else NumpyKernel()
 
     def __call__(self) -> float:
         """This command calculates the value of the cell based on the first matrix row and the second matrix column
@@ -30,50 +43,207 @@ class CalculateCell(ABCCalculateCell):
             float: result matrix cell value
         """
 
-        cell_value = functools.reduce(
-            lambda previous_sum, value_pair: value_pair[0] * value_pair[1] + previous_sum, zip(self._row, self._column), 0)
-        return cell_value
+        return self._kernel(self._row, self._column)
+
+
+class CalculateBlock(ABCCalculateBlock):
+    """Calculates the values of the result matrix tile based on the first matrix row block and the second matrix column block
+    """
+    __slots__ = ("_rows", "_columns", "_kernel")
+
+    def __init__(self, rows: np.ndarray, columns: np.ndarray, kernel: ABCKernel = None) -> None:
+        self._rows = rows
+        self._columns = columns
+        self._kernel = kernel if kernel is not None else BLASKernel()
+
+    def __call__(self) -> np.ndarray:
+        """This command calculates the result matrix tile as a product of the row block and the column block
+
+        Returns:
+            np.ndarray: result matrix tile
+        """
+
+        return self._kernel(self._rows, self._columns)
 
 
 class BuildTasks(ABCBuildTasks):
-    """Builds list of matrix cell calculation tasks
+    """Lazily builds matrix cell calculation tasks
     """
-    __slots__ = tuple()
+    __slots__ = ("_kernel",)
 
-    def __init__(self) -> None:
-        pass
+    def __init__(self, kernel: ABCKernel = None) -> None:
+        self._kernel = kernel
 
-    def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> List[ABCCalculateCell]:
-        tasks = list()
+    def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> Iterator[ABCCalculateCell]:
+        # the operands are sliced once in bulk, the tasks take the rows and the columns of the blocks;
+        # the second operand is laid out by columns once, so each column is contiguous
+        rows = matrix1.get_row_block(0, matrix1.column_len())
+        columns = np.asfortranarray(matrix2.get_column_block(0, matrix2.row_len()))
         for row_index in range(0, matrix1.column_len()):
+            row = rows[row_index]
             for column_index in range(0, matrix2.row_len()):
-                row, column = matrix1.get_row(row_index), matrix2.get_column(column_index)
-                task = self._create_task(row=row, column=column)
-                tasks.append(task)
-        return tasks
+                yield self._create_task(row=row, column=columns[:, column_index])
+
+    def _create_task(self, row: Iterable[float], column: Iterable[float]) -> ABCCalculateCell:
+        return CalculateCell(row=row, column=column, kernel=self._kernel)
+
+
+class BuildBlockTasks(ABCBuildTasks):
+    """Lazily builds matrix tile calculation tasks
+
+    Each task calculates a ``tile_size`` x ``tile_size`` tile of the result matrix,
+    so the number of tasks sent to the workers is reduced by ``tile_size ** 2`` times
+    """
+    __slots__ = ("_tile_size", "_kernel")
+
+    def __init__(self, tile_size: int = 64, kernel: ABCKernel = None) -> None:
+        if tile_size < 1:
+            raise ValueError("tile size must be positive")
+        self._tile_size = tile_size
+        self._kernel = kernel
+
+    def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> Iterator[ABCCalculateBlock]:
+        # column blocks are extracted once and shared between the tiles,
+        # row blocks are extracted one at a time while the tasks are consumed
+        column_blocks = [self._get_column_block(matrix=matrix2, start=start, stop=min(start + self._tile_size, matrix2.row_len()))
+                         for start in range(0, matrix2.row_len(), self._tile_size)]
+        for start in range(0, matrix1.column_len(), self._tile_size):
+            rows = self._get_row_block(matrix=matrix1, start=start, stop=min(start + self._tile_size, matrix1.column_len()))
+            for columns in column_blocks:
+                yield self._create_task(rows=rows, columns=columns)
+
+    @staticmethod
+    def _get_row_block(matrix: LeftMultipliableMatrix, start: int, stop: int) -> np.ndarray:
+        return np.asarray(matrix.get_row_block(start, stop))
 
     @staticmethod
-    def _create_task(row: Iterable[float], column: Iterable[float]) -> ABCCalculateCell:
-        return CalculateCell(row=row, column=column)
+    def _get_column_block(matrix: RightMultipliableMatrix, start: int, stop: int) -> np.ndarray:
+        # the column blocks are shared by all the tiles, so they are laid out by columns once per product
+        return np.asfortranarray(matrix.get_column_block(start, stop))
+
+    def _create_task(self, rows: np.ndarray, columns: np.ndarray) -> ABCCalculateBlock:
+        return CalculateBlock(rows=rows, columns=columns, kernel=self._kernel)
+
+
+class CalculateSharedBlock(Task):
+    """Calculates the result matrix tile reading the operands from the storage shared with the workers
+    and writes the tile directly into the shared result matrix
+    """
+    __slots__ = ("_matrix1", "_matrix2", "_result", "_rows", "_columns", "_kernel")
+
+    def __init__(self, matrix1: ABCArrayReference, matrix2: ABCArrayReference, result: ABCArrayReference,
+                 rows: Tuple[int, int], columns: Tuple[int, int], kernel: ABCKernel = None) -> None:
+        self._matrix1 = matrix1
+        self._matrix2 = matrix2
+        self._result = result
+        self._rows = rows
+        self._columns = columns
+        self._kernel = kernel if kernel is not None else BLASKernel()
+
+    def __call__(self) -> None:
+        """This command calculates the result matrix tile bounded by the row and the column ranges
+        """
+
+        (row_start, row_stop), (column_start, column_stop) = self._rows, self._columns
+        matrix1, matrix2, result = self._matrix1.open(), self._matrix2.open(), self._result.open()
+        result[row_start:row_stop, column_start:column_stop] = self._kernel(
+            matrix1[row_start:row_stop, :], matrix2[:, column_start:column_stop])
+
+
+class BuildSharedBlockTasks(ABCBuildSharedTasks):
+    """Lazily builds shared matrix tile calculation tasks
+
+    Tasks carry only the references to the shared operands and the index ranges of the tile
+    """
+    __slots__ = ("_tile_size", "_kernel")
+
+    def __init__(self, tile_size: int = 64, kernel: ABCKernel = None) -> None:
+        if tile_size < 1:
+            raise ValueError("tile size must be positive")
+        self._tile_size = tile_size
+        self._kernel = kernel
+
+    def __call__(self, matrix1: ABCArrayReference, matrix2: ABCArrayReference, result: ABCArrayReference) -> Iterator[Task]:
+        row_count, column_count = result.shape()
+        for row_start in range(0, row_count, self._tile_size):
+            rows = (row_start, min(row_start + self._tile_size, row_count))
+            for column_start in range(0, column_count, self._tile_size):
+                columns = (column_start, min(column_start + self._tile_size, column_count))
+                yield self._create_task(matrix1=matrix1, matrix2=matrix2, result=result, rows=rows, columns=columns)
+
+    def _create_task(self, matrix1: ABCArrayReference, matrix2: ABCArrayReference, result: ABCArrayReference,
+                     rows: Tuple[int, int], columns: Tuple[int, int]) -> Task:
+        return CalculateSharedBlock(
+            matrix1=matrix1, matrix2=matrix2, result=result, rows=rows, columns=columns, kernel=self._kernel)
 
 
 class AggregateResult(ABCAggregateResult):
-    """Aggregates list of task results into matrix of given shape
+    """Aggregates task results into matrix of given shape
+
+    The result matrix is allocated once and each cell value is written into its slot as it arrives.
+    If ``ordered`` is False, results are expected as ``(index, value)`` pairs in any order,
+    where ``index`` is the position of the cell in row-major order
     """
-    __slots__ = tuple()
+    __slots__ = ("_ordered",)
+
+    def __init__(self, ordered: bool = True):
+        self._ordered = ordered
+
+    def __call__(self, shape: Tuple[int, int], results: Iterable[float]) -> ABCMutableMatrix:
+        matrix, cells, count = None, None, 0
+        for index, value in (enumerate(results) if self._ordered else results):
+            if matrix is None:
+                matrix = np.empty(shape=shape, dtype=np.asarray(value).dtype)
+                # flat view of the preallocated matrix
+                cells = matrix.reshape(-1)
+            cells[index] = value
+            count += 1
+        matrix = _complete_matrix(matrix=matrix, shape=shape, count=count, expected_count=shape[0] * shape[1])
+        return self._create_matrix(matrix=matrix)
 
-    def __init__(self):
-        pass
+    @staticmethod
+    def _create_matrix(matrix: np.ndarray) -> ABCMutableMatrix:
+        return NDArrayMatrixAdapter(matrix=matrix, owned=True)
 
-    def __call__(self, shape: Tuple[int, int], results: List[float]) -> ABCMutableMatrix:
-        results_2d = np.array([results])
-        matrix = self._create_matrix(matrix=results_2d)
-        matrix.reshape(new_shape=shape)
-        return matrix
+
+class AggregateBlockResult(ABCAggregateResult):
+    """Aggregates result matrix tiles into matrix of given shape
+
+    Tiles are expected in the order they are produced by :class:`BuildBlockTasks`,
+    or as ``(index, tile)`` pairs in any order if ``ordered`` is False
+    """
+    __slots__ = ("_tile_size", "_ordered")
+
+    def __init__(self, tile_size: int = 64, ordered: bool = True) -> None:
+        if tile_size < 1:
+            raise ValueError("tile size must be positive")
+        self._tile_size = tile_size
+        self._ordered = ordered
+
+    def __call__(self, shape: Tuple[int, int], results: Iterable[np.ndarray]) -> ABCMutableMatrix:
+        matrix, count = None, 0
+        column_tiles = -(-shape[1] // self._tile_size)
+        for index, tile in (enumerate(results) if self._ordered else results):
+            if matrix is None:
+                matrix = np.empty(shape=shape, dtype=tile.dtype)
+            row_start = (index // column_tiles) * self._tile_size
+            column_start = (index % column_tiles) * self._tile_size
+            matrix[row_start:row_start + tile.shape[0], column_start:column_start + tile.shape[1]] = tile
+            count += 1
+        expected_count = -(-shape[0] // self._tile_size) * column_tiles
+        matrix = _complete_matrix(matrix=matrix, shape=shape, count=count, expected_count=expected_count)
+        return self._create_matrix(matrix=matrix)
 
     @staticmethod
     def _create_matrix(matrix: np.ndarray) -> ABCMutableMatrix:
-        return NDArrayMatrixAdapter(matrix=matrix)
+        return NDArrayMatrixAdapter(matrix=matrix, owned=True)
+
+
+def _complete_matrix(matrix: np.ndarray, shape: Tuple[int, int], count: int, expected_count: int) -> np.ndarray:
+    # the matrix is allocated uninitialized, so every slot has to be written
+    if count != expected_count:
+        raise ValueError(f"expected {expected_count} results, got {count}")
+    return matrix if matrix is not None else np.zeros(shape=shape)
 
 
 class TaskManager(ABCTaskManager):
@@ -85,7 +255,7 @@ class TaskManager(ABCTaskManager):
         self._build_tasks = build_tasks
         self._aggregate_result = aggregate_result
 
-    def build_tasks(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> List[ABCCalculateCell]:
+    def build_tasks(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> Iterator[Task]:
         return self._build_tasks(matrix1=matrix1, matrix2=matrix2)
 
     def handle_results(self, shape: Tuple[int, int], results: Iterable[float]) -> ABCMatrix:
@@ -95,33 +265,124 @@ class TaskManager(ABCTaskManager):
 class MultiplyMatrixPair(ABCMultiplyMatrixPair):
     """Multiplies two matrices
     """
-    __slots__ = ("_task_manager", "_task_processor")
+    __slots__ = ("_task_manager", "_task_processor", "_metrics")
 
-    def __init__(self, task_manager: ABCTaskManager, task_processor: TaskProcessor) -> None:
+    def __init__(self, task_manager: ABCTaskManager, task_processor: TaskProcessor, metrics: ABCMetrics = None) -> None:
         self._task_manager = task_manager
         self._task_processor = task_processor
+        self._metrics = metrics if metrics is not None else NullMetrics()
 
     def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        if self._metrics.enabled:
+            return self._multiply_instrumented(matrix1=matrix1, matrix2=matrix2)
         tasks = self._task_manager.build_tasks(
             matrix1=matrix1, matrix2=matrix2)
         results = self._task_processor(tasks=tasks)
         shape = (matrix1.column_len(), matrix2.row_len())
         return self._task_manager.handle_results(shape=shape, results=results)
 
+    def _multiply_instrumented(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        start, started = time.time(), time.perf_counter()
+        # the stages are interleaved when tasks and results are streamed,
+        # so exclusive stage times are derived from the time spent inside the nested iterators
+        tasks = TimedIterator(self._task_manager.build_tasks(
+            matrix1=matrix1, matrix2=matrix2))
+        processor_started = time.perf_counter()
+        results = self._task_processor(tasks=tasks)
+        processor_elapsed = time.perf_counter() - processor_started
+        results = TimedIterator(results)
+        shape = (matrix1.column_len(), matrix2.row_len())
+        matrix = self._task_manager.handle_results(shape=shape, results=results)
+        duration = time.perf_counter() - started
+        stages = (("build_tasks", tasks.elapsed),
+                  ("process_tasks", processor_elapsed + results.elapsed - tasks.elapsed),
+                  ("aggregate_result", duration - processor_elapsed - results.elapsed))
+        self._metrics.record_stage(name="multiply_matrix_pair", start=start, duration=duration, shape=shape)
+        for name, elapsed in stages:
+            # stages are laid out one after another within the pair multiplication span
+            self._metrics.record_stage(name=name, start=start, duration=elapsed)
+            start += elapsed
+        return matrix
+
+
+class SharedMemoryMultiplyMatrixPair(ABCMultiplyMatrixPair):
+    """Multiplies two matrices placing the operands and the result into shared memory
+
+    The operands are copied into shared memory once (operands that are already shared are used as is),
+    the workers write the result tiles directly into the shared result matrix of the output type of the precision
+    """
+    __slots__ = ("_build_tasks", "_task_processor", "_precision", "_metrics")
+
+    def __init__(self, build_tasks: ABCBuildSharedTasks, task_processor: TaskProcessor, precision: Precision = None,
+                 metrics: ABCMetrics = None) -> None:
+        self._build_tasks = build_tasks
+        self._task_processor = task_processor
+        self._precision = precision if precision is not None else Precision()
+        self._metrics = metrics if metrics is not None else NullMetrics()
+
+    def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        if not self._metrics.enabled:
+            return self._multiply(matrix1=matrix1, matrix2=matrix2)
+        start, started = time.time(), time.perf_counter()
+        matrix = self._multiply(matrix1=matrix1, matrix2=matrix2)
+        self._metrics.record_stage(name="multiply_matrix_pair", start=start, duration=time.perf_counter() - started,
+                                   shape=(matrix1.column_len(), matrix2.row_len()))
+        return matrix
+
+    def _multiply(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        start, started = time.time(), time.perf_counter()
+        shared_matrix1, shared_matrix2 = self._share(matrix=matrix1), self._share(matrix=matrix2)
+        if self._metrics.enabled:
+            self._metrics.record_stage(name="share_operands", start=start, duration=time.perf_counter() - started)
+        try:
+            result = SharedArray(shape=(matrix1.column_len(), matrix2.row_len()),
+                                 dtype=self._precision.product_dtype(shared_matrix1.dtype, shared_matrix2.dtype))
+            tasks = self._build_tasks(
+                matrix1=shared_matrix1.reference, matrix2=shared_matrix2.reference, result=result.reference)
+            # results are written into the shared result matrix, so the task return values are dropped
+            for _ in self._task_processor(tasks=tasks):
+                pass
+        finally:
+            # operands copied by this command are released right away
+            for shared_matrix, matrix in ((shared_matrix1, matrix1), (shared_matrix2, matrix2)):
+                if shared_matrix is not matrix:
+                    shared_matrix.release()
+        return SharedMatrixAdapter(shared_array=result)
+
+    @staticmethod
+    def _share(matrix: ABCMatrix) -> SharedMatrixAdapter:
+        if isinstance(matrix, SharedMatrixAdapter):
+            return matrix
+        return SharedMatrixAdapter(shared_array=SharedArray.from_matrix(matrix=matrix))
+
 
 class MultiplyMatrixSequence(object):
     """Multiplies matrix sequence
+
+    If the chain planner is given, the sequence is multiplied in the order of the plan tree,
+    otherwise it is folded from left to right. The plan made beforehand could be given with the matrices
     """
-    __slots__ = ("_multiply_matrix_pair")
+    __slots__ = ("_multiply_matrix_pair", "_plan_matrix_chain", "_execute_plan")
 
-    def __init__(self, multiply_matrix_pair: ABCMultiplyMatrixPair) -> None:
+    def __init__(self, multiply_matrix_pair: ABCMultiplyMatrixPair, plan_matrix_chain: ABCPlanMatrixChain = None,
+                 execute_plan: ABCExecutePlan = None) -> None:
         self._multiply_matrix_pair = multiply_matrix_pair
-
-    def __call__(self, matrices: Iterable[ABCMatrix]) -> ABCMatrix:
-        # firstly multiplying first and second matrices of the sequence
-        # then multiplying each result of previous multiplication with the next matrix in the sequence
-        return functools.reduce(
-            lambda matrix1, matrix2: self._multiply_matrix_pair(matrix1=matrix1, matrix2=matrix2), matrices)
+        self._plan_matrix_chain = plan_matrix_chain
+        self._execute_plan = execute_plan if execute_plan is not None else ExecutePlan(
+            multiply_matrix_pair=multiply_matrix_pair)
+
+    def __call__(self, matrices: Iterable[ABCMatrix], plan: ABCMultiplicationPlan = None) -> ABCMatrix:
+        if plan is not None:
+            return self._execute_plan(plan=plan, matrices=list(matrices))
+        if self._plan_matrix_chain is None:
+            # firstly multiplying first and second matrices of the sequence
+            # then multiplying each result of previous multiplication with the next matrix in the sequence
+            return functools.reduce(
+                lambda matrix1, matrix2: self._multiply_matrix_pair(matrix1=matrix1, matrix2=matrix2), matrices)
+        matrices = list(matrices)
+        plan = self._plan_matrix_chain(shapes=[(matrix.column_len(), matrix.row_len()) for matrix in matrices])
+        logger.debug("multiplying matrix chain as %r, estimated cost is %d flops", plan, plan.cost())
+        return self._execute_plan(plan=plan, matrices=matrices)
 
 
 class ValidateMatrixPair(ABCValidateMatrixPair):
@@ -159,7 +420,10 @@ class ValidateMatrixSequence(object):
             bool: True if sequence is valid, else False
         """
 
-        for i in range(0, len(matrices) - 1):
-            if not self._validate_matrix_pair(matrix1=matrices[i], matrix2=matrices[i+1]):
+        # the sequence is walked once pairwise, so any iterable is accepted
+        previous = None
+        for matrix in matrices:
+            if previous is not None and not self._validate_matrix_pair(matrix1=previous, matrix2=matrix):
                 return False
+            previous = matrix
         return True
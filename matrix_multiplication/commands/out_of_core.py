@@ -0,0 +1,71 @@
+"""Module for concrete implementations of classes required to multiply matrices which do not fit in memory
+"""
+from __future__ import annotations
+import time
+
+from matrix_multiplication.abc.matrix import ABCMatrix, LeftMultipliableMatrix, RightMultipliableMatrix
+from matrix_multiplication.abc.matrix_multiplication import ABCBuildSharedTasks, ABCMultiplyMatrixPair
+from matrix_multiplication.abc.metrics import ABCMetrics
+from matrix_multiplication.abc.task import TaskProcessor
+from matrix_multiplication.kernel import Precision
+from matrix_multiplication.matrix.mapped import MemmapMatrixAdapter, temporary_path
+from matrix_multiplication.metrics import NullMetrics
+
+
+class MemmapMultiplyMatrixPair(ABCMultiplyMatrixPair):
+    """Multiplies two matrices placing the operands and the result into memory-mapped files
+
+    Operands which are not memory-mapped yet are copied to temporary files block by block,
+    the workers open the files by path and write the result tiles directly into the result file,
+    so the memory used depends on the tile size rather than on the matrix size.
+    The result is a temporary file of the output type of the precision in ``directory``,
+    use :meth:`MemmapMatrixAdapter.persist` to keep it
+    """
+    __slots__ = ("_build_tasks", "_task_processor", "_directory", "_precision", "_metrics")
+
+    def __init__(self, build_tasks: ABCBuildSharedTasks, task_processor: TaskProcessor, directory: str = None,
+                 precision: Precision = None, metrics: ABCMetrics = None) -> None:
+        self._build_tasks = build_tasks
+        self._task_processor = task_processor
+        self._directory = directory
+        self._precision = precision if precision is not None else Precision()
+        self._metrics = metrics if metrics is not None else NullMetrics()
+
+    def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        if not self._metrics.enabled:
+            return self._multiply(matrix1=matrix1, matrix2=matrix2)
+        start, started = time.time(), time.perf_counter()
+        matrix = self._multiply(matrix1=matrix1, matrix2=matrix2)
+        self._metrics.record_stage(name="multiply_matrix_pair", start=start, duration=time.perf_counter() - started,
+                                   shape=(matrix1.column_len(), matrix2.row_len()))
+        return matrix
+
+    def _multiply(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        start, started = time.time(), time.perf_counter()
+        # the tiles read row bands of the first operand and column bands of the second one,
+        # so the copies are laid out to make the bands contiguous in the files
+        mapped_matrix1 = self._map(matrix=matrix1, order="C")
+        mapped_matrix2 = self._map(matrix=matrix2, order="F")
+        if self._metrics.enabled:
+            self._metrics.record_stage(name="map_operands", start=start, duration=time.perf_counter() - started)
+        try:
+            result = MemmapMatrixAdapter.create(
+                path=temporary_path(directory=self._directory), shape=(matrix1.column_len(), matrix2.row_len()),
+                dtype=self._precision.product_dtype(mapped_matrix1.dtype, mapped_matrix2.dtype), temporary=True)
+            tasks = self._build_tasks(
+                matrix1=mapped_matrix1.reference, matrix2=mapped_matrix2.reference, result=result.reference)
+            # results are written into the result file, so the task return values are dropped
+            for _ in self._task_processor(tasks=tasks):
+                pass
+        finally:
+            # operands copied by this command are removed right away
+            for mapped_matrix, matrix in ((mapped_matrix1, matrix1), (mapped_matrix2, matrix2)):
+                if mapped_matrix is not matrix:
+                    mapped_matrix.release()
+        return result
+
+    def _map(self, matrix: ABCMatrix, order: str) -> MemmapMatrixAdapter:
+        if isinstance(matrix, MemmapMatrixAdapter):
+            return matrix
+        return MemmapMatrixAdapter.from_matrix(
+            matrix=matrix, path=temporary_path(directory=self._directory), order=order, temporary=True)
@@ -0,0 +1,234 @@
+"""Module for concrete implementations of classes required to plan matrix chain multiplication
+"""
+from __future__ import annotations
+from typing import Iterable, List, Tuple
+
+from matrix_multiplication.abc.matrix import ABCMatrixShape
+from matrix_multiplication.abc.matrix_multiplication import ABCMultiplicationPlan, ABCPlanMatrixChain
+from matrix_multiplication.kernel import Precision
+
+
+def product_cost(shape1: Tuple[int, int], shape2: Tuple[int, int]) -> int:
+    """Estimates the number of floating point operations (one multiplication and one addition per term)
+    required to multiply matrices of the given shapes
+    """
+    return 2 * shape1[0] * shape1[1] * shape2[1]
+
+
+class LeafPlan(ABCMultiplicationPlan):
+    """Plan node referring to the matrix of the chain by its index
+    """
+    __slots__ = ("_index", "_shape")
+
+    def __init__(self, index: int, shape: Tuple[int, int]) -> None:
+        self._index = index
+        self._shape = tuple(shape)
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    def shape(self) -> Tuple[int, int]:
+        return self._shape
+
+    def cost(self) -> int:
+        return 0
+
+    def __repr__(self) -> str:
+        return f"M{self._index}"
+
+
+class ProductPlan(ABCMultiplicationPlan):
+    """Plan node multiplying the results of its left and right sub-plans
+    """
+    __slots__ = ("_left", "_right", "_shape", "_cost")
+
+    def __init__(self, left: ABCMultiplicationPlan, right: ABCMultiplicationPlan) -> None:
+        self._left = left
+        self._right = right
+        self._shape = (left.shape()[0], right.shape()[1])
+        self._cost = left.cost() + right.cost() + product_cost(shape1=left.shape(), shape2=right.shape())
+
+    @property
+    def left(self) -> ABCMultiplicationPlan:
+        return self._left
+
+    @property
+    def right(self) -> ABCMultiplicationPlan:
+        return self._right
+
+    def shape(self) -> Tuple[int, int]:
+        return self._shape
+
+    def cost(self) -> int:
+        return self._cost
+
+    def __repr__(self) -> str:
+        return f"({self._left!r} {self._right!r})"
+
+
+class LeftToRightPlanMatrixChain(ABCPlanMatrixChain):
+    """Plans matrix chain multiplication folding the chain from left to right
+    """
+    __slots__ = tuple()
+
+    def __init__(self) -> None:
+        pass
+
+    def __call__(self, shapes: List[Tuple[int, int]]) -> ABCMultiplicationPlan:
+        if len(shapes) == 0:
+            raise ValueError("could not plan multiplication of empty matrix chain")
+        plan = LeafPlan(index=0, shape=shapes[0])
+        for index in range(1, len(shapes)):
+            plan = ProductPlan(left=plan, right=LeafPlan(index=index, shape=shapes[index]))
+        return plan
+
+
+class PlanMatrixChain(ABCPlanMatrixChain):
+    """Plans matrix chain multiplication with the minimal number of floating point operations
+
+    Uses the classic O(n^3) dynamic programming over the chain shapes
+    """
+    __slots__ = tuple()
+
+    def __init__(self) -> None:
+        pass
+
+    def __call__(self, shapes: List[Tuple[int, int]]) -> ABCMultiplicationPlan:
+        """Finds optimal parenthesization of the matrix chain
+
+        Args:
+            shapes (List[Tuple[int, int]]): shapes of the chain matrices, (rows, columns) each
+
+        Returns:
+            ABCMultiplicationPlan: root of the multiplication plan tree
+        """
+
+        count = len(shapes)
+        if count == 0:
+            raise ValueError("could not plan multiplication of empty matrix chain")
+        # dimensions[i] x dimensions[i + 1] is the shape of the i-th matrix
+        dimensions = [shape[0] for shape in shapes] + [shapes[-1][1]]
+        costs = [[0] * count for _ in range(count)]
+        splits = [[0] * count for _ in range(count)]
+        for length in range(2, count + 1):
+            for start in range(0, count - length + 1):
+                stop = start + length - 1
+                costs[start][stop] = None
+                for split in range(start, stop):
+                    cost = (costs[start][split] + costs[split + 1][stop]
+                            + dimensions[start] * dimensions[split + 1] * dimensions[stop + 1])
+                    if costs[start][stop] is None or cost < costs[start][stop]:
+                        costs[start][stop], splits[start][stop] = cost, split
+        return self._build_plan(shapes=shapes, splits=splits, start=0, stop=count - 1)
+
+    def _build_plan(self, shapes: List[Tuple[int, int]], splits: List[List[int]], start: int, stop: int) -> ABCMultiplicationPlan:
+        if start == stop:
+            return LeafPlan(index=start, shape=shapes[start])
+        split = splits[start][stop]
+        return ProductPlan(left=self._build_plan(shapes=shapes, splits=splits, start=start, stop=split),
+                           right=self._build_plan(shapes=shapes, splits=splits, start=split + 1, stop=stop))
+
+
+class MemoryBudgetExceededError(ValueError):
+    """Raised when the estimated peak memory of the multiplication exceeds the memory budget
+    """
+
+
+class SequencePlan(object):
+    """Shapes and costs of the matrix sequence multiplication known before any product is calculated
+
+    ``intermediate_shapes`` are the shapes of the products in the order they are calculated, the last one is the shape
+    of the result. ``peak_bytes`` is the largest memory held at once by the operands and the products
+    under the scheduling the sequence was planned for
+    """
+    __slots__ = ("_matrices", "_plan", "_intermediate_shapes", "_peak_bytes")
+
+    def __init__(self, matrices: List[ABCMatrixShape], plan: ABCMultiplicationPlan,
+                 intermediate_shapes: List[Tuple[int, int]], peak_bytes: int) -> None:
+        self._matrices = matrices
+        self._plan = plan
+        self._intermediate_shapes = intermediate_shapes
+        self._peak_bytes = peak_bytes
+
+    @property
+    def matrices(self) -> List[ABCMatrixShape]:
+        return self._matrices
+
+    @property
+    def plan(self) -> ABCMultiplicationPlan:
+        return self._plan
+
+    @property
+    def intermediate_shapes(self) -> List[Tuple[int, int]]:
+        return self._intermediate_shapes
+
+    @property
+    def flops(self) -> int:
+        return self._plan.cost()
+
+    @property
+    def peak_bytes(self) -> int:
+        return self._peak_bytes
+
+
+class PlanMatrixSequence(object):
+    """Validates the matrix sequence and plans its multiplication in one pass over it, reading the shapes only
+
+    Any iterable is accepted, the matrices are kept in :attr:`SequencePlan.matrices` to be multiplied afterwards.
+    The plan is rejected with :class:`MemoryBudgetExceededError` if its peak memory exceeds ``memory_budget`` bytes.
+    ``scheduling`` is the way the sub-products are evaluated: "sequential" - one after another, "concurrent" -
+    independent sub-products at the same time, so their peaks are summed up (the bound holds for any number of workers).
+    The products are sized in the output type of ``precision``, in the widest type of their operands if it has none
+    """
+    __slots__ = ("_plan_matrix_chain", "_memory_budget", "_concurrent", "_precision")
+
+    def __init__(self, plan_matrix_chain: ABCPlanMatrixChain = None, memory_budget: int = None,
+                 scheduling: str = "sequential", precision: Precision = None) -> None:
+        if scheduling not in ("sequential", "concurrent"):
+            raise ValueError(f"unknown scheduling {scheduling!r}")
+        self._plan_matrix_chain = plan_matrix_chain if plan_matrix_chain is not None else LeftToRightPlanMatrixChain()
+        self._memory_budget = memory_budget
+        self._concurrent = scheduling == "concurrent"
+        self._precision = precision if precision is not None else Precision()
+
+    def __call__(self, matrices: Iterable[ABCMatrixShape]) -> SequencePlan:
+        sequence, shapes = list(), list()
+        for matrix in matrices:
+            shape = (matrix.column_len(), matrix.row_len())
+            if shapes and shapes[-1][1] != shape[0]:
+                raise ValueError("matrices could not be multiplied")
+            sequence.append(matrix)
+            shapes.append(shape)
+        if not sequence:
+            raise ValueError("matrices could not be multiplied")
+        plan = self._plan_matrix_chain(shapes=shapes)
+        intermediate_shapes = list()
+        _, _, peak_bytes = self._trace(plan=plan, matrices=sequence, intermediate_shapes=intermediate_shapes)
+        peak_bytes += sum(shape[0] * shape[1] * matrix.itemsize() for shape, matrix in zip(shapes, sequence))
+        if self._memory_budget is not None and peak_bytes > self._memory_budget:
+            raise MemoryBudgetExceededError(
+                f"multiplication needs about {peak_bytes} bytes, the memory budget is {self._memory_budget} bytes")
+        return SequencePlan(matrices=sequence, plan=plan, intermediate_shapes=intermediate_shapes, peak_bytes=peak_bytes)
+
+    def _trace(self, plan: ABCMultiplicationPlan, matrices: List[ABCMatrixShape],
+               intermediate_shapes: List[Tuple[int, int]]) -> Tuple[int, int, int]:
+        # returns the element size and the bytes of the product and the peak bytes held while it is calculated,
+        # the operands of the sequence are held all the time, so they are not counted
+        if isinstance(plan, LeafPlan):
+            return matrices[plan.index].itemsize(), 0, 0
+        left_itemsize, left_bytes, left_peak = self._trace(
+            plan=plan.left, matrices=matrices, intermediate_shapes=intermediate_shapes)
+        right_itemsize, right_bytes, right_peak = self._trace(
+            plan=plan.right, matrices=matrices, intermediate_shapes=intermediate_shapes)
+        output = self._precision.output
+        itemsize = output.itemsize if output is not None else max(left_itemsize, right_itemsize)
+        product_bytes = plan.shape()[0] * plan.shape()[1] * itemsize
+        intermediate_shapes.append(plan.shape())
+        if self._concurrent:
+            # both products could be calculated at the same time, both are held while they are multiplied
+            peak = max(left_peak + right_peak, left_bytes + right_bytes + product_bytes)
+        else:
+            # the left product is held while the right one is calculated, both are held while they are multiplied
+            peak = max(left_peak, left_bytes + right_peak, left_bytes + right_bytes + product_bytes)
+        return itemsize, product_bytes, peak
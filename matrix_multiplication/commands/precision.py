@@ -0,0 +1,102 @@
+"""Module for concrete implementations of classes required to multiply matrices in the given data types
+"""
+from __future__ import annotations
+from typing import Tuple
+
+import numpy as np
+
+from matrix_multiplication.abc.matrix import ABCMatrix, LeftMultipliableMatrix, RightMultipliableMatrix
+from matrix_multiplication.abc.matrix_multiplication import ABCAsyncMultiplyMatrixPair, ABCMultiplyMatrixPair
+from matrix_multiplication.kernel import Precision
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+from matrix_multiplication.matrix.mapped import MemmapMatrixAdapter, temporary_path
+from matrix_multiplication.matrix.sparse import SparseMatrixAdapter
+
+
+class _ConvertPrecision(object):
+    """Converts the operands to the compute type of the precision and the product to its output type
+    """
+    __slots__ = ()
+
+    def _convert_operands(self, matrix1: LeftMultipliableMatrix,
+                          matrix2: RightMultipliableMatrix) -> Tuple[ABCMatrix, ABCMatrix]:
+        return self._astype(matrix=matrix1), self._astype(matrix=matrix2)
+
+    @staticmethod
+    def _release_operands(converted: Tuple[ABCMatrix, ABCMatrix], matrices: Tuple[ABCMatrix, ABCMatrix]) -> None:
+        # files of the operands converted by this command are removed right away
+        for converted_matrix, matrix in zip(converted, matrices):
+            if converted_matrix is not matrix and isinstance(converted_matrix, MemmapMatrixAdapter):
+                converted_matrix.release()
+
+    def _convert_product(self, product: ABCMatrix) -> ABCMatrix:
+        output = self._precision.output if self._precision.output is not None else self._dtype(matrix=product)
+        return self._astype(matrix=product, dtype=output)
+
+    def _astype(self, matrix: ABCMatrix, dtype: np.dtype = None) -> ABCMatrix:
+        source = self._dtype(matrix=matrix)
+        dtype = dtype if dtype is not None else self._precision.operand_dtype(dtype=source)
+        if dtype == source:
+            return matrix
+        if isinstance(matrix, SparseMatrixAdapter):
+            return SparseMatrixAdapter(data=matrix.data.astype(dtype), indices=matrix.indices, indptr=matrix.indptr,
+                                       shape=(matrix.column_len(), matrix.row_len()))
+        if isinstance(matrix, MemmapMatrixAdapter):
+            return MemmapMatrixAdapter.from_matrix(matrix=matrix, path=temporary_path(directory=self._directory),
+                                                   order=matrix.reference.order, temporary=True, dtype=dtype)
+        return NDArrayMatrixAdapter(matrix=to_ndarray(matrix=matrix).astype(dtype, copy=False), owned=True)
+
+    @staticmethod
+    def _dtype(matrix: ABCMatrix) -> np.dtype:
+        # the matrices which do not tell their type are read to find it out
+        dtype = getattr(matrix, "dtype", None)
+        return np.dtype(dtype) if dtype is not None else to_ndarray(matrix=matrix).dtype
+
+
+class PrecisionMultiplyMatrixPair(_ConvertPrecision, ABCMultiplyMatrixPair):
+    """Converts the operands to the compute type of the precision before they are multiplied,
+    so they are sent to the workers in it, and the product to the output type of the precision
+
+    The summation itself is done in the accumulation type by the kernels, the matrices already of the right type
+    are passed as they are, sparse matrices stay sparse. Memory-mapped matrices are converted block by block
+    into temporary files in ``directory``, so they are never held in memory as a whole
+    """
+    __slots__ = ("_multiply_matrix_pair", "_precision", "_directory")
+
+    def __init__(self, multiply_matrix_pair: ABCMultiplyMatrixPair, precision: Precision = None,
+                 directory: str = None) -> None:
+        self._multiply_matrix_pair = multiply_matrix_pair
+        self._precision = precision if precision is not None else Precision()
+        self._directory = directory
+
+    def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        if self._precision.native:
+            return self._multiply_matrix_pair(matrix1=matrix1, matrix2=matrix2)
+        converted1, converted2 = self._convert_operands(matrix1=matrix1, matrix2=matrix2)
+        try:
+            product = self._multiply_matrix_pair(matrix1=converted1, matrix2=converted2)
+        finally:
+            self._release_operands(converted=(converted1, converted2), matrices=(matrix1, matrix2))
+        return self._convert_product(product=product)
+
+
+class AsyncPrecisionMultiplyMatrixPair(_ConvertPrecision, ABCAsyncMultiplyMatrixPair):
+    """Awaitable counterpart of :class:`PrecisionMultiplyMatrixPair`
+    """
+    __slots__ = ("_multiply_matrix_pair", "_precision", "_directory")
+
+    def __init__(self, multiply_matrix_pair: ABCAsyncMultiplyMatrixPair, precision: Precision = None,
+                 directory: str = None) -> None:
+        self._multiply_matrix_pair = multiply_matrix_pair
+        self._precision = precision if precision is not None else Precision()
+        self._directory = directory
+
+    async def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        if self._precision.native:
+            return await self._multiply_matrix_pair(matrix1=matrix1, matrix2=matrix2)
+        converted1, converted2 = self._convert_operands(matrix1=matrix1, matrix2=matrix2)
+        try:
+            product = await self._multiply_matrix_pair(matrix1=converted1, matrix2=converted2)
+        finally:
+            self._release_operands(converted=(converted1, converted2), matrices=(matrix1, matrix2))
+        return self._convert_product(product=product)
@@ -0,0 +1,90 @@
+"""Module for concrete implementations of classes required to execute matrix chain multiplication plans
+"""
+from __future__ import annotations
+import concurrent.futures
+from typing import Dict, List
+
+from matrix_multiplication.abc.matrix import ABCMatrix
+from matrix_multiplication.abc.matrix_multiplication import ABCExecutePlan, ABCMultiplicationPlan, ABCMultiplyMatrixPair
+from matrix_multiplication.commands.planning import LeafPlan, ProductPlan
+
+
+class ExecutePlan(ABCExecutePlan):
+    """Executes multiplication plan evaluating sub-products one after another
+    """
+    __slots__ = ("_multiply_matrix_pair",)
+
+    def __init__(self, multiply_matrix_pair: ABCMultiplyMatrixPair) -> None:
+        self._multiply_matrix_pair = multiply_matrix_pair
+
+    def __call__(self, plan: ABCMultiplicationPlan, matrices: List[ABCMatrix]) -> ABCMatrix:
+        if isinstance(plan, LeafPlan):
+            return matrices[plan.index]
+        return self._multiply_matrix_pair(matrix1=self(plan=plan.left, matrices=matrices),
+                                          matrix2=self(plan=plan.right, matrices=matrices))
+
+
+class ConcurrentExecutePlan(ABCExecutePlan):
+    """Executes multiplication plan as a DAG of sub-products
+
+    All sub-products whose operands are ready are submitted at the same time,
+    each product starts as soon as both of its children are finished.
+    Threads only drive the blocking pair multiplications, the computation itself is done by the task processor
+    """
+    __slots__ = ("_multiply_matrix_pair", "_max_workers")
+
+    def __init__(self, multiply_matrix_pair: ABCMultiplyMatrixPair, max_workers: int = None) -> None:
+        self._multiply_matrix_pair = multiply_matrix_pair
+        self._max_workers = max_workers
+
+    def __call__(self, plan: ABCMultiplicationPlan, matrices: List[ABCMatrix]) -> ABCMatrix:
+        if isinstance(plan, LeafPlan):
+            return matrices[plan.index]
+        if isinstance(plan.left, LeafPlan) and isinstance(plan.right, LeafPlan):
+            # a single product has nothing to run concurrently with, so no threads are started for it
+            return self._multiply_matrix_pair(matrix1=matrices[plan.left.index], matrix2=matrices[plan.right.index])
+        parents: Dict[ProductPlan, ProductPlan] = dict()
+        pending: Dict[ProductPlan, int] = dict()
+        ready: List[ProductPlan] = list()
+        self._collect_products(plan=plan, parents=parents, pending=pending, ready=ready)
+        results: Dict[ABCMultiplicationPlan, ABCMatrix] = dict()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {self._submit(executor=executor, plan=product, matrices=matrices, results=results): product
+                       for product in ready}
+            try:
+                while futures:
+                    done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        product = futures.pop(future)
+                        results[product] = future.result()
+                        # operands of the finished product are not needed anymore
+                        results.pop(product.left, None)
+                        results.pop(product.right, None)
+                        parent = parents.get(product)
+                        if parent is None:
+                            continue
+                        pending[parent] -= 1
+                        if pending[parent] == 0:
+                            futures[self._submit(executor=executor, plan=parent, matrices=matrices, results=results)] = parent
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return results[plan]
+
+    def _collect_products(self, plan: ProductPlan, parents: Dict[ProductPlan, ProductPlan],
+                          pending: Dict[ProductPlan, int], ready: List[ProductPlan]) -> None:
+        pending[plan] = 0
+        for child in (plan.left, plan.right):
+            if isinstance(child, ProductPlan):
+                parents[child] = plan
+                pending[plan] += 1
+                self._collect_products(plan=child, parents=parents, pending=pending, ready=ready)
+        if pending[plan] == 0:
+            ready.append(plan)
+
+    def _submit(self, executor: concurrent.futures.Executor, plan: ProductPlan, matrices: List[ABCMatrix],
+                results: Dict[ABCMultiplicationPlan, ABCMatrix]) -> concurrent.futures.Future:
+        matrix1, matrix2 = (results[child] if isinstance(child, ProductPlan) else matrices[child.index]
+                            for child in (plan.left, plan.right))
+        return executor.submit(self._multiply_matrix_pair, matrix1=matrix1, matrix2=matrix2)
@@ -0,0 +1,149 @@
+"""Module for concrete implementations of classes required to multiply sparse matrices
+"""
+from __future__ import annotations
+from typing import Iterable, Iterator, Tuple
+
+import numpy as np
+
+from matrix_multiplication.abc.matrix import ABCMatrix, LeftMultipliableMatrix, RightMultipliableMatrix
+from matrix_multiplication.abc.matrix_multiplication import ABCAggregateResult, ABCBuildTasks
+from matrix_multiplication.abc.task import Task
+from matrix_multiplication.kernel import Precision
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter
+from matrix_multiplication.matrix.sparse import CompressedArrays, SparseMatrixAdapter, expand_ranges
+
+# rows of the result band and their compressed arrays
+SparseBand = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+class CalculateSparseRowBand(Task):
+    """Calculates the rows of the result matrix as sparse products of the first matrix rows and the second matrix
+
+    Gustavson's algorithm is used: each non-zero of the first matrix row scales the matching row of the second matrix,
+    the scaled rows are summed up, so only the products of non-zeros are calculated.
+    The products are summed up in the accumulation type of the precision and stored in its output type
+    """
+    __slots__ = ("_rows", "_left", "_right", "_column_count", "_precision")
+
+    def __init__(self, rows: np.ndarray, left: CompressedArrays, right: CompressedArrays, column_count: int,
+                 precision: Precision = None) -> None:
+        # left holds the band rows, their column indices refer to the rows of right
+        self._rows = rows
+        self._left = left
+        self._right = right
+        self._column_count = column_count
+        self._precision = precision if precision is not None else Precision()
+
+    def __call__(self) -> SparseBand:
+        """This command calculates the band of the result matrix
+
+        Returns:
+            SparseBand: the band rows and the compressed arrays of the band
+        """
+
+        left_data, left_indices, left_indptr = self._left
+        right_data, right_indices, right_indptr = self._right
+        # the band could not hold more products of one cell than it holds non-zeros, so the overflow check is safe
+        left_data, right_data = self._precision.prepare(left=left_data, right=right_data)
+        left_rows = np.repeat(np.arange(self._rows.shape[0], dtype=np.intp), np.diff(left_indptr))
+        starts = right_indptr[left_indices]
+        counts = right_indptr[left_indices + 1] - starts
+        positions = expand_ranges(starts=starts, counts=counts)
+        products = np.repeat(left_data, counts) * right_data[positions]
+        # the products falling into the same cell are summed up
+        keys = np.repeat(left_rows, counts) * self._column_count + right_indices[positions]
+        order = np.argsort(keys, kind="stable")
+        keys, products = keys[order], products[order]
+        boundaries = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1]))) if keys.shape[0] else keys
+        values = self._precision.finish(result=np.add.reduceat(products, boundaries) if keys.shape[0] else products)
+        keys = keys[boundaries]
+        # cancelled out products are not stored
+        non_zero = values != 0
+        keys, values = keys[non_zero], values[non_zero]
+        indptr = np.zeros(shape=self._rows.shape[0] + 1, dtype=np.intp)
+        np.cumsum(np.bincount(keys // max(self._column_count, 1), minlength=self._rows.shape[0]), out=indptr[1:])
+        return self._rows, values, keys % max(self._column_count, 1), indptr
+
+
+class BuildSparseTasks(ABCBuildTasks):
+    """Lazily builds sparse row band calculation tasks
+
+    Empty rows of the first matrix get no tasks, the rest are grouped into bands of about ``band_nnz`` non-zeros.
+    Each task carries the non-zeros of its band and only the rows of the second matrix they refer to,
+    so both the work and the data sent to the workers scale with the number of non-zeros.
+    Matrices which are not sparse are compressed first
+    """
+    __slots__ = ("_band_nnz", "_precision")
+
+    def __init__(self, band_nnz: int = 4096, precision: Precision = None) -> None:
+        if band_nnz < 1:
+            raise ValueError("band size must be positive")
+        self._band_nnz = band_nnz
+        self._precision = precision if precision is not None else Precision()
+
+    def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> Iterator[Task]:
+        matrix1, matrix2 = SparseMatrixAdapter.from_matrix(matrix=matrix1), SparseMatrixAdapter.from_matrix(matrix=matrix2)
+        row_nnz = np.diff(matrix1.indptr)
+        rows = np.flatnonzero(row_nnz)
+        if rows.shape[0] == 0:
+            return
+        # the band of each row is the number of whole bands filled before the row
+        bands = (np.cumsum(row_nnz[rows]) - row_nnz[rows]) // self._band_nnz
+        bounds = np.flatnonzero(np.concatenate(([True], bands[1:] != bands[:-1], [True])))
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            band_rows = rows[start:stop]
+            data, indices, indptr = matrix1.take_rows(rows=band_rows)
+            right_rows, local_indices = np.unique(indices, return_inverse=True)
+            yield self._create_task(rows=band_rows, left=(data, local_indices.astype(np.intp), indptr),
+                                    right=matrix2.take_rows(rows=right_rows), column_count=matrix2.row_len())
+
+    def _create_task(self, rows: np.ndarray, left: CompressedArrays, right: CompressedArrays,
+                     column_count: int) -> Task:
+        return CalculateSparseRowBand(rows=rows, left=left, right=right, column_count=column_count,
+                                      precision=self._precision)
+
+
+class AggregateSparseResult(ABCAggregateResult):
+    """Aggregates sparse row bands into the matrix of given shape
+
+    The result is :class:`SparseMatrixAdapter` if ``output`` is "sparse" or dense :class:`NDArrayMatrixAdapter`
+    if ``output`` is "dense". Bands carry their rows, so they are aggregated in any order,
+    though they are expected as ``(index, band)`` pairs if ``ordered`` is False
+    """
+    __slots__ = ("_output", "_ordered")
+
+    def __init__(self, output: str = "sparse", ordered: bool = True) -> None:
+        if output not in ("sparse", "dense"):
+            raise ValueError(f"unknown output format {output!r}")
+        self._output = output
+        self._ordered = ordered
+
+    def __call__(self, shape: Tuple[int, int], results: Iterable[SparseBand]) -> ABCMatrix:
+        bands = results if self._ordered else (band for _, band in results)
+        if self._output == "dense":
+            return self._aggregate_dense(shape=shape, bands=bands)
+        return self._aggregate_sparse(shape=shape, bands=bands)
+
+    @staticmethod
+    def _aggregate_dense(shape: Tuple[int, int], bands: Iterable[SparseBand]) -> ABCMatrix:
+        matrix = None
+        for rows, data, indices, indptr in bands:
+            if matrix is None:
+                matrix = np.zeros(shape=shape, dtype=data.dtype)
+            matrix[np.repeat(rows, np.diff(indptr)), indices] = data
+        return NDArrayMatrixAdapter(matrix=matrix if matrix is not None else np.zeros(shape=shape), owned=True)
+
+    @staticmethod
+    def _aggregate_sparse(shape: Tuple[int, int], bands: Iterable[SparseBand]) -> ABCMatrix:
+        bands = list(bands)
+        row_nnz = np.zeros(shape=shape[0], dtype=np.intp)
+        for rows, _, _, indptr in bands:
+            row_nnz[rows] = np.diff(indptr)
+        indptr = np.zeros(shape=shape[0] + 1, dtype=np.intp)
+        np.cumsum(row_nnz, out=indptr[1:])
+        dtype = np.result_type(*[data.dtype for _, data, _, _ in bands]) if bands else np.dtype(float)
+        data, indices = np.empty(shape=indptr[-1], dtype=dtype), np.empty(shape=indptr[-1], dtype=np.intp)
+        for rows, band_data, band_indices, band_indptr in bands:
+            positions = expand_ranges(starts=indptr[rows], counts=np.diff(band_indptr))
+            data[positions], indices[positions] = band_data, band_indices
+        return SparseMatrixAdapter(data=data, indices=indices, indptr=indptr, shape=shape)
@@ -0,0 +1,193 @@
+"""Module for concrete implementations of classes required to multiply large matrices by Strassen's algorithm
+
+Strassen's algorithm splits both operands into quadrants and calculates the product from seven quadrant products
+instead of eight, so it takes about ``n ** 2.81`` operations instead of ``n ** 3``. The price is accuracy.
+The classical product has the componentwise bound ``|C - fl(C)| <= k * u * |A| * |B|``, where ``k`` is the
+inner dimension and ``u`` is the unit roundoff, so every cell is calculated with small relative error.
+Strassen's product has only the normwise bound (Higham, "Accuracy and Stability of Numerical Algorithms", 23.2.2)::
+
+    max|C - fl(C)| <= ((k / k0) ** log2(12) * (k0 ** 2 + 5 * k0) - 5 * k) * u * max|A| * max|B|
+
+where ``k0`` is the size the recursion stops at. Each recursion level multiplies the bound by about 12
+instead of 2, and the error of a cell is bound by the largest elements of the operands rather than by the
+elements it is calculated from, so small cells of badly scaled matrices may lose all their significant digits.
+The recursion threshold should be kept large (the default stops at 512).
+The quadrants are added up, multiplied and combined in the accumulation type of the precision, the product is
+converted to the output type once. Integer matrices are multiplied exactly or not at all: the operands are checked
+for overflow of the accumulation type once, and the kernel checks again the quadrant sums it multiplies.
+The elements of the quadrant sums double on each recursion level, so their products could be ``2 ** level`` times
+larger than the cells of the result and :class:`OverflowError` is raised for them even if the result would fit
+"""
+from __future__ import annotations
+import logging
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from matrix_multiplication.abc.kernel import ABCKernel
+from matrix_multiplication.abc.matrix import ABCMatrix, LeftMultipliableMatrix, RightMultipliableMatrix
+from matrix_multiplication.abc.matrix_multiplication import ABCMultiplyMatrixPair
+from matrix_multiplication.abc.metrics import ABCMetrics
+from matrix_multiplication.abc.task import Task, TaskProcessor
+from matrix_multiplication.kernel import BLASKernel, Precision
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter
+from matrix_multiplication.metrics import NullMetrics
+
+logger = logging.getLogger(__name__)
+
+# operands of a product
+OperandPair = Tuple[np.ndarray, np.ndarray]
+
+
+class CalculateStrassenProduct(Task):
+    """Calculates the product of two matrices by Strassen's algorithm,
+    the recursion falls back to the kernel once any dimension is not greater than ``threshold``
+
+    The operands are expected in the accumulation type of the precision and the product is returned in it,
+    so it could be combined with the other sub-products: the kernel is used without converting the products
+    to the output type
+    """
+    __slots__ = ("_left", "_right", "_threshold", "_kernel", "_precision")
+
+    def __init__(self, left: np.ndarray, right: np.ndarray, threshold: int = 512, kernel: ABCKernel = None,
+                 precision: Precision = None) -> None:
+        self._left = left
+        self._right = right
+        self._threshold = threshold
+        self._kernel = kernel if kernel is not None else BLASKernel()
+        self._precision = precision if precision is not None else Precision()
+
+    def __call__(self) -> np.ndarray:
+        """This command calculates the product of the operands
+
+        Returns:
+            np.ndarray: product matrix
+        """
+
+        return _strassen(left=self._left, right=self._right, threshold=self._threshold,
+                         kernel=self._kernel.accumulating(), dtype=self._precision.accumulate)
+
+
+class StrassenMultiplyMatrixPair(ABCMultiplyMatrixPair):
+    """Multiplies two matrices by Strassen's algorithm
+
+    The top ``depth`` levels of the recursion are unrolled into ``7 ** depth`` sub-products, which are sent to the pool
+    as independent tasks, the workers continue the recursion down to ``threshold`` and use the kernel below it.
+    Odd dimensions are padded with zeros on each level, so any shapes are accepted.
+    The operands are converted to the accumulation type of the precision once, the product to its output type.
+    See the module documentation for the error bounds compared with the classical product
+    """
+    __slots__ = ("_task_processor", "_threshold", "_depth", "_kernel", "_precision", "_ordered", "_metrics")
+
+    def __init__(self, task_processor: TaskProcessor, threshold: int = 512, depth: int = 1, kernel: ABCKernel = None,
+                 precision: Precision = None, ordered: bool = True, metrics: ABCMetrics = None) -> None:
+        if threshold < 1:
+            raise ValueError("recursion threshold must be positive")
+        if depth < 0:
+            raise ValueError("recursion depth must not be negative")
+        self._task_processor = task_processor
+        self._threshold = threshold
+        self._depth = depth
+        self._kernel = kernel
+        self._precision = precision if precision is not None else Precision()
+        self._ordered = ordered
+        self._metrics = metrics if metrics is not None else NullMetrics()
+
+    def __call__(self, matrix1: LeftMultipliableMatrix, matrix2: RightMultipliableMatrix) -> ABCMatrix:
+        start, started = time.time(), time.perf_counter()
+        left = np.asarray(matrix1.get_row_block(0, matrix1.column_len()))
+        right = np.asarray(matrix2.get_column_block(0, matrix2.row_len()))
+        left, right = self._precision.prepare(left=left, right=right)
+        pairs = list()
+        combine = _unroll(left=left, right=right, depth=self._depth, threshold=self._threshold, pairs=pairs,
+                          dtype=self._precision.accumulate)
+        logger.debug("multiplying %s by %s in %d sub-products", left.shape, right.shape, len(pairs))
+        results = self._task_processor(tasks=(self._create_task(left=pair_left, right=pair_right)
+                                              for pair_left, pair_right in pairs))
+        products = dict(enumerate(results) if self._ordered else results)
+        product = combine([products[index] for index in range(len(pairs))])
+        matrix = NDArrayMatrixAdapter(matrix=self._precision.finish(result=product), owned=True)
+        if self._metrics.enabled:
+            self._metrics.record_stage(name="multiply_matrix_pair", start=start, duration=time.perf_counter() - started,
+                                       shape=(left.shape[0], right.shape[1]), tasks=len(pairs))
+        return matrix
+
+    def _create_task(self, left: np.ndarray, right: np.ndarray) -> Task:
+        return CalculateStrassenProduct(left=left, right=right, threshold=self._threshold, kernel=self._kernel,
+                                        precision=self._precision)
+
+
+def strassen(left: np.ndarray, right: np.ndarray, threshold: int = 512, kernel: ABCKernel = None,
+             precision: Precision = None) -> np.ndarray:
+    """Calculates the product of two matrices by Strassen's algorithm in the current process
+    """
+    precision = precision if precision is not None else Precision()
+    left, right = precision.prepare(left=left, right=right)
+    kernel = kernel if kernel is not None else BLASKernel()
+    product = _strassen(left=left, right=right, threshold=threshold, kernel=kernel.accumulating(),
+                        dtype=precision.accumulate)
+    return precision.finish(result=product)
+
+
+def _strassen(left: np.ndarray, right: np.ndarray, threshold: int, kernel: ABCKernel, dtype: np.dtype) -> np.ndarray:
+    # the operands are already converted to the accumulation type
+    if min(left.shape[0], left.shape[1], right.shape[1]) <= threshold:
+        return kernel(left, right)
+    shape = (left.shape[0], right.shape[1])
+    products = [_strassen(left=pair_left, right=pair_right, threshold=threshold, kernel=kernel, dtype=dtype)
+                for pair_left, pair_right in _split(left=left, right=right)]
+    return _combine(products=products, shape=shape, dtype=dtype)
+
+
+def _unroll(left: np.ndarray, right: np.ndarray, depth: int, threshold: int, pairs: List[OperandPair],
+            dtype: np.dtype = None) -> Callable[[List[np.ndarray]], np.ndarray]:
+    # appends the operands of the sub-products to pairs and returns the function assembling the product from theirs
+    if depth == 0 or min(left.shape[0], left.shape[1], right.shape[1]) <= threshold:
+        index = len(pairs)
+        pairs.append((left, right))
+        return lambda products: products[index]
+    shape = (left.shape[0], right.shape[1])
+    combines = [_unroll(left=pair_left, right=pair_right, depth=depth - 1, threshold=threshold, pairs=pairs,
+                        dtype=dtype) for pair_left, pair_right in _split(left=left, right=right)]
+    return lambda products: _combine(products=[combine(products) for combine in combines], shape=shape, dtype=dtype)
+
+
+def _split(left: np.ndarray, right: np.ndarray) -> List[OperandPair]:
+    """Returns the operands of the seven quadrant products of Strassen's algorithm
+    """
+    a11, a12, a21, a22 = _quadrants(array=_pad(array=left))
+    b11, b12, b21, b22 = _quadrants(array=_pad(array=right))
+    return [(a11 + a22, b11 + b22), (a21 + a22, b11), (a11, b12 - b22), (a22, b21 - b11),
+            (a11 + a12, b22), (a21 - a11, b11 + b12), (a12 - a22, b21 + b22)]
+
+
+def _combine(products: List[np.ndarray], shape: Tuple[int, int], dtype: np.dtype = None) -> np.ndarray:
+    """Assembles the product of the given shape from the seven quadrant products, the padding is cut off
+
+    The products are added up in the given type (the type of the products if None)
+    """
+    dtype = dtype if dtype is not None else np.result_type(*products)
+    m1, m2, m3, m4, m5, m6, m7 = (product.astype(dtype, copy=False) for product in products)
+    rows, columns = m1.shape
+    result = np.empty(shape=(2 * rows, 2 * columns), dtype=dtype)
+    result[:rows, :columns] = m1 + m4 - m5 + m7
+    result[:rows, columns:] = m3 + m5
+    result[rows:, :columns] = m2 + m4
+    result[rows:, columns:] = m1 - m2 + m3 + m6
+    return result[:shape[0], :shape[1]]
+
+
+def _pad(array: np.ndarray) -> np.ndarray:
+    # odd dimensions get a row or a column of zeros
+    shape = (array.shape[0] + array.shape[0] % 2, array.shape[1] + array.shape[1] % 2)
+    if shape == array.shape:
+        return array
+    padded = np.zeros(shape=shape, dtype=array.dtype)
+    padded[:array.shape[0], :array.shape[1]] = array
+    return padded
+
+
+def _quadrants(array: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    rows, columns = array.shape[0] // 2, array.shape[1] // 2
+    return array[:rows, :columns], array[:rows, columns:], array[rows:, :columns], array[rows:, columns:]
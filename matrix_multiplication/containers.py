@@ -1,28 +1,216 @@
 """Module with IoC containers for commands building
 """
 from __future__ import annotations
+import concurrent.futures
+
 import numpy
 from dependency_injector import containers, providers
 
 from matrix_multiplication.abc import ABCMatrix
-from matrix_multiplication.task import MultiprocessTaskProcessor
+from matrix_multiplication.kernel import PythonKernel, NumpyKernel, BLASKernel, Precision
+from matrix_multiplication.metrics import NullMetrics, RecordingMetrics
+from matrix_multiplication.task import (
+    MultiprocessTaskProcessor, StreamingTaskProcessor, ThreadPoolTaskProcessor, AsyncMultiprocessTaskProcessor)
 from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter
 from matrix_multiplication.commands.matrix_multiplication import (
-    CalculateCell, BuildTasks, AggregateResult, TaskManager, MultiplyMatrixPair, MultiplyMatrixSequence, ValidateMatrixPair, ValidateMatrixSequence)
+    CalculateCell, BuildTasks, BuildBlockTasks, BuildSharedBlockTasks, AggregateResult, AggregateBlockResult, TaskManager,
+    MultiplyMatrixPair, SharedMemoryMultiplyMatrixPair, MultiplyMatrixSequence, ValidateMatrixPair, ValidateMatrixSequence)
+from matrix_multiplication.commands.asynchronous import (
+    AsyncMultiplyMatrixPair, AsyncExecutePlan, AsyncMultiplyMatrixSequence)
+from matrix_multiplication.commands.out_of_core import MemmapMultiplyMatrixPair
+from matrix_multiplication.commands.sparse import BuildSparseTasks, AggregateSparseResult
+from matrix_multiplication.commands.dispatching import AdaptiveMultiplyMatrixPair, load_cost_model, pool_size
+from matrix_multiplication.commands.strassen import StrassenMultiplyMatrixPair
+from matrix_multiplication.commands.batching import BuildBatchTasks, MultiplyMatrixBatch
+from matrix_multiplication.commands.caching import ProductCache, CachedMultiplyMatrixPair, AsyncCachedMultiplyMatrixPair
+from matrix_multiplication.commands.precision import PrecisionMultiplyMatrixPair, AsyncPrecisionMultiplyMatrixPair
+from matrix_multiplication.commands.planning import PlanMatrixChain, LeftToRightPlanMatrixChain, PlanMatrixSequence
+from matrix_multiplication.commands.scheduling import ExecutePlan, ConcurrentExecutePlan
+
+
+def _unsupported(message: str) -> None:
+    raise ValueError(message)
 
 
 class MatrixMultiplicationCommandsContainer(containers.DeclarativeContainer):
-    build_tasks = providers.Factory(BuildTasks)
-    aggregate_result = providers.Factory(AggregateResult)
+    # granularity selects the kind of tasks sent to the workers:
+    # "cell" - one task per result matrix cell, "block" - one task per result matrix tile,
+    # "sparse" - one task per band of the first matrix rows holding about band_nnz non-zeros, empty rows are skipped;
+    # sparse_output selects the format of the sparse product: "sparse" or "dense"
+    # transport selects the way the operands are sent to the workers:
+    # "pickle" - each task carries its own copy of the data, "shared_memory" - operands are placed in shared memory once,
+    # "memmap" - operands and the result are placed in memory-mapped files in memmap_directory (system temporary directory if None)
+    # cell_kernel and block_kernel select the kernels ("python", "numpy" or "blas") used by cell and tile tasks
+    # precision selects the data types of the multiplication: "native" - the types of the operands,
+    # "float32" - float32 operands and products, "mixed" - float32 operands and products summed up in float64,
+    # "float64" - float64 operands and products, "integer" - integer operands summed up in int64 checked for overflow
+    # chain_order selects the order of matrix chain multiplication: "optimal" or "left_to_right"
+    # scheduling selects the way independent sub-products of the chain are evaluated:
+    # "sequential" - one after another, "concurrent" - all ready sub-products at the same time
+    # processing selects the way tasks are submitted to the pool: "batch" - all at once,
+    # "streaming" - lazily, with at most max_in_flight tasks submitted and not collected yet,
+    # "threads" - lazily to a pool of threads of the current process (threads workers), tasks are not pickled
+    # ordered selects whether results are collected in task order (True) or as soon as they are ready (False)
+    # pair_cache enables ("enabled") the cache of matrix pair products shared by all the commands of the container,
+    # the cache keeps at most pair_cache_max_bytes of products
+    # execution selects the way each matrix pair product is evaluated: "pool" - by the pool of workers with the configured
+    # transport and granularity, "adaptive" - inline, by a pool of threads or by the pool of workers with the tile size
+    # chosen from the shapes by the cost model; the cost model is loaded from cost_model_path (calibrated and saved there
+    # if the file does not exist, calibrated on each start if the path is None), processes and threads are the numbers
+    # of workers in the pools (the number of workers of the pool and the number of CPUs if None), the pool of threads
+    # is started once and shared by all the products, "strassen" - by Strassen's algorithm, the top strassen_depth
+    # levels of the recursion are sent to the pool as 7 ** strassen_depth tasks, the workers use block_kernel once
+    # any dimension is not greater than strassen_threshold
+    # memory_budget rejects the sequences which products would hold more than memory_budget bytes at once (no limit if None)
+    # before anything is sent to the workers, the products of independent sub-products are summed up unless scheduling
+    # is "sequential"
+    # batch_cost bounds the estimated number of operations of the chains packed into one task by the batch multiplication
+    # the asyncio front end sends the operands along with the tasks, so it supports "pickle" transport and "pool" execution
+    # only, building its commands with other values raises ValueError
+    # metrics selects the instrumentation of the pipeline: "disabled" or "recording",
+    # the recorded metrics are available as the metrics provider singleton
+    config = providers.Configuration(default={
+        "granularity": "block", "tile_size": 64, "transport": "pickle", "cell_kernel": "numpy", "block_kernel": "blas", "precision": "native",
+        "chain_order": "optimal", "scheduling": "concurrent", "max_concurrent_products": None,
+        "processing": "streaming", "max_in_flight": 256, "ordered": True, "pair_cache": "disabled", "pair_cache_max_bytes": 256 * 1024 * 1024,
+        "band_nnz": 4096, "sparse_output": "sparse", "memmap_directory": None,
+        "batch_cost": 1 << 22, "execution": "pool", "cost_model_path": None, "processes": None, "threads": None,
+        "strassen_threshold": 512, "strassen_depth": 1, "memory_budget": None,
+        "metrics": "disabled"})
+
+    # pool of workers the tasks are processed by
+    pool = providers.Dependency()
+
+    metrics = providers.Selector(
+        config.metrics,
+        disabled=providers.Singleton(NullMetrics),
+        recording=providers.Singleton(RecordingMetrics))
+
+    # kernels depend on the configured precision, so they are not singletons
+    precision = providers.Factory(Precision.from_mode, mode=config.precision)
+    python_kernel = providers.Factory(PythonKernel, precision=precision)
+    numpy_kernel = providers.Factory(NumpyKernel, precision=precision)
+    blas_kernel = providers.Factory(BLASKernel, precision=precision)
+    cell_kernel = providers.Selector(
+        config.cell_kernel, python=python_kernel, numpy=numpy_kernel, blas=blas_kernel)
+    block_kernel = providers.Selector(
+        config.block_kernel, python=python_kernel, numpy=numpy_kernel, blas=blas_kernel)
+
+    build_tasks = providers.Selector(
+        config.granularity,
+        cell=providers.Factory(BuildTasks, kernel=cell_kernel),
+        block=providers.Factory(BuildBlockTasks, tile_size=config.tile_size, kernel=block_kernel),
+        sparse=providers.Factory(BuildSparseTasks, band_nnz=config.band_nnz, precision=precision))
+    aggregate_result = providers.Selector(
+        config.granularity,
+        cell=providers.Factory(AggregateResult, ordered=config.ordered),
+        block=providers.Factory(AggregateBlockResult, tile_size=config.tile_size, ordered=config.ordered),
+        sparse=providers.Factory(AggregateSparseResult, output=config.sparse_output, ordered=config.ordered))
     task_manager = providers.Factory(
         TaskManager, build_tasks=build_tasks, aggregate_result=aggregate_result)
 
-    task_processor = providers.Factory(MultiprocessTaskProcessor)
+    task_processor = providers.Selector(
+        config.processing,
+        batch=providers.Factory(MultiprocessTaskProcessor, pool=pool, ordered=config.ordered, metrics=metrics),
+        streaming=providers.Factory(
+            StreamingTaskProcessor, pool=pool, window=config.max_in_flight, ordered=config.ordered, metrics=metrics),
+        threads=providers.Factory(
+            ThreadPoolTaskProcessor, max_workers=config.threads, window=config.max_in_flight, ordered=config.ordered,
+            metrics=metrics))
 
+    pool_multiply_matrix_pair = providers.Selector(
+        config.transport,
+        pickle=providers.Factory(
+            MultiplyMatrixPair, task_manager=task_manager, task_processor=task_processor, metrics=metrics),
+        shared_memory=providers.Factory(
+            SharedMemoryMultiplyMatrixPair,
+            build_tasks=providers.Factory(BuildSharedBlockTasks, tile_size=config.tile_size, kernel=block_kernel),
+            task_processor=task_processor, precision=precision, metrics=metrics),
+        memmap=providers.Factory(
+            MemmapMultiplyMatrixPair,
+            build_tasks=providers.Factory(BuildSharedBlockTasks, tile_size=config.tile_size, kernel=block_kernel),
+            task_processor=task_processor, directory=config.memmap_directory, precision=precision, metrics=metrics))
+    processes = providers.Callable(pool_size, pool=pool, processes=config.processes)
+    cost_model = providers.Singleton(
+        load_cost_model, pool=pool, path=config.cost_model_path, processes=processes, threads=config.threads)
+    thread_pool = providers.Singleton(concurrent.futures.ThreadPoolExecutor, max_workers=config.threads)
+    thread_task_processor = providers.Singleton(
+        ThreadPoolTaskProcessor, executor=thread_pool, window=config.max_in_flight, metrics=metrics)
+    uncached_multiply_matrix_pair = providers.Selector(
+        config.execution,
+        pool=pool_multiply_matrix_pair,
+        adaptive=providers.Factory(
+            AdaptiveMultiplyMatrixPair, cost_model=cost_model, task_processor=task_processor,
+            processes=processes, threads=config.threads, kernel=block_kernel, ordered=config.ordered,
+            metrics=metrics, thread_task_processor=thread_task_processor),
+        strassen=providers.Factory(
+            StrassenMultiplyMatrixPair, task_processor=task_processor, threshold=config.strassen_threshold,
+            depth=config.strassen_depth, kernel=block_kernel, precision=precision, ordered=config.ordered,
+            metrics=metrics))
+    product_cache = providers.Singleton(ProductCache, max_bytes=config.pair_cache_max_bytes)
+    cached_multiply_matrix_pair = providers.Selector(
+        config.pair_cache,
+        disabled=uncached_multiply_matrix_pair,
+        enabled=providers.Factory(
+            CachedMultiplyMatrixPair, multiply_matrix_pair=uncached_multiply_matrix_pair, cache=product_cache))
     multiply_matrix_pair = providers.Factory(
-        MultiplyMatrixPair, task_manager=task_manager, task_processor=task_processor)
+        PrecisionMultiplyMatrixPair, multiply_matrix_pair=cached_multiply_matrix_pair, precision=precision,
+        directory=config.memmap_directory)
+    plan_matrix_chain = providers.Selector(
+        config.chain_order,
+        optimal=providers.Factory(PlanMatrixChain),
+        left_to_right=providers.Factory(LeftToRightPlanMatrixChain))
+    execute_plan = providers.Selector(
+        config.scheduling,
+        sequential=providers.Factory(ExecutePlan, multiply_matrix_pair=multiply_matrix_pair),
+        concurrent=providers.Factory(
+            ConcurrentExecutePlan, multiply_matrix_pair=multiply_matrix_pair, max_workers=config.max_concurrent_products))
     multiply_matrix_sequence = providers.Factory(
-        MultiplyMatrixSequence, multiply_matrix_pair=multiply_matrix_pair)
+        MultiplyMatrixSequence, multiply_matrix_pair=multiply_matrix_pair, plan_matrix_chain=plan_matrix_chain,
+        execute_plan=execute_plan)
+
+    # asyncio front end, operands are always sent along with the tasks
+    async_task_processor = providers.Factory(AsyncMultiprocessTaskProcessor, pool=pool, ordered=config.ordered)
+    async_pool_multiply_matrix_pair = providers.Selector(
+        config.transport,
+        pickle=providers.Factory(AsyncMultiplyMatrixPair, task_manager=task_manager, task_processor=async_task_processor),
+        shared_memory=providers.Callable(
+            _unsupported, message="asyncio front end does not support \"shared_memory\" transport, use \"pickle\""),
+        memmap=providers.Callable(
+            _unsupported, message="asyncio front end does not support \"memmap\" transport, use \"pickle\""))
+    uncached_async_multiply_matrix_pair = providers.Selector(
+        config.execution,
+        pool=async_pool_multiply_matrix_pair,
+        adaptive=providers.Callable(
+            _unsupported, message="asyncio front end does not support \"adaptive\" execution, use \"pool\""),
+        strassen=providers.Callable(
+            _unsupported, message="asyncio front end does not support \"strassen\" execution, use \"pool\""))
+    cached_async_multiply_matrix_pair = providers.Selector(
+        config.pair_cache,
+        disabled=uncached_async_multiply_matrix_pair,
+        enabled=providers.Factory(
+            AsyncCachedMultiplyMatrixPair, multiply_matrix_pair=uncached_async_multiply_matrix_pair, cache=product_cache))
+    async_multiply_matrix_pair = providers.Factory(
+        AsyncPrecisionMultiplyMatrixPair, multiply_matrix_pair=cached_async_multiply_matrix_pair, precision=precision,
+        directory=config.memmap_directory)
+    async_execute_plan = providers.Factory(AsyncExecutePlan, multiply_matrix_pair=async_multiply_matrix_pair)
+    async_multiply_matrix_sequence = providers.Factory(
+        AsyncMultiplyMatrixSequence, plan_matrix_chain=plan_matrix_chain, execute_plan=async_execute_plan)
+    # independent sub-products are always awaited at the same time
+    async_plan_matrix_sequence = providers.Factory(
+        PlanMatrixSequence, plan_matrix_chain=plan_matrix_chain, memory_budget=config.memory_budget,
+        scheduling="concurrent", precision=precision)
+
+    # many independent chains, small products are packed into shared tasks
+    multiply_matrix_batch = providers.Factory(
+        MultiplyMatrixBatch,
+        build_tasks=providers.Factory(
+            BuildBatchTasks, batch_cost=config.batch_cost, kernel=block_kernel, precision=precision),
+        task_processor=task_processor, ordered=config.ordered)
+
+    plan_matrix_sequence = providers.Factory(
+        PlanMatrixSequence, plan_matrix_chain=plan_matrix_chain, memory_budget=config.memory_budget,
+        scheduling=config.scheduling, precision=precision)
 
     validate_matrix_pair = providers.Factory(ValidateMatrixPair)
     validate_matrix_sequence = providers.Factory(
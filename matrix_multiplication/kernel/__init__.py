@@ -0,0 +1,4 @@
+from .kernels import PythonKernel, NumpyKernel, BLASKernel
+from .precision import Precision, PRECISION_MODES
+
+__all__ = ["PythonKernel", "NumpyKernel", "BLASKernel", "Precision", "PRECISION_MODES"]
@@ -0,0 +1,80 @@
+"""Module with concrete implementations of computational kernels
+"""
+from __future__ import annotations
+import functools
+from typing import Any, Iterable, Union
+
+import numpy
+
+from matrix_multiplication.abc.kernel import ABCKernel
+from matrix_multiplication.kernel.precision import Precision
+
+
+class PythonKernel(ABCKernel):
+    """Reference kernel computing dot products with plain python arithmetic
+
+    The products are summed up in the type of the elements (the accumulation type of the precision)
+    """
+    __slots__ = ("_precision",)
+
+    def __init__(self, precision: Precision = None) -> None:
+        self._precision = precision if precision is not None else Precision()
+
+    def accumulating(self) -> PythonKernel:
+        return PythonKernel(precision=self._precision.accumulating())
+
+    def __call__(self, left: Any, right: Any) -> Union[float, numpy.ndarray]:
+        left, right = self._precision.prepare(left, right)
+        if numpy.ndim(left) == 1:
+            return self._precision.finish(self._dot(row=left, column=right))
+        row_count, column_count = numpy.shape(left)[0], numpy.shape(right)[1]
+        columns = [[row[index] for row in right] for index in range(column_count)]
+        tile = numpy.array([[self._dot(row=row, column=column) for column in columns] for row in left])
+        return self._precision.finish(tile.reshape((row_count, column_count)))
+
+    @staticmethod
+    def _dot(row: Iterable[float], column: Iterable[float]) -> float:
+        return functools.reduce(
+            lambda previous_sum, value_pair: value_pair[0] * value_pair[1] + previous_sum, zip(row, column), 0)
+
+
+class NumpyKernel(ABCKernel):
+    """Kernel computing products with :func:`numpy.dot`
+    """
+    __slots__ = ("_precision",)
+
+    def __init__(self, precision: Precision = None) -> None:
+        self._precision = precision if precision is not None else Precision()
+
+    def accumulating(self) -> NumpyKernel:
+        return NumpyKernel(precision=self._precision.accumulating())
+
+    def __call__(self, left: Any, right: Any) -> Union[float, numpy.ndarray]:
+        left, right = self._precision.prepare(left, right)
+        return self._precision.finish(numpy.dot(left, right))
+
+
+class BLASKernel(ABCKernel):
+    """Block kernel computing products with BLAS gemm routine via :func:`numpy.matmul`
+
+    Operands are made contiguous first, because BLAS could not be used for arbitrary strided views.
+    BLAS is used for float32 and float64 accumulation only, integers are multiplied by numpy loops
+    """
+    __slots__ = ("_precision",)
+
+    def __init__(self, precision: Precision = None) -> None:
+        self._precision = precision if precision is not None else Precision()
+
+    def accumulating(self) -> BLASKernel:
+        return BLASKernel(precision=self._precision.accumulating())
+
+    def __call__(self, left: Any, right: Any) -> Union[float, numpy.ndarray]:
+        left, right = self._precision.prepare(self._contiguous(array=left), self._contiguous(array=right))
+        return self._precision.finish(numpy.matmul(left, right))
+
+    @staticmethod
+    def _contiguous(array: Any) -> numpy.ndarray:
+        array = numpy.asarray(array)
+        if array.flags.c_contiguous or array.flags.f_contiguous:
+            return array
+        return numpy.ascontiguousarray(array)
@@ -0,0 +1,109 @@
+"""Module with the data types the matrices are multiplied in
+"""
+from __future__ import annotations
+from typing import Any, Optional, Tuple
+
+import numpy
+
+# compute, accumulate and output data types of the named precisions
+PRECISION_MODES = {
+    # the types of the operands are kept
+    "native": (None, None, None),
+    # half of the memory and of the data sent to the workers
+    "float32": ("float32", "float32", "float32"),
+    # float32 operands and products, the products are summed up in float64
+    "mixed": ("float32", "float64", "float32"),
+    "float64": ("float64", "float64", "float64"),
+    # integer operands of any width, the products are summed up in int64 checked for overflow
+    "integer": (None, "int64", "int64"),
+}
+
+
+class Precision(object):
+    """Data types the matrices are multiplied in
+
+    The operands are converted to ``compute`` type before they are sent to the workers, the kernels sum the products
+    up in ``accumulate`` type and convert them to ``output`` type, so the product keeps it through the rest
+    of the pipeline. None keeps the type of the operands (``output`` follows ``accumulate``).
+    Integer accumulation accepts integer operands only and raises :class:`OverflowError` before the product is
+    calculated if the largest possible sum does not fit the accumulation type
+    """
+    __slots__ = ("_compute", "_accumulate", "_output")
+
+    def __init__(self, compute: Any = None, accumulate: Any = None, output: Any = None) -> None:
+        self._compute = numpy.dtype(compute) if compute is not None else None
+        self._accumulate = numpy.dtype(accumulate) if accumulate is not None else None
+        self._output = numpy.dtype(output) if output is not None else self._accumulate
+
+    @classmethod
+    def from_mode(cls, mode: str) -> Precision:
+        if mode not in PRECISION_MODES:
+            raise ValueError(f"unknown precision mode {mode!r}")
+        compute, accumulate, output = PRECISION_MODES[mode]
+        return cls(compute=compute, accumulate=accumulate, output=output)
+
+    @property
+    def compute(self) -> Optional[numpy.dtype]:
+        return self._compute
+
+    @property
+    def accumulate(self) -> Optional[numpy.dtype]:
+        return self._accumulate
+
+    @property
+    def output(self) -> Optional[numpy.dtype]:
+        return self._output
+
+    @property
+    def native(self) -> bool:
+        return self._compute is None and self._accumulate is None and self._output is None
+
+    def accumulating(self) -> Precision:
+        """Returns the precision keeping the products in the accumulation type
+        """
+        return Precision(compute=self._compute, accumulate=self._accumulate)
+
+    def operand_dtype(self, dtype: numpy.dtype) -> numpy.dtype:
+        """Returns the type the operand of the given type is sent to the workers in
+        """
+        self._check_operand(dtype=numpy.dtype(dtype))
+        return self._compute if self._compute is not None else numpy.dtype(dtype)
+
+    def product_dtype(self, *dtypes: numpy.dtype) -> numpy.dtype:
+        """Returns the type of the product of the operands of the given types
+        """
+        return self._output if self._output is not None else numpy.result_type(*dtypes)
+
+    def prepare(self, left: Any, right: Any) -> Tuple[Any, Any]:
+        """Converts the operands of the kernel to the accumulation type
+        """
+        if self._accumulate is None:
+            return left, right
+        left, right = numpy.asarray(left), numpy.asarray(right)
+        self._check_operand(dtype=left.dtype)
+        self._check_operand(dtype=right.dtype)
+        if self._accumulate.kind == "i" and left.size and right.size:
+            self._check_overflow(left=left, right=right)
+        return left.astype(self._accumulate, copy=False), right.astype(self._accumulate, copy=False)
+
+    def finish(self, result: Any) -> Any:
+        """Converts the result of the kernel to the output type
+        """
+        if self._output is None:
+            return result
+        # indexing by the empty tuple turns zero-dimensional arrays (cells) into scalars and keeps the rest
+        return numpy.asarray(result).astype(self._output, copy=False)[()]
+
+    def _check_operand(self, dtype: numpy.dtype) -> None:
+        if self._accumulate is not None and self._accumulate.kind == "i" and dtype.kind not in "biu":
+            raise ValueError(f"integer precision could not multiply matrices of {dtype} type")
+
+    def _check_overflow(self, left: numpy.ndarray, right: numpy.ndarray) -> None:
+        # python integers never overflow, so the bound itself is exact
+        left_bound = max(abs(int(left.min())), abs(int(left.max())))
+        right_bound = max(abs(int(right.min())), abs(int(right.max())))
+        if left_bound * right_bound * left.shape[-1] > numpy.iinfo(self._accumulate).max:
+            raise OverflowError(f"the product could overflow {self._accumulate} accumulation")
+
+    def __repr__(self) -> str:
+        return f"Precision(compute={self._compute!r}, accumulate={self._accumulate!r}, output={self._output!r})"
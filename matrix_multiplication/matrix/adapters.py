@@ -1,7 +1,7 @@
 """Module with matrix adapters
 """
 from __future__ import annotations
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import numpy
 
@@ -17,28 +17,48 @@ def to_ndarray(matrix: ABCMatrix) -> numpy.ndarray:
     Returns:
         numpy.ndarray: Converted object
     """
-    rows = list()
-    for i in range(0, matrix.column_len()):
-        row = matrix.get_row(i)
-        rows.append(row)
-    return numpy.array(rows)
+    return numpy.array(matrix.get_row_block(0, matrix.column_len()))
 
 
 class NDArrayMatrixAdapter(ABCMutableMatrix):
     """Adapts numpy.ndarray object to ABCMatrix interface
+
+    The given array is wrapped by reference, so its in-place changes are seen through the adapter.
+    If the array is ``owned`` by the adapter (nobody else changes it), the columns are read from a column-major copy
+    made on the first column access and the rows are read-only views, so the copy could not become stale
     """
-    __slots__ = ("_matrix",)
+    __slots__ = ("_matrix", "_buffer", "_columns", "_owned")
+
+    # the smallest number of rows allocated when the matrix grows
+    _MIN_CAPACITY = 16
 
-    def __init__(self, matrix: numpy.ndarray) -> None:
+    def __init__(self, matrix: numpy.ndarray, owned: bool = False) -> None:
         if matrix.ndim != 2:
             raise ValueError("the given object is not a matrix")
         self._matrix = matrix
+        # rows are appended into the spare capacity of the buffer, the matrix is a view of its filled part;
+        # the given array is never written, the buffer is reallocated on the first append
+        self._buffer = matrix
+        # column-major copy of the matrix made on the first column access, so the columns are contiguous;
+        # it is dropped when the matrix is changed through the adapter, so it is kept for owned arrays only
+        self._columns = None
+        self._owned = owned
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        return self._matrix.dtype
 
     def get_row(self, index: int) -> numpy.ndarray:
-        return self._matrix[index, :]
+        return self._row_view(self._matrix[index, :])
 
     def get_column(self, index: int) -> numpy.ndarray:
-        return self._matrix[:, index]
+        return self._column_major()[:, index]
+
+    def get_row_block(self, start: int, stop: int) -> numpy.ndarray:
+        return self._row_view(self._matrix[start:stop, :])
+
+    def get_column_block(self, start: int, stop: int) -> numpy.ndarray:
+        return self._column_major()[:, start:stop]
 
     def row_len(self) -> int:
         return self._matrix.shape[1]
@@ -46,8 +66,66 @@ class NDArrayMatrixAdapter(ABCMutableMatrix):
     def column_len(self) -> int:
         return self._matrix.shape[0]
 
+    def itemsize(self) -> int:
+        return self._matrix.dtype.itemsize
+
     def append(self, row: List[float]) -> None:
-        self._matrix = numpy.append(self._matrix, row)
+        """Appends the row to the matrix, amortized O(row length)
+        """
+        row = numpy.asarray(row)
+        if row.ndim != 1:
+            raise ValueError("the given object is not a row")
+        self.extend(rows=row.reshape((1, -1)))
+
+    def extend(self, rows: Iterable[List[float]]) -> None:
+        """Appends the rows to the matrix, the buffer grows geometrically so building the matrix row by row is linear
+
+        Any iterable of rows is accepted (a generator is read once), appending no rows changes nothing
+        """
+        if not isinstance(rows, numpy.ndarray):
+            rows = list(rows)
+            if not rows:
+                return
+            rows = numpy.array(rows, ndmin=2)
+        if rows.ndim != 2:
+            raise ValueError("the given object is not a sequence of rows")
+        row_count = self._matrix.shape[0]
+        if row_count != 0 and rows.shape[1] != self._matrix.shape[1]:
+            raise ValueError("the given rows length does not match the matrix row length")
+        self._reserve(row_count=row_count + rows.shape[0], column_count=rows.shape[1],
+                      dtype=numpy.result_type(self._matrix.dtype, rows.dtype))
+        self._buffer[row_count:row_count + rows.shape[0]] = rows
+        self._matrix = self._buffer[:row_count + rows.shape[0]]
+        self._columns = None
 
     def reshape(self, new_shape: Tuple[int, int]) -> None:
         self._matrix = self._matrix.reshape(new_shape)
+        self._buffer = self._matrix
+        self._columns = None
+
+    def _row_view(self, view: numpy.ndarray) -> numpy.ndarray:
+        if self._owned:
+            # writing through the view would not reach the column-major copy
+            view.flags.writeable = False
+        return view
+
+    def _column_major(self) -> numpy.ndarray:
+        if not self._owned:
+            # the array could be changed by its holder, so the columns are live views
+            return self._matrix
+        if self._columns is None:
+            self._columns = numpy.asfortranarray(self._matrix)
+        return self._columns
+
+    def _reserve(self, row_count: int, column_count: int, dtype: numpy.dtype) -> None:
+        buffer = self._buffer
+        if buffer is not self._matrix and buffer.shape[0] >= row_count and buffer.shape[1] == column_count and buffer.dtype == dtype:
+            return
+        capacity = max(row_count, 2 * self._matrix.shape[0], self._MIN_CAPACITY)
+        row_count = self._matrix.shape[0]
+        self._buffer = numpy.empty(shape=(capacity, column_count), dtype=dtype)
+        # the buffer is allocated by the adapter, so nobody else changes it
+        self._owned = True
+        if row_count != 0:
+            self._buffer[:row_count] = self._matrix
+        self._matrix = self._buffer[:row_count]
@@ -0,0 +1,199 @@
+"""Module with matrices placed in memory-mapped files
+"""
+from __future__ import annotations
+import os
+import tempfile
+import weakref
+from typing import Tuple
+
+import numpy
+
+from matrix_multiplication.abc.matrix import ABCMatrix
+from matrix_multiplication.abc.storage import ABCArrayReference
+
+# the largest amount of data held in memory while a matrix is copied to a file
+_COPY_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+class MemmapArrayReference(ABCArrayReference):
+    """Reference to the array placed in a file, the file is mapped into memory of the process opening the reference
+    """
+    __slots__ = ("_path", "_shape", "_dtype", "_offset", "_order", "_mode")
+
+    def __init__(self, path: str, shape: Tuple[int, int], dtype: str, offset: int = 0, order: str = "C",
+                 mode: str = "r") -> None:
+        self._path = os.fspath(path)
+        self._shape = tuple(shape)
+        self._dtype = dtype
+        self._offset = offset
+        self._order = order
+        self._mode = mode
+
+    def __getstate__(self):
+        return (self._path, self._shape, self._dtype, self._offset, self._order, self._mode)
+
+    def __setstate__(self, state) -> None:
+        self._path, self._shape, self._dtype, self._offset, self._order, self._mode = state
+
+    def open(self) -> numpy.memmap:
+        """Maps the file into memory, the data is read from the disk only when it is accessed
+        """
+        return numpy.memmap(self._path, dtype=self._dtype, mode=self._mode, offset=self._offset, shape=self._shape,
+                            order=self._order)
+
+    def shape(self) -> Tuple[int, int]:
+        return self._shape
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def order(self) -> str:
+        return self._order
+
+    def moved(self, path: str) -> MemmapArrayReference:
+        """Returns the reference to the same array placed in the file at the given path
+        """
+        return MemmapArrayReference(path=path, shape=self._shape, dtype=self._dtype, offset=self._offset,
+                                    order=self._order, mode=self._mode)
+
+
+class MemmapMatrixAdapter(ABCMatrix):
+    """Adapts the matrix placed in a memory-mapped ``.npy`` or raw file to ABCMatrix interface
+
+    Workers open the file by path, so the matrix is never sent to them.
+    The file of a temporary matrix is removed when the adapter is released or garbage collected
+    """
+    __slots__ = ("_array", "_reference", "_finalizer")
+
+    def __init__(self, reference: MemmapArrayReference, temporary: bool = False) -> None:
+        array = reference.open()
+        if array.ndim != 2:
+            raise ValueError("the given object is not a matrix")
+        self._array = array
+        self._reference = reference
+        self._finalizer = weakref.finalize(self, os.remove, reference.path) if temporary else None
+
+    @classmethod
+    def open(cls, path: str, shape: Tuple[int, int] = None, dtype: numpy.dtype = None, offset: int = 0,
+             order: str = "C", writable: bool = False) -> MemmapMatrixAdapter:
+        """Opens the matrix file, the shape and the dtype are read from the header of ``.npy`` file
+        and must be given for raw files
+        """
+        mode = "r+" if writable else "r"
+        if shape is None:
+            array = numpy.load(path, mmap_mode=mode)
+            if not isinstance(array, numpy.memmap):
+                raise ValueError("the given file is not a .npy file")
+            return cls(reference=_reference(array=array, path=path, mode=mode))
+        if dtype is None:
+            raise ValueError("the dtype of the raw file must be given along with the shape")
+        return cls(reference=MemmapArrayReference(
+            path=path, shape=shape, dtype=numpy.dtype(dtype).str, offset=offset, order=order, mode=mode))
+
+    @classmethod
+    def create(cls, path: str, shape: Tuple[int, int], dtype: numpy.dtype, order: str = "C",
+               temporary: bool = False) -> MemmapMatrixAdapter:
+        """Creates writable ``.npy`` file of the given shape
+        """
+        array = numpy.lib.format.open_memmap(
+            path, mode="w+", dtype=numpy.dtype(dtype), shape=tuple(shape), fortran_order=order == "F")
+        return cls(reference=_reference(array=array, path=path, mode="r+"), temporary=temporary)
+
+    @classmethod
+    def from_matrix(cls, matrix: ABCMatrix, path: str, order: str = "C", temporary: bool = False,
+                    dtype: numpy.dtype = None) -> MemmapMatrixAdapter:
+        """Copies the matrix to ``.npy`` file block by block, so the matrix is never held in memory as a whole
+
+        Rows are copied to C-ordered files and columns to Fortran-ordered files, so the writes are sequential.
+        The blocks are converted to ``dtype`` while they are copied (the type of the matrix is kept if None)
+        """
+        row_count, column_count = matrix.column_len(), matrix.row_len()
+        if dtype is None:
+            dtype = numpy.asarray(matrix.get_row_block(0, min(1, row_count))).dtype
+        dtype = numpy.dtype(dtype)
+        mapped = cls.create(path=path, shape=(row_count, column_count), dtype=dtype, order=order, temporary=temporary)
+        item_count = max(_COPY_CHUNK_BYTES // max(dtype.itemsize, 1), 1)
+        if order == "F":
+            step = max(item_count // max(row_count, 1), 1)
+            for start in range(0, column_count, step):
+                stop = min(start + step, column_count)
+                mapped._array[:, start:stop] = matrix.get_column_block(start, stop)
+        else:
+            step = max(item_count // max(column_count, 1), 1)
+            for start in range(0, row_count, step):
+                stop = min(start + step, row_count)
+                mapped._array[start:stop, :] = matrix.get_row_block(start, stop)
+        mapped.flush()
+        return mapped
+
+    @property
+    def reference(self) -> MemmapArrayReference:
+        return self._reference
+
+    @property
+    def path(self) -> str:
+        return self._reference.path
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        return self._array.dtype
+
+    def flush(self) -> None:
+        """Writes the changes made through the adapter to the disk
+        """
+        if self._array.size != 0 and self._array.mode != "r":
+            self._array.flush()
+
+    def persist(self, path: str) -> None:
+        """Moves the file of the temporary matrix to the given path and keeps it after the adapter is released
+        """
+        self.flush()
+        os.replace(self.path, path)
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
+        self._reference = self._reference.moved(path=path)
+
+    def release(self) -> None:
+        """Unmaps the file and removes it if the matrix is temporary, the adapter could not be used after that
+        """
+        self._array = None
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def get_row(self, index: int) -> numpy.ndarray:
+        return numpy.asarray(self._array[index, :])
+
+    def get_column(self, index: int) -> numpy.ndarray:
+        return numpy.asarray(self._array[:, index])
+
+    def get_row_block(self, start: int, stop: int) -> numpy.ndarray:
+        return numpy.asarray(self._array[start:stop, :])
+
+    def get_column_block(self, start: int, stop: int) -> numpy.ndarray:
+        return numpy.asarray(self._array[:, start:stop])
+
+    def row_len(self) -> int:
+        return self._array.shape[1]
+
+    def column_len(self) -> int:
+        return self._array.shape[0]
+
+    def itemsize(self) -> int:
+        return self._array.dtype.itemsize
+
+
+def temporary_path(directory: str = None) -> str:
+    """Creates an empty ``.npy`` file for a temporary matrix in ``directory`` (the system temporary directory if None)
+    """
+    descriptor, path = tempfile.mkstemp(suffix=".npy", prefix="matrix-", dir=directory)
+    os.close(descriptor)
+    return path
+
+
+def _reference(array: numpy.memmap, path: str, mode: str) -> MemmapArrayReference:
+    order = "F" if array.flags.f_contiguous and not array.flags.c_contiguous else "C"
+    return MemmapArrayReference(
+        path=path, shape=array.shape, dtype=array.dtype.str, offset=array.offset, order=order, mode=mode)
@@ -0,0 +1,31 @@
+"""Module with shape descriptors of matrices which data is not available yet
+"""
+from __future__ import annotations
+from typing import Tuple
+
+from matrix_multiplication.abc.matrix import ABCMatrixShape
+
+
+class MatrixShape(ABCMatrixShape):
+    """Describes the matrix by its shape and element size only,
+    so the multiplication of lazily produced matrices could be validated and planned before they are made
+    """
+    __slots__ = ("_shape", "_itemsize")
+
+    def __init__(self, shape: Tuple[int, int], itemsize: int = 8) -> None:
+        if len(shape) != 2 or min(shape) < 0:
+            raise ValueError("the given shape is not a matrix shape")
+        self._shape = tuple(shape)
+        self._itemsize = itemsize
+
+    def row_len(self) -> int:
+        return self._shape[1]
+
+    def column_len(self) -> int:
+        return self._shape[0]
+
+    def itemsize(self) -> int:
+        return self._itemsize
+
+    def __repr__(self) -> str:
+        return f"MatrixShape(shape={self._shape!r}, itemsize={self._itemsize!r})"
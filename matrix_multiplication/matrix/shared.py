@@ -0,0 +1,193 @@
+"""Module with matrices placed in shared memory
+"""
+from __future__ import annotations
+import collections
+import sys
+import threading
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+from typing import Tuple
+
+import numpy
+
+from matrix_multiplication.abc.matrix import ABCMatrix
+from matrix_multiplication.abc.storage import ABCArrayReference
+
+# shared memory blocks attached by the current process, the number of blocks kept open is limited
+# because a block released by its owner is not freed while it is attached by any worker
+_ATTACHED_BLOCKS_LIMIT = 8
+_attached_blocks: collections.OrderedDict[str, shared_memory.SharedMemory] = collections.OrderedDict()
+# the largest amount of data read from a matrix at once while it is copied into shared memory
+_COPY_CHUNK_BYTES = 16 * 1024 * 1024
+# shared memory blocks created by the current process
+_owned_blocks: weakref.WeakValueDictionary[str, shared_memory.SharedMemory] = weakref.WeakValueDictionary()
+
+
+def _attach_block(name: str) -> shared_memory.SharedMemory:
+    block = _owned_blocks.get(name)
+    if block is not None:
+        return block
+    block = _attached_blocks.get(name)
+    if block is None:
+        block = _open_untracked_block(name=name)
+        _attached_blocks[name] = block
+        while len(_attached_blocks) > _ATTACHED_BLOCKS_LIMIT:
+            _, evicted_block = _attached_blocks.popitem(last=False)
+            _close_block(block=evicted_block)
+    else:
+        _attached_blocks.move_to_end(name)
+    return block
+
+
+_untracked_lock = threading.Lock()
+
+
+def _open_untracked_block(name: str) -> shared_memory.SharedMemory:
+    # only the owner is responsible for unlinking the block, otherwise the resource tracker
+    # of the worker would unlink (or report as leaked) the block it has just attached
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    with _untracked_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _close_block(block: shared_memory.SharedMemory) -> None:
+    try:
+        block.close()
+    except BufferError:
+        # some views of the block are still alive, the mapping is released with them
+        pass
+
+
+class SharedArrayReference(ABCArrayReference):
+    """Reference to the array placed in shared memory block
+    """
+    __slots__ = ("_name", "_shape", "_dtype")
+
+    def __init__(self, name: str, shape: Tuple[int, int], dtype: str) -> None:
+        self._name = name
+        self._shape = tuple(shape)
+        self._dtype = dtype
+
+    def __getstate__(self):
+        return (self._name, self._shape, self._dtype)
+
+    def __setstate__(self, state) -> None:
+        self._name, self._shape, self._dtype = state
+
+    def open(self) -> numpy.ndarray:
+        """Attaches shared memory block (once per process) and returns zero-copy array view of it
+        """
+        block = _attach_block(name=self._name)
+        return numpy.ndarray(shape=self._shape, dtype=self._dtype, buffer=block.buf)
+
+    def shape(self) -> Tuple[int, int]:
+        return self._shape
+
+
+class SharedArray(object):
+    """Owner of the shared memory block holding a 2D array
+
+    The block is unlinked when the owner is released or garbage collected
+    """
+    __slots__ = ("_block", "_array", "_reference", "_finalizer", "__weakref__")
+
+    def __init__(self, shape: Tuple[int, int], dtype: numpy.dtype) -> None:
+        dtype = numpy.dtype(dtype)
+        size = max(int(numpy.prod(shape)) * dtype.itemsize, 1)
+        self._block = shared_memory.SharedMemory(create=True, size=size)
+        _owned_blocks[self._block.name] = self._block
+        self._array = numpy.ndarray(shape=shape, dtype=dtype, buffer=self._block.buf)
+        self._reference = SharedArrayReference(name=self._block.name, shape=shape, dtype=dtype.str)
+        self._finalizer = weakref.finalize(self, SharedArray._release_block, self._block)
+
+    @classmethod
+    def from_ndarray(cls, array: numpy.ndarray) -> SharedArray:
+        shared_array = cls(shape=array.shape, dtype=array.dtype)
+        shared_array.array[...] = array
+        return shared_array
+
+    @classmethod
+    def from_matrix(cls, matrix: ABCMatrix, dtype: numpy.dtype = None) -> SharedArray:
+        """Copies the matrix into shared memory block by block, so no intermediate copy of the whole matrix is made
+
+        The blocks are converted to ``dtype`` while they are copied (the type of the matrix is kept if None)
+        """
+        row_count, column_count = matrix.column_len(), matrix.row_len()
+        if dtype is None:
+            dtype = numpy.asarray(matrix.get_row_block(0, min(1, row_count))).dtype
+        shared_array = cls(shape=(row_count, column_count), dtype=dtype)
+        step = max(_COPY_CHUNK_BYTES // max(shared_array.array.dtype.itemsize * column_count, 1), 1)
+        for start in range(0, row_count, step):
+            stop = min(start + step, row_count)
+            shared_array.array[start:stop, :] = matrix.get_row_block(start, stop)
+        return shared_array
+
+    @property
+    def array(self) -> numpy.ndarray:
+        return self._array
+
+    @property
+    def reference(self) -> SharedArrayReference:
+        return self._reference
+
+    def release(self) -> None:
+        self._array = None
+        self._finalizer()
+
+    @staticmethod
+    def _release_block(block: shared_memory.SharedMemory) -> None:
+        block.unlink()
+        _close_block(block=block)
+
+
+class SharedMatrixAdapter(ABCMatrix):
+    """Adapts :class:`SharedArray` to ABCMatrix interface
+
+    The shared memory block lives as long as the adapter does
+    """
+    __slots__ = ("_shared_array",)
+
+    def __init__(self, shared_array: SharedArray) -> None:
+        if shared_array.array.ndim != 2:
+            raise ValueError("the given object is not a matrix")
+        self._shared_array = shared_array
+
+    @property
+    def reference(self) -> SharedArrayReference:
+        return self._shared_array.reference
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        return self._shared_array.array.dtype
+
+    def release(self) -> None:
+        """Unlinks the shared memory block, the adapter could not be used after that
+        """
+        self._shared_array.release()
+
+    def get_row(self, index: int) -> numpy.ndarray:
+        return self._shared_array.array[index, :]
+
+    def get_column(self, index: int) -> numpy.ndarray:
+        return self._shared_array.array[:, index]
+
+    def get_row_block(self, start: int, stop: int) -> numpy.ndarray:
+        return self._shared_array.array[start:stop, :]
+
+    def get_column_block(self, start: int, stop: int) -> numpy.ndarray:
+        return self._shared_array.array[:, start:stop]
+
+    def row_len(self) -> int:
+        return self._shared_array.array.shape[1]
+
+    def column_len(self) -> int:
+        return self._shared_array.array.shape[0]
+
+    def itemsize(self) -> int:
+        return self._shared_array.array.dtype.itemsize
@@ -0,0 +1,169 @@
+"""Module with matrices stored in compressed sparse formats
+"""
+from __future__ import annotations
+from typing import Tuple
+
+import numpy
+
+from matrix_multiplication.abc.matrix import ABCMatrix
+
+# compressed sparse arrays: the values, their minor axis indices and the bounds of each major axis line in them
+CompressedArrays = Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+
+# the number of rows converted at once when the matrix is compressed
+_COMPRESS_CHUNK_ROWS = 1024
+
+
+class SparseMatrixAdapter(ABCMatrix):
+    """Adapts the matrix stored in compressed sparse row (CSR) format to ABCMatrix interface
+
+    Only the non-zero values are stored: ``data`` holds them row by row, ``indices`` holds their column indices
+    and ``indptr`` holds the bounds of each row in ``data``. Rows and columns are returned dense, columns are read
+    from the compressed sparse column (CSC) copy made on the first column access
+    """
+    __slots__ = ("_data", "_indices", "_indptr", "_shape", "_columns")
+
+    def __init__(self, data: numpy.ndarray, indices: numpy.ndarray, indptr: numpy.ndarray,
+                 shape: Tuple[int, int]) -> None:
+        data, indices, indptr = numpy.asarray(data), numpy.asarray(indices, dtype=numpy.intp), numpy.asarray(
+            indptr, dtype=numpy.intp)
+        if len(shape) != 2 or indptr.shape != (shape[0] + 1,):
+            raise ValueError("the given object is not a matrix")
+        if data.shape != indices.shape or indptr[-1] != data.shape[0]:
+            raise ValueError("the non-zero values do not match their indices")
+        self._data = data
+        self._indices = indices
+        self._indptr = indptr
+        self._shape = tuple(shape)
+        self._columns = None
+
+    @classmethod
+    def from_ndarray(cls, array: numpy.ndarray) -> SparseMatrixAdapter:
+        if array.ndim != 2:
+            raise ValueError("the given object is not a matrix")
+        return cls(*compress(array=array), shape=array.shape)
+
+    @classmethod
+    def from_matrix(cls, matrix: ABCMatrix) -> SparseMatrixAdapter:
+        """Compresses the matrix block by block, so the dense matrix is never copied as a whole
+        """
+        if isinstance(matrix, SparseMatrixAdapter):
+            return matrix
+        row_count = matrix.column_len()
+        chunks = [compress(array=numpy.asarray(matrix.get_row_block(start, min(start + _COMPRESS_CHUNK_ROWS, row_count))))
+                  for start in range(0, row_count, _COMPRESS_CHUNK_ROWS)]
+        if not chunks:
+            return cls.from_ndarray(array=numpy.zeros(shape=(0, matrix.row_len())))
+        offsets = numpy.cumsum([0] + [chunk_indptr[-1] for _, _, chunk_indptr in chunks[:-1]])
+        indptr = numpy.concatenate([[0]] + [chunk_indptr[1:] + offset for (_, _, chunk_indptr), offset in zip(chunks, offsets)])
+        return cls(data=numpy.concatenate([data for data, _, _ in chunks]),
+                   indices=numpy.concatenate([indices for _, indices, _ in chunks]),
+                   indptr=indptr, shape=(row_count, matrix.row_len()))
+
+    @property
+    def data(self) -> numpy.ndarray:
+        return self._data
+
+    @property
+    def indices(self) -> numpy.ndarray:
+        return self._indices
+
+    @property
+    def indptr(self) -> numpy.ndarray:
+        return self._indptr
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        return self._data.dtype
+
+    @property
+    def nnz(self) -> int:
+        return self._data.shape[0]
+
+    def take_rows(self, rows: numpy.ndarray) -> CompressedArrays:
+        """Returns the compressed arrays of the matrix made of the given rows
+        """
+        return take(arrays=(self._data, self._indices, self._indptr), lines=rows)
+
+    def to_ndarray(self) -> numpy.ndarray:
+        return self.get_row_block(0, self._shape[0])
+
+    def get_row(self, index: int) -> numpy.ndarray:
+        return self.get_row_block(index, index + 1)[0]
+
+    def get_column(self, index: int) -> numpy.ndarray:
+        return self.get_column_block(index, index + 1)[:, 0]
+
+    def get_row_block(self, start: int, stop: int) -> numpy.ndarray:
+        start, stop, _ = slice(start, stop).indices(self._shape[0])
+        return expand(arrays=take(arrays=(self._data, self._indices, self._indptr), lines=numpy.arange(start, stop)),
+                      shape=(max(stop - start, 0), self._shape[1]))
+
+    def get_column_block(self, start: int, stop: int) -> numpy.ndarray:
+        start, stop, _ = slice(start, stop).indices(self._shape[1])
+        block = expand(arrays=take(arrays=self._column_major(), lines=numpy.arange(start, stop)),
+                       shape=(max(stop - start, 0), self._shape[0]))
+        return block.T
+
+    def row_len(self) -> int:
+        return self._shape[1]
+
+    def column_len(self) -> int:
+        return self._shape[0]
+
+    def itemsize(self) -> int:
+        return self._data.dtype.itemsize
+
+    def _column_major(self) -> CompressedArrays:
+        if self._columns is None:
+            self._columns = transpose(arrays=(self._data, self._indices, self._indptr), minor_len=self._shape[1])
+        return self._columns
+
+
+def compress(array: numpy.ndarray) -> CompressedArrays:
+    """Compresses the rows of dense two-dimensional array
+    """
+    rows, columns = numpy.nonzero(array)
+    indptr = numpy.zeros(shape=array.shape[0] + 1, dtype=numpy.intp)
+    numpy.cumsum(numpy.bincount(rows, minlength=array.shape[0]), out=indptr[1:])
+    return array[rows, columns], columns.astype(numpy.intp), indptr
+
+
+def expand(arrays: CompressedArrays, shape: Tuple[int, int]) -> numpy.ndarray:
+    """Expands the compressed arrays to dense two-dimensional array
+    """
+    data, indices, indptr = arrays
+    array = numpy.zeros(shape=shape, dtype=data.dtype)
+    array[numpy.repeat(numpy.arange(shape[0]), numpy.diff(indptr)), indices] = data
+    return array
+
+
+def take(arrays: CompressedArrays, lines: numpy.ndarray) -> CompressedArrays:
+    """Returns the compressed arrays made of the given major axis lines
+    """
+    data, indices, indptr = arrays
+    starts, counts = indptr[lines], indptr[numpy.asarray(lines) + 1] - indptr[lines]
+    positions = expand_ranges(starts=starts, counts=counts)
+    line_indptr = numpy.zeros(shape=len(counts) + 1, dtype=numpy.intp)
+    numpy.cumsum(counts, out=line_indptr[1:])
+    return data[positions], indices[positions], line_indptr
+
+
+def transpose(arrays: CompressedArrays, minor_len: int) -> CompressedArrays:
+    """Converts the compressed arrays from row-major to column-major order and vice versa
+    """
+    data, indices, indptr = arrays
+    major = numpy.repeat(numpy.arange(indptr.shape[0] - 1, dtype=numpy.intp), numpy.diff(indptr))
+    order = numpy.argsort(indices, kind="stable")
+    transposed_indptr = numpy.zeros(shape=minor_len + 1, dtype=numpy.intp)
+    numpy.cumsum(numpy.bincount(indices, minlength=minor_len), out=transposed_indptr[1:])
+    return data[order], major[order], transposed_indptr
+
+
+def expand_ranges(starts: numpy.ndarray, counts: numpy.ndarray) -> numpy.ndarray:
+    """Concatenates the ranges ``[start, start + count)`` without a Python loop
+    """
+    total = int(numpy.sum(counts))
+    range_starts = numpy.cumsum(counts) - counts
+    return numpy.arange(total, dtype=numpy.intp) + numpy.repeat(
+        numpy.asarray(starts, dtype=numpy.intp) - range_starts, counts)
@@ -0,0 +1,3 @@
+from .recorders import NullMetrics, RecordingMetrics, TimedIterator
+
+__all__ = ["NullMetrics", "RecordingMetrics", "TimedIterator"]
@@ -0,0 +1,132 @@
+"""Module with concrete implementations of metrics recorders
+"""
+from __future__ import annotations
+import collections
+import json
+import os
+import threading
+import time
+import typing
+
+from matrix_multiplication.abc.metrics import ABCMetrics
+
+
+class NullMetrics(ABCMetrics):
+    """Disabled metrics, nothing is measured
+    """
+    __slots__ = tuple()
+
+    @property
+    def enabled(self) -> bool:
+        return False
+
+    def record_stage(self, name: str, start: float, duration: float, **attributes) -> None:
+        pass
+
+    def record_task(self, name: str, worker: int, submitted: float, started: float, finished: float, size: int) -> None:
+        pass
+
+
+class RecordingMetrics(ABCMetrics):
+    """Thread-safe in-memory recorder of the stage and task timings
+
+    Recorded events could be summarized or exported as a trace file in Chrome trace event format
+    (viewable in chrome://tracing or Perfetto)
+    """
+    __slots__ = ("_stages", "_tasks", "_lock")
+
+    def __init__(self) -> None:
+        self._stages: typing.List[typing.Dict[str, object]] = list()
+        self._tasks: typing.List[typing.Dict[str, object]] = list()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    def record_stage(self, name: str, start: float, duration: float, **attributes) -> None:
+        stage = {"name": name, "start": start, "duration": duration, "thread": threading.get_ident(), "args": attributes}
+        with self._lock:
+            self._stages.append(stage)
+
+    def record_task(self, name: str, worker: int, submitted: float, started: float, finished: float, size: int) -> None:
+        task = {"name": name, "worker": worker, "submitted": submitted, "started": started, "finished": finished, "size": size}
+        with self._lock:
+            self._tasks.append(task)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._tasks.clear()
+
+    def summary(self) -> typing.Dict[str, object]:
+        """Aggregates recorded events
+
+        Returns:
+            Dict[str, object]: total wall time per stage, task count, serialized bytes, queue wait time
+            and busy and idle time of each worker over the time span the tasks were processed in
+        """
+        with self._lock:
+            stages, tasks = list(self._stages), list(self._tasks)
+        stage_times = collections.defaultdict(float)
+        for stage in stages:
+            stage_times[stage["name"]] += stage["duration"]
+        workers = dict()
+        if tasks:
+            span_start = min(task["started"] for task in tasks)
+            span_stop = max(task["finished"] for task in tasks)
+            busy_times = collections.defaultdict(float)
+            for task in tasks:
+                busy_times[task["worker"]] += task["finished"] - task["started"]
+            workers = {worker: {"busy": busy, "idle": (span_stop - span_start) - busy} for worker, busy in busy_times.items()}
+        return {
+            "stages": dict(stage_times),
+            "tasks": len(tasks),
+            "serialized_bytes": sum(task["size"] for task in tasks),
+            "queue_wait": sum(task["started"] - task["submitted"] for task in tasks),
+            "workers": workers,
+        }
+
+    def trace_events(self) -> typing.List[typing.Dict[str, object]]:
+        with self._lock:
+            stages, tasks = list(self._stages), list(self._tasks)
+        process = os.getpid()
+        events = [{"name": stage["name"], "cat": "stage", "ph": "X", "pid": process, "tid": stage["thread"],
+                   "ts": stage["start"] * 1e6, "dur": stage["duration"] * 1e6, "args": stage["args"]} for stage in stages]
+        for task in tasks:
+            events.append({"name": "queue_wait", "cat": "task", "ph": "X", "pid": task["worker"], "tid": task["worker"],
+                           "ts": task["submitted"] * 1e6, "dur": (task["started"] - task["submitted"]) * 1e6})
+            events.append({"name": task["name"], "cat": "task", "ph": "X", "pid": task["worker"], "tid": task["worker"],
+                           "ts": task["started"] * 1e6, "dur": (task["finished"] - task["started"]) * 1e6,
+                           "args": {"serialized_bytes": task["size"]}})
+        return events
+
+    def export_trace(self, path: str) -> None:
+        """Writes recorded events to the file in Chrome trace event format
+        """
+        with open(path, mode="w") as trace_file:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, trace_file)
+
+
+class TimedIterator(object):
+    """Iterator accumulating the wall time spent producing the items of the wrapped iterable
+    """
+    __slots__ = ("_iterator", "_elapsed")
+
+    def __init__(self, iterable: typing.Iterable) -> None:
+        self._iterator = iter(iterable)
+        self._elapsed = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return self._elapsed
+
+    def __iter__(self) -> TimedIterator:
+        return self
+
+    def __next__(self) -> object:
+        start = time.perf_counter()
+        try:
+            return next(self._iterator)
+        finally:
+            self._elapsed += time.perf_counter() - start
@@ -1,3 +1,4 @@
-from .processor import MultiprocessTaskProcessor
+from .processor import (
+    MultiprocessTaskProcessor, StreamingTaskProcessor, ThreadPoolTaskProcessor, AsyncMultiprocessTaskProcessor)
 
-__all__ = ["MultiprocessTaskProcessor"]
+__all__ = ["MultiprocessTaskProcessor", "StreamingTaskProcessor", "ThreadPoolTaskProcessor", "AsyncMultiprocessTaskProcessor"]
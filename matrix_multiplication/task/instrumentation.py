@@ -0,0 +1,51 @@
+"""Module with task wrappers measuring the task processing
+"""
+from __future__ import annotations
+import os
+import pickle
+import threading
+import time
+import typing
+
+from matrix_multiplication.abc.metrics import ABCMetrics
+from matrix_multiplication.abc.task import Task
+
+
+class InstrumentedTask(Task):
+    """Wraps the task and returns its result along with the worker id and the processing timestamps
+
+    Workers are identified by the process id, or by the thread id if ``thread`` is True
+    """
+    __slots__ = ("_task", "_submitted", "_thread")
+
+    def __init__(self, task: Task, thread: bool = False) -> None:
+        self._task = task
+        self._submitted = time.time()
+        self._thread = thread
+
+    def __call__(self) -> typing.Tuple[object, typing.Tuple[str, int, float, float, float]]:
+        started = time.time()
+        result = self._task()
+        worker = threading.get_ident() if self._thread else os.getpid()
+        return result, (type(self._task).__name__, worker, self._submitted, started, time.time())
+
+
+def instrument_tasks(tasks: typing.Iterable[Task],
+                     serialized: bool = True) -> typing.Iterator[typing.Tuple[InstrumentedTask, int]]:
+    """Wraps each task and measures the number of bytes it is serialized to
+
+    Tasks run by the threads of the current process are not serialized, their size is zero
+    """
+    for task in tasks:
+        if not serialized:
+            yield InstrumentedTask(task=task, thread=True), 0
+        else:
+            yield InstrumentedTask(task=task), len(pickle.dumps(task, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def collect_result(result: typing.Tuple[object, tuple], size: int, metrics: ABCMetrics) -> object:
+    """Records timings of the instrumented task and returns the result of the wrapped task
+    """
+    result, (name, worker, submitted, started, finished) = result
+    metrics.record_task(name=name, worker=worker, submitted=submitted, started=started, finished=finished, size=size)
+    return result
@@ -1,21 +1,230 @@
 """Module with concrete implementation of task processor
 """
 from __future__ import annotations
+import asyncio
+import collections
+import concurrent.futures
+import queue
 import typing
 import multiprocessing
 
-from matrix_multiplication.abc.task import TaskProcessor, Task
+from matrix_multiplication.abc.metrics import ABCMetrics
+from matrix_multiplication.abc.task import AsyncTaskProcessor, TaskProcessor, Task
+from matrix_multiplication.metrics import NullMetrics
+from .instrumentation import collect_result, instrument_tasks
 
 
 class MultiprocessTaskProcessor(TaskProcessor):
-    __slots__ = ("_pool",)
+    """Spreads all the tasks between a pool of workers at once and collects the results in order
 
-    def __init__(self, pool: multiprocessing.Pool):
+    If ``ordered`` is False, results are returned as ``(index, result)`` pairs
+    """
+    __slots__ = ("_pool", "_ordered", "_metrics")
+
+    def __init__(self, pool: multiprocessing.Pool, ordered: bool = True, metrics: ABCMetrics = None):
         self._pool = pool
+        self._ordered = ordered
+        self._metrics = metrics if metrics is not None else NullMetrics()
 
     def __call__(self, tasks: typing.Iterable[Task]) -> typing.Iterable[object]:
-        # here tasks are spread between a pool of workers (processes)
-        tasks = [self._pool.apply_async(task) for task in tasks]
-        # waiting for tasks completion
-        results = [task.get() for task in tasks]
-        return results
+        if self._metrics.enabled:
+            results = self._process_instrumented(tasks=tasks)
+        else:
+            # here tasks are spread between a pool of workers (processes)
+            tasks = [self._pool.apply_async(task) for task in tasks]
+            # waiting for tasks completion
+            results = [task.get() for task in tasks]
+        return results if self._ordered else list(enumerate(results))
+
+    def _process_instrumented(self, tasks: typing.Iterable[Task]) -> typing.List[object]:
+        tasks = [(self._pool.apply_async(task), size) for task, size in instrument_tasks(tasks=tasks)]
+        return [collect_result(result=task.get(), size=size, metrics=self._metrics) for task, size in tasks]
+
+
+class StreamingTaskProcessor(TaskProcessor):
+    """Lazily submits tasks to a pool of workers keeping at most ``window`` tasks in flight
+
+    Tasks are pulled from the given iterable only when there is room in the window,
+    so neither the tasks nor the results are materialized all at once.
+    If ``ordered`` is False, results are yielded as soon as they are ready
+    as ``(index, result)`` pairs, where ``index`` is the position of the task in the iterable
+    """
+    __slots__ = ("_pool", "_window", "_ordered", "_metrics")
+
+    def __init__(self, pool: multiprocessing.Pool, window: int = 256, ordered: bool = True, metrics: ABCMetrics = None):
+        if window < 1:
+            raise ValueError("window must be positive")
+        self._pool = pool
+        self._window = window
+        self._ordered = ordered
+        self._metrics = metrics if metrics is not None else NullMetrics()
+
+    def __call__(self, tasks: typing.Iterable[Task]) -> typing.Iterator[object]:
+        if self._metrics.enabled:
+            return self._process_instrumented(tasks=tasks)
+        if self._ordered:
+            return self._process_ordered(tasks=tasks)
+        return self._process_unordered(tasks=tasks)
+
+    def _process_ordered(self, tasks: typing.Iterable[Task]) -> typing.Iterator[object]:
+        in_flight = collections.deque()
+        for task in tasks:
+            if len(in_flight) >= self._window:
+                # backpressure: waiting for the oldest task before submitting the next one
+                yield in_flight.popleft().get()
+            in_flight.append(self._pool.apply_async(task))
+        while in_flight:
+            yield in_flight.popleft().get()
+
+    def _process_instrumented(self, tasks: typing.Iterable[Task]) -> typing.Iterator[object]:
+        instrumented_tasks = instrument_tasks(tasks=tasks)
+        sizes = dict()
+
+        def remember_size():
+            for index, (task, size) in enumerate(instrumented_tasks):
+                sizes[index] = size
+                yield task
+
+        if self._ordered:
+            for index, result in enumerate(self._process_ordered(tasks=remember_size())):
+                yield collect_result(result=result, size=sizes.pop(index), metrics=self._metrics)
+        else:
+            for index, result in self._process_unordered(tasks=remember_size()):
+                yield index, collect_result(result=result, size=sizes.pop(index), metrics=self._metrics)
+
+    def _process_unordered(self, tasks: typing.Iterable[Task]) -> typing.Iterator[typing.Tuple[int, object]]:
+        completed = queue.SimpleQueue()
+        in_flight = 0
+        for index, task in enumerate(tasks):
+            if in_flight >= self._window:
+                yield self._wait_completed(completed=completed)
+                in_flight -= 1
+            self._submit(task=task, index=index, completed=completed)
+            in_flight += 1
+        for _ in range(in_flight):
+            yield self._wait_completed(completed=completed)
+
+    def _submit(self, task: Task, index: int, completed: queue.SimpleQueue) -> None:
+        self._pool.apply_async(
+            task,
+            callback=lambda result: completed.put((index, result, None)),
+            error_callback=lambda error: completed.put((index, None, error)))
+
+    @staticmethod
+    def _wait_completed(completed: queue.SimpleQueue) -> typing.Tuple[int, object]:
+        index, result, error = completed.get()
+        if error is not None:
+            raise error
+        return index, result
+
+
+class ThreadPoolTaskProcessor(TaskProcessor):
+    """Runs tasks by a pool of threads of the current process keeping at most ``window`` tasks in flight
+
+    Tasks are neither pickled nor copied, the threads share the operands by reference, so the processor pays off
+    for tasks spending their time in kernels releasing the GIL (NumPy and BLAS products).
+    If ``executor`` is not given, a pool of ``max_workers`` threads is started for each call.
+    If ``ordered`` is False, results are yielded as soon as they are ready as ``(index, result)`` pairs
+    """
+    __slots__ = ("_executor", "_max_workers", "_window", "_ordered", "_metrics")
+
+    def __init__(self, executor: concurrent.futures.Executor = None, max_workers: int = None, window: int = 256,
+                 ordered: bool = True, metrics: ABCMetrics = None):
+        if window < 1:
+            raise ValueError("window must be positive")
+        self._executor = executor
+        self._max_workers = max_workers
+        self._window = window
+        self._ordered = ordered
+        self._metrics = metrics if metrics is not None else NullMetrics()
+
+    def __call__(self, tasks: typing.Iterable[Task]) -> typing.Iterator[object]:
+        if self._executor is not None:
+            return self._process(executor=self._executor, tasks=tasks)
+        return self._process_in_own_executor(tasks=tasks)
+
+    def _process_in_own_executor(self, tasks: typing.Iterable[Task]) -> typing.Iterator[object]:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            yield from self._process(executor=executor, tasks=tasks)
+
+    def _process(self, executor: concurrent.futures.Executor, tasks: typing.Iterable[Task]) -> typing.Iterator[object]:
+        if not self._metrics.enabled:
+            if self._ordered:
+                return self._process_ordered(executor=executor, tasks=tasks)
+            return self._process_unordered(executor=executor, tasks=tasks)
+        return self._process_instrumented(executor=executor, tasks=tasks)
+
+    def _process_instrumented(self, executor: concurrent.futures.Executor,
+                              tasks: typing.Iterable[Task]) -> typing.Iterator[object]:
+        tasks = (task for task, _ in instrument_tasks(tasks=tasks, serialized=False))
+        if self._ordered:
+            for result in self._process_ordered(executor=executor, tasks=tasks):
+                yield collect_result(result=result, size=0, metrics=self._metrics)
+        else:
+            for index, result in self._process_unordered(executor=executor, tasks=tasks):
+                yield index, collect_result(result=result, size=0, metrics=self._metrics)
+
+    def _process_ordered(self, executor: concurrent.futures.Executor,
+                         tasks: typing.Iterable[Task]) -> typing.Iterator[object]:
+        in_flight = collections.deque()
+        for task in tasks:
+            if len(in_flight) >= self._window:
+                # backpressure: waiting for the oldest task before submitting the next one
+                yield in_flight.popleft().result()
+            in_flight.append(executor.submit(task))
+        while in_flight:
+            yield in_flight.popleft().result()
+
+    def _process_unordered(self, executor: concurrent.futures.Executor,
+                           tasks: typing.Iterable[Task]) -> typing.Iterator[typing.Tuple[int, object]]:
+        in_flight = dict()
+        for index, task in enumerate(tasks):
+            if len(in_flight) >= self._window:
+                yield from self._wait_completed(in_flight=in_flight)
+            in_flight[executor.submit(task)] = index
+        while in_flight:
+            yield from self._wait_completed(in_flight=in_flight)
+
+    @staticmethod
+    def _wait_completed(in_flight: typing.Dict[concurrent.futures.Future, int]) -> typing.Iterator[typing.Tuple[int, object]]:
+        done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            yield in_flight.pop(future), future.result()
+
+
+class AsyncMultiprocessTaskProcessor(AsyncTaskProcessor):
+    """Spreads tasks between a pool of workers and awaits the results without blocking the event loop
+
+    Pool callbacks resolve the awaitables through the event loop, so no thread is spent per call
+    and many concurrent calls could share one pool.
+    If ``ordered`` is False, results are returned as ``(index, result)`` pairs
+    """
+    __slots__ = ("_pool", "_ordered")
+
+    def __init__(self, pool: multiprocessing.Pool, ordered: bool = True):
+        self._pool = pool
+        self._ordered = ordered
+
+    async def __call__(self, tasks: typing.Iterable[Task]) -> typing.List[object]:
+        loop = asyncio.get_running_loop()
+        futures = [self._submit(task=task, loop=loop) for task in tasks]
+        results = await asyncio.gather(*futures)
+        return results if self._ordered else list(enumerate(results))
+
+    def _submit(self, task: Task, loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+        future = loop.create_future()
+        self._pool.apply_async(
+            task,
+            callback=lambda result: loop.call_soon_threadsafe(self._set_result, future, result),
+            error_callback=lambda error: loop.call_soon_threadsafe(self._set_exception, future, error))
+        return future
+
+    @staticmethod
+    def _set_result(future: asyncio.Future, result: object) -> None:
+        if not future.done():
+            future.set_result(result)
+
+    @staticmethod
+    def _set_exception(future: asyncio.Future, error: BaseException) -> None:
+        if not future.done():
+            future.set_exception(error)
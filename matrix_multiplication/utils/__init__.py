@@ -1,3 +1,32 @@
-from .matrix_multiplication import multiprocess_matrices_multiplication
+from __future__ import annotations
+import importlib
+import typing
 
-__all__ = ["multiprocess_matrices_multiplication"]
+if typing.TYPE_CHECKING:
+    from .matrix_multiplication import (
+        multiprocess_matrices_multiplication, multiprocess_matrices_batch_multiplication, async_multiprocess_matrices_multiplication)
+    from .engine import MatrixMultiplicationEngine
+    from .compiled import CompiledMatrixMultiplication
+
+# the public names are imported on first access, see the package documentation
+_LAZY_ATTRIBUTES = {
+    "multiprocess_matrices_multiplication": ".matrix_multiplication",
+    "multiprocess_matrices_batch_multiplication": ".matrix_multiplication",
+    "async_multiprocess_matrices_multiplication": ".matrix_multiplication",
+    "MatrixMultiplicationEngine": ".engine",
+    "CompiledMatrixMultiplication": ".compiled",
+}
+
+__all__ = ["multiprocess_matrices_multiplication", "multiprocess_matrices_batch_multiplication", "async_multiprocess_matrices_multiplication", "MatrixMultiplicationEngine", "CompiledMatrixMultiplication"]
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
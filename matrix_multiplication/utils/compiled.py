@@ -0,0 +1,96 @@
+"""Module with matrix multiplication commands built once and reused by every call
+"""
+from __future__ import annotations
+import copy
+import multiprocessing
+import threading
+import typing
+import weakref
+
+from matrix_multiplication.abc.matrix import ABCMatrix
+from matrix_multiplication.commands.asynchronous import AsyncMultiplyMatrixSequence
+from matrix_multiplication.containers import MatrixMultiplicationCommandsContainer
+
+# the pool provider of the container is overridden while the commands are built, so builds never overlap
+_build_lock = threading.Lock()
+
+
+class _PoolCommands(object):
+    """Commands bound to one pool of workers
+
+    The asyncio commands are built on the first asynchronous call, so the configurations they do not support
+    are rejected only if they are used
+    """
+    __slots__ = ("_container", "_pool", "multiply_matrix_sequence", "multiply_matrix_batch",
+                 "_async_multiply_matrix_sequence")
+
+    def __init__(self, container: MatrixMultiplicationCommandsContainer, pool: multiprocessing.Pool) -> None:
+        # the commands reach the pool through a weak proxy, so they do not keep alive the pool they are cached by
+        self._container = container
+        self._pool = weakref.proxy(pool)
+        self._async_multiply_matrix_sequence = None
+        with _build_lock, container.override_providers(pool=self._pool):
+            self.multiply_matrix_sequence = container.multiply_matrix_sequence()
+            self.multiply_matrix_batch = container.multiply_matrix_batch()
+
+    @property
+    def async_multiply_matrix_sequence(self) -> AsyncMultiplyMatrixSequence:
+        if self._async_multiply_matrix_sequence is None:
+            with _build_lock, self._container.override_providers(pool=self._pool):
+                if self._async_multiply_matrix_sequence is None:
+                    self._async_multiply_matrix_sequence = self._container.async_multiply_matrix_sequence()
+        return self._async_multiply_matrix_sequence
+
+
+class CompiledMatrixMultiplication(object):
+    """Builds the commands of the container once and reuses them for every call
+
+    The commands are stateless, so they are shared by all the threads: the pool independent commands are built
+    at once, the commands bound to a pool are built on the first call with that pool and dropped once the pool is collected.
+    Calls with different pools could be made concurrently from many threads.
+    The configuration of the container is read at once, compile again to apply later changes
+    """
+    __slots__ = ("_container", "_config", "_plan_matrix_sequence", "_async_plan_matrix_sequence",
+                 "_validate_matrix_sequence", "_commands", "_lock")
+
+    def __init__(self, container: MatrixMultiplicationCommandsContainer = None) -> None:
+        self._container = container if container is not None else MatrixMultiplicationCommandsContainer()
+        self._config = copy.deepcopy(self._container.config())
+        self._plan_matrix_sequence = self._container.plan_matrix_sequence()
+        self._async_plan_matrix_sequence = self._container.async_plan_matrix_sequence()
+        self._validate_matrix_sequence = self._container.validate_matrix_sequence()
+        self._commands: typing.MutableMapping[multiprocessing.Pool, _PoolCommands] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def matches(self, config: typing.Dict[str, object]) -> bool:
+        """Checks if the commands were built with the given configuration
+        """
+        return config == self._config
+
+    def multiply(self, pool: multiprocessing.Pool, matrices: typing.Iterable[ABCMatrix]) -> ABCMatrix:
+        # the sequence is validated and planned in one pass, so it could be a generator
+        sequence_plan = self._plan_matrix_sequence(matrices=matrices)
+        return self._get_commands(pool=pool).multiply_matrix_sequence(
+            matrices=sequence_plan.matrices, plan=sequence_plan.plan)
+
+    def multiply_batch(self, pool: multiprocessing.Pool,
+                       chains: typing.Iterable[typing.Sequence[ABCMatrix]]) -> typing.List[ABCMatrix]:
+        chains = [list(chain) for chain in chains]
+        for index, chain in enumerate(chains):
+            if not chain or not self._validate_matrix_sequence(matrices=chain):
+                raise ValueError(f"matrices of chain {index} could not be multiplied")
+        return self._get_commands(pool=pool).multiply_matrix_batch(chains=chains)
+
+    async def multiply_async(self, pool: multiprocessing.Pool, matrices: typing.Iterable[ABCMatrix]) -> ABCMatrix:
+        sequence_plan = self._async_plan_matrix_sequence(matrices=matrices)
+        return await self._get_commands(pool=pool).async_multiply_matrix_sequence(
+            matrices=sequence_plan.matrices, plan=sequence_plan.plan)
+
+    def _get_commands(self, pool: multiprocessing.Pool) -> _PoolCommands:
+        commands = self._commands.get(pool)
+        if commands is None:
+            with self._lock:
+                commands = self._commands.get(pool)
+                if commands is None:
+                    commands = self._commands[pool] = _PoolCommands(container=self._container, pool=pool)
+        return commands
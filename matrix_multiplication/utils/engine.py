@@ -0,0 +1,70 @@
+"""Module with long-lived matrix multiplication engine
+"""
+from __future__ import annotations
+import multiprocessing
+import typing
+
+from matrix_multiplication.abc.matrix import ABCMatrix
+from matrix_multiplication.containers import MatrixMultiplicationCommandsContainer
+from matrix_multiplication.matrix.adapters import to_ndarray
+from matrix_multiplication.matrix.shared import SharedArray, SharedMatrixAdapter
+from matrix_multiplication.utils.compiled import CompiledMatrixMultiplication
+
+
+class MatrixMultiplicationEngine(object):
+    """Owns a pool of workers and keeps registered (resident) matrices in shared memory
+
+    Resident matrices are copied into shared memory once at registration, converted to the compute type
+    of the configured precision, products referring to them by name or by the returned handle skip all operand
+    transfer: the workers read them directly from shared memory
+    """
+    __slots__ = ("_pool", "_matrices", "_precision", "_compiled")
+
+    def __init__(self, processes: int = None, container: MatrixMultiplicationCommandsContainer = None) -> None:
+        if container is None:
+            container = MatrixMultiplicationCommandsContainer()
+            container.config.transport.from_value("shared_memory")
+        self._pool = multiprocessing.Pool(processes=processes)
+        self._matrices: typing.Dict[str, SharedMatrixAdapter] = dict()
+        self._precision = container.precision()
+        self._compiled = CompiledMatrixMultiplication(container=container)
+
+    def __enter__(self) -> MatrixMultiplicationEngine:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def register(self, name: str, matrix: ABCMatrix) -> SharedMatrixAdapter:
+        """Places the matrix into shared memory and keeps it there until it is unregistered
+
+        Registering a matrix under an existing name replaces the previous one
+
+        Returns:
+            SharedMatrixAdapter: handle of the resident matrix
+        """
+
+        array = to_ndarray(matrix=matrix)
+        array = array.astype(self._precision.operand_dtype(dtype=array.dtype), copy=False)
+        handle = SharedMatrixAdapter(shared_array=SharedArray.from_ndarray(array=array))
+        self.unregister(name=name)
+        self._matrices[name] = handle
+        return handle
+
+    def unregister(self, name: str) -> None:
+        handle = self._matrices.pop(name, None)
+        if handle is not None:
+            handle.release()
+
+    def multiply(self, *matrices: typing.Union[str, ABCMatrix]) -> ABCMatrix:
+        """Multiplies the sequence of matrices, resident matrices could be referred to by their names
+        """
+
+        return self._compiled.multiply(
+            pool=self._pool, matrices=(self._matrices[matrix] if isinstance(matrix, str) else matrix for matrix in matrices))
+
+    def close(self) -> None:
+        for name in list(self._matrices):
+            self.unregister(name=name)
+        self._pool.close()
+        self._pool.join()
@@ -6,14 +6,31 @@ import typing
 
 from matrix_multiplication.containers import MatrixMultiplicationCommandsContainer
 from matrix_multiplication.abc.matrix import ABCMatrix
+from matrix_multiplication.utils.compiled import CompiledMatrixMultiplication
 
 commands_container = MatrixMultiplicationCommandsContainer()
+_compiled: typing.Optional[CompiledMatrixMultiplication] = None
+
+
+def _get_compiled() -> CompiledMatrixMultiplication:
+    # the commands are compiled again only when the configuration of the container has changed
+    global _compiled
+    compiled = _compiled
+    if compiled is None or not compiled.matches(config=commands_container.config()):
+        compiled = _compiled = CompiledMatrixMultiplication(container=commands_container)
+    return compiled
 
 
 def multiprocess_matrices_multiplication(pool: multiprocessing.Pool, matrices: typing.Iterable[ABCMatrix]) -> ABCMatrix:
-    commands_container.task_processor.add_kwargs(pool=pool)
-    validation_command = commands_container.validate_matrix_sequence()
-    if not validation_command(matrices=matrices):
-        raise ValueError("matrices could not be multiplied")
-    multiplication_command = commands_container.multiply_matrix_sequence()
-    return multiplication_command(matrices=matrices)
+    return _get_compiled().multiply(pool=pool, matrices=matrices)
+
+
+def multiprocess_matrices_batch_multiplication(
+        pool: multiprocessing.Pool, chains: typing.Iterable[typing.Sequence[ABCMatrix]]) -> typing.List[ABCMatrix]:
+    """Multiplies many independent matrix chains (or pairs) at once, the products are returned in the order of the chains
+    """
+    return _get_compiled().multiply_batch(pool=pool, chains=chains)
+
+
+async def async_multiprocess_matrices_multiplication(pool: multiprocessing.Pool, matrices: typing.Iterable[ABCMatrix]) -> ABCMatrix:
+    return await _get_compiled().multiply_async(pool=pool, matrices=matrices)
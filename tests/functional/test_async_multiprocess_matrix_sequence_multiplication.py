@@ -0,0 +1,95 @@
+import asyncio
+import multiprocessing
+import unittest
+from functools import reduce
+
+import numpy
+from dependency_injector import providers
+
+from matrix_multiplication import async_multiprocess_matrices_multiplication, multiprocess_matrices_multiplication
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+from matrix_multiplication.utils.matrix_multiplication import commands_container
+from tests.functional.utils.container import MatrixContainer
+from tests.functional.utils.matrix import RandomMatrixFactory, ZeroMatrixFactory, MatrixSequenceFactory, ValidShapeSequenceFactory, InvalidShapeSequenceFactory
+
+
+class TestAsyncMultiprocessMatrixSequenceMultiplication(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_random_matrices_multiplications(self):
+        # generating random matrix sequences
+        matrix_container = MatrixContainer()
+        matrix_container.matrix_factory.override(
+            providers.Factory(RandomMatrixFactory))
+        matrix_container.matrix_sequence_factory.override(providers.Factory(
+            MatrixSequenceFactory, matrix_factory=matrix_container.matrix_factory))
+        matrix_container.shape_sequence_factory.override(
+            providers.Factory(ValidShapeSequenceFactory))
+        generate_matrix_sequence = matrix_container.generate_matrix_sequence()
+        sequences = [generate_matrix_sequence(length=5) for i in range(4)]
+        # calculating expected results
+        expected_result_matrices = [reduce(lambda m1, m2: numpy.dot(
+            m1, to_ndarray(m2)), matrices[1:], to_ndarray(matrices[0])) for matrices in sequences]
+        # executing commands under test sharing one pool
+        with multiprocessing.Pool() as pool:
+            result_matrices = await asyncio.gather(*[async_multiprocess_matrices_multiplication(
+                pool=pool, matrices=matrices) for matrices in sequences])
+        for result_matrix, expected_result_matrix in zip(result_matrices, expected_result_matrices):
+            numpy.testing.assert_array_almost_equal(
+                to_ndarray(matrix=result_matrix), expected_result_matrix)
+
+    async def test_invalid_sequence_ten_matrices_multiplication(self):
+        # generating random matrix sequence
+        matrix_container = MatrixContainer()
+        matrix_container.matrix_factory.override(
+            providers.Factory(ZeroMatrixFactory))
+        matrix_container.matrix_sequence_factory.override(providers.Factory(
+            MatrixSequenceFactory, matrix_factory=matrix_container.matrix_factory))
+        matrix_container.shape_sequence_factory.override(
+            providers.Factory(InvalidShapeSequenceFactory))
+        generate_matrix_sequence = matrix_container.generate_matrix_sequence()
+        matrices = generate_matrix_sequence(length=10)
+        # executing command under test
+        with self.assertRaises(ValueError):
+            with multiprocessing.Pool() as pool:
+                await async_multiprocess_matrices_multiplication(
+                    pool=pool, matrices=matrices)
+
+    async def test_random_matrices_multiplication_in_float32(self):
+        # generating random matrix sequence
+        matrix_container = MatrixContainer()
+        matrix_container.matrix_factory.override(
+            providers.Factory(RandomMatrixFactory))
+        matrix_container.matrix_sequence_factory.override(providers.Factory(
+            MatrixSequenceFactory, matrix_factory=matrix_container.matrix_factory))
+        matrix_container.shape_sequence_factory.override(
+            providers.Factory(ValidShapeSequenceFactory))
+        generate_matrix_sequence = matrix_container.generate_matrix_sequence()
+        matrices = generate_matrix_sequence(length=5)
+        # calculating expected result
+        expected_result_matrix = reduce(lambda m1, m2: numpy.dot(
+            m1, to_ndarray(m2)), matrices[1:], to_ndarray(matrices[0]))
+        # executing command under test twice with the products cached and calculated in float32
+        with commands_container.config.precision.override("float32"), \
+                commands_container.config.pair_cache.override("enabled"):
+            hits = commands_container.product_cache().hits
+            with multiprocessing.Pool() as pool:
+                for _ in range(2):
+                    result_matrix = await async_multiprocess_matrices_multiplication(pool=pool, matrices=matrices)
+                    self.assertEqual(numpy.float32, to_ndarray(matrix=result_matrix).dtype)
+                    numpy.testing.assert_allclose(to_ndarray(matrix=result_matrix), expected_result_matrix, rtol=1e-4)
+            # the second time all the products are taken from the cache
+            self.assertEqual(hits + 4, commands_container.product_cache().hits)
+
+    async def test_unsupported_transport_is_rejected(self):
+        matrices = [NDArrayMatrixAdapter(matrix=numpy.ones(shape=(2, 2))) for _ in range(2)]
+        with commands_container.config.transport.override("shared_memory"):
+            with multiprocessing.Pool(processes=1) as pool:
+                # the synchronous commands are still built with the transport
+                result_matrix = multiprocess_matrices_multiplication(pool=pool, matrices=matrices)
+                numpy.testing.assert_array_equal(2 * numpy.ones(shape=(2, 2)), to_ndarray(matrix=result_matrix))
+                result_matrix.release()
+                with self.assertRaisesRegex(ValueError, "shared_memory"):
+                    await async_multiprocess_matrices_multiplication(pool=pool, matrices=matrices)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import concurrent.futures
+import gc
+import multiprocessing
+import unittest
+import weakref
+from functools import reduce
+
+import numpy
+
+from matrix_multiplication import CompiledMatrixMultiplication
+from matrix_multiplication.containers import MatrixMultiplicationCommandsContainer
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+
+
+class TestCompiledMatrixMultiplication(unittest.TestCase):
+    def test_concurrent_calls_with_different_pools(self):
+        compiled = CompiledMatrixMultiplication()
+        chains = [[numpy.random.rand(5 + i, 6), numpy.random.rand(6, 4), numpy.random.rand(4, 3 + i)] for i in range(8)]
+        with multiprocessing.Pool(processes=1) as pool1, multiprocessing.Pool(processes=1) as pool2:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(compiled.multiply, pool=pool1 if index % 2 else pool2,
+                                           matrices=[NDArrayMatrixAdapter(matrix=array) for array in chain])
+                           for index, chain in enumerate(chains)]
+                for chain, future in zip(chains, futures):
+                    numpy.testing.assert_array_almost_equal(
+                        to_ndarray(matrix=future.result()), reduce(numpy.dot, chain))
+
+    def test_configuration_is_read_at_compilation(self):
+        container = MatrixMultiplicationCommandsContainer()
+        container.config.granularity.from_value("cell")
+        compiled = CompiledMatrixMultiplication(container=container)
+        self.assertTrue(compiled.matches(config=container.config()))
+        container.config.granularity.from_value("block")
+        self.assertFalse(compiled.matches(config=container.config()))
+
+    def test_batch_multiplication(self):
+        compiled = CompiledMatrixMultiplication()
+        pairs = [(numpy.random.rand(3, 4), numpy.random.rand(4, 2)) for _ in range(5)]
+        with multiprocessing.Pool(processes=1) as pool:
+            products = compiled.multiply_batch(
+                pool=pool, chains=[[NDArrayMatrixAdapter(matrix=array) for array in pair] for pair in pairs])
+        for (array1, array2), product in zip(pairs, products):
+            numpy.testing.assert_array_almost_equal(to_ndarray(matrix=product), numpy.dot(array1, array2))
+
+    def test_commands_of_closed_pool_are_dropped(self):
+        compiled = CompiledMatrixMultiplication()
+        with multiprocessing.Pool(processes=1) as pool:
+            compiled.multiply(pool=pool, matrices=[NDArrayMatrixAdapter(matrix=numpy.random.rand(3, 3))] * 2)
+        reference = weakref.ref(pool)
+        del pool
+        gc.collect()
+        self.assertIsNone(reference())
+        self.assertEqual(0, len(compiled._commands))
+
+
+if __name__ == "__main__":
+    unittest.main()
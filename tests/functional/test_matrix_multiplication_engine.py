@@ -0,0 +1,54 @@
+import unittest
+
+import numpy
+
+from matrix_multiplication import MatrixMultiplicationEngine
+from matrix_multiplication.containers import MatrixMultiplicationCommandsContainer
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+
+
+class TestMatrixMultiplicationEngine(unittest.TestCase):
+    def test_products_against_resident_matrix(self):
+        weights = numpy.random.rand(20, 7)
+        inputs = [numpy.random.rand(5 + i, 20) for i in range(5)]
+        with MatrixMultiplicationEngine(processes=2) as engine:
+            engine.register(name="weights", matrix=NDArrayMatrixAdapter(matrix=weights))
+            for array in inputs:
+                result_matrix = engine.multiply(NDArrayMatrixAdapter(matrix=array), "weights")
+                numpy.testing.assert_array_almost_equal(
+                    to_ndarray(matrix=result_matrix), numpy.dot(array, weights))
+
+    def test_products_referring_to_handles(self):
+        array1, array2, array3 = numpy.random.rand(4, 6), numpy.random.rand(6, 3), numpy.random.rand(3, 5)
+        with MatrixMultiplicationEngine(processes=2) as engine:
+            handle1 = engine.register(name="first", matrix=NDArrayMatrixAdapter(matrix=array1))
+            handle3 = engine.register(name="third", matrix=NDArrayMatrixAdapter(matrix=array3))
+            result_matrix = engine.multiply(handle1, NDArrayMatrixAdapter(matrix=array2), handle3)
+            numpy.testing.assert_array_almost_equal(
+                to_ndarray(matrix=result_matrix), array1 @ array2 @ array3)
+
+    def test_resident_matrix_is_registered_in_compute_type(self):
+        weights, inputs = numpy.random.rand(20, 7), numpy.random.rand(5, 20)
+        container = MatrixMultiplicationCommandsContainer()
+        container.config.transport.from_value("shared_memory")
+        container.config.precision.from_value("float32")
+        with MatrixMultiplicationEngine(processes=1, container=container) as engine:
+            handle = engine.register(name="weights", matrix=NDArrayMatrixAdapter(matrix=weights))
+            self.assertEqual(numpy.float32, handle.dtype)
+            result_matrix = engine.multiply(NDArrayMatrixAdapter(matrix=inputs), "weights")
+            numpy.testing.assert_allclose(to_ndarray(matrix=result_matrix), numpy.dot(inputs, weights), rtol=1e-5)
+
+    def test_invalid_sequence_multiplication(self):
+        with MatrixMultiplicationEngine(processes=1) as engine:
+            engine.register(name="weights", matrix=NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(3, 3))))
+            with self.assertRaises(ValueError):
+                engine.multiply(NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(2, 2))), "weights")
+
+    def test_unknown_name_raises_key_error(self):
+        with MatrixMultiplicationEngine(processes=1) as engine:
+            with self.assertRaises(KeyError):
+                engine.multiply("weights", "weights")
+
+
+if __name__ == "__main__":
+    unittest.main()
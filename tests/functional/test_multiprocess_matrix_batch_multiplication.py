@@ -0,0 +1,38 @@
+import multiprocessing
+import unittest
+
+import numpy
+
+from matrix_multiplication import multiprocess_matrices_batch_multiplication
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+
+
+class TestMultiprocessMatrixBatchMultiplication(unittest.TestCase):
+    def test_thousand_random_pairs_multiplication(self):
+        arrays = [(numpy.random.rand(4, 3), numpy.random.rand(3, 5)) for _ in range(1000)]
+        chains = [[NDArrayMatrixAdapter(matrix=array1), NDArrayMatrixAdapter(matrix=array2)] for array1, array2 in arrays]
+        with multiprocessing.Pool() as pool:
+            products = multiprocess_matrices_batch_multiplication(pool=pool, chains=chains)
+        self.assertEqual(len(arrays), len(products))
+        for (array1, array2), product in zip(arrays, products):
+            numpy.testing.assert_array_almost_equal(numpy.dot(array1, array2), to_ndarray(matrix=product))
+
+    def test_chains_of_different_length_multiplication(self):
+        arrays = [[numpy.random.rand(2, 2)], [numpy.random.rand(3, 2), numpy.random.rand(2, 4), numpy.random.rand(4, 1)]]
+        with multiprocessing.Pool() as pool:
+            products = multiprocess_matrices_batch_multiplication(
+                pool=pool, chains=[[NDArrayMatrixAdapter(matrix=array) for array in chain] for chain in arrays])
+        numpy.testing.assert_array_almost_equal(arrays[0][0], to_ndarray(matrix=products[0]))
+        numpy.testing.assert_array_almost_equal(
+            numpy.linalg.multi_dot(arrays[1]), to_ndarray(matrix=products[1]))
+
+    def test_invalid_chain_raises_value_error(self):
+        chains = [[NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(2, 2))), NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(2, 2)))],
+                  [NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(2, 3))), NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(2, 2)))]]
+        with self.assertRaisesRegex(ValueError, "chain 1"):
+            with multiprocessing.Pool() as pool:
+                multiprocess_matrices_batch_multiplication(pool=pool, chains=chains)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,10 @@ import numpy
 from dependency_injector import containers, providers
 
 from matrix_multiplication import multiprocess_matrices_multiplication
-from matrix_multiplication.matrix.adapters import to_ndarray
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+from matrix_multiplication.matrix.mapped import MemmapMatrixAdapter
+from matrix_multiplication.matrix.sparse import SparseMatrixAdapter
+from matrix_multiplication.utils.matrix_multiplication import commands_container
 from tests.functional.utils.container import MatrixContainer
 from tests.functional.utils.matrix import RandomMatrixFactory, ZeroMatrixFactory, MatrixSequenceFactory, ValidShapeSequenceFactory, InvalidShapeSequenceFactory
 
@@ -55,6 +58,123 @@ class TestMultiprocessMatrixSequenceMultiplication(unittest.TestCase):
             numpy.testing.assert_array_almost_equal(
                 to_ndarray(matrix=result_matrix), expected_result_matrix)
 
+    def test_random_matrices_cell_granularity_multiplication(self):
+        # generating random matrix pair
+        matrix_container = MatrixContainer()
+        matrix_container.matrix_factory.override(
+            providers.Factory(RandomMatrixFactory))
+        matrix_container.matrix_sequence_factory.override(providers.Factory(
+            MatrixSequenceFactory, matrix_factory=matrix_container.matrix_factory))
+        matrix_container.shape_sequence_factory.override(
+            providers.Factory(ValidShapeSequenceFactory))
+        generate_matrix_sequence = matrix_container.generate_matrix_sequence()
+        matrices = generate_matrix_sequence(length=2)
+        # calculating expected result
+        expected_result_matrix = reduce(lambda m1, m2: numpy.dot(
+            m1, to_ndarray(m2)), matrices[1:], to_ndarray(matrices[0]))
+        # executing command under test with one task per result matrix cell
+        with commands_container.config.granularity.override("cell"):
+            with multiprocessing.Pool() as pool:
+                result_matrix = multiprocess_matrices_multiplication(
+                    pool=pool, matrices=matrices)
+                numpy.testing.assert_array_almost_equal(
+                    to_ndarray(matrix=result_matrix), expected_result_matrix)
+
+    def test_sparse_matrices_sparse_granularity_multiplication(self):
+        # generating sparse matrix pair with empty rows
+        array1, array2 = numpy.random.rand(60, 40), numpy.random.rand(40, 50)
+        array1[numpy.random.rand(60, 40) < 0.95] = 0
+        array1[10:20, :] = 0
+        array2[numpy.random.rand(40, 50) < 0.95] = 0
+        matrices = [SparseMatrixAdapter.from_ndarray(array=array1), NDArrayMatrixAdapter(matrix=array2)]
+        # executing command under test with one task per band of non-empty rows
+        for output in ("sparse", "dense"):
+            with self.subTest(output=output):
+                with commands_container.config.granularity.override("sparse"), \
+                        commands_container.config.sparse_output.override(output), \
+                        commands_container.config.band_nnz.override(16):
+                    with multiprocessing.Pool() as pool:
+                        result_matrix = multiprocess_matrices_multiplication(
+                            pool=pool, matrices=matrices)
+                self.assertIsInstance(
+                    result_matrix, SparseMatrixAdapter if output == "sparse" else NDArrayMatrixAdapter)
+                numpy.testing.assert_array_almost_equal(
+                    to_ndarray(matrix=result_matrix), numpy.dot(array1, array2))
+
+    def test_random_matrices_strassen_multiplication(self):
+        array1, array2 = numpy.random.rand(45, 38), numpy.random.rand(38, 51)
+        matrices = [NDArrayMatrixAdapter(matrix=array1), NDArrayMatrixAdapter(matrix=array2)]
+        # executing command under test
+        with commands_container.config.execution.override("strassen"), \
+                commands_container.config.strassen_threshold.override(8), \
+                commands_container.config.strassen_depth.override(2):
+            with multiprocessing.Pool() as pool:
+                result_matrix = multiprocess_matrices_multiplication(
+                    pool=pool, matrices=matrices)
+        numpy.testing.assert_array_almost_equal(
+            to_ndarray(matrix=result_matrix), numpy.dot(array1, array2))
+
+    def test_random_matrices_precision_multiplication(self):
+        array1, array2 = numpy.random.rand(70, 40), numpy.random.rand(40, 50)
+        for precision, dtype in (("native", numpy.float64), ("float32", numpy.float32), ("mixed", numpy.float32)):
+            with self.subTest(precision=precision):
+                # executing command under test
+                with commands_container.config.precision.override(precision):
+                    with multiprocessing.Pool() as pool:
+                        result_matrix = multiprocess_matrices_multiplication(
+                            pool=pool, matrices=[NDArrayMatrixAdapter(matrix=array1), NDArrayMatrixAdapter(matrix=array2)])
+                self.assertEqual(dtype, to_ndarray(matrix=result_matrix).dtype)
+                numpy.testing.assert_allclose(to_ndarray(matrix=result_matrix), numpy.dot(array1, array2), rtol=1e-5)
+
+    def test_cached_products_keep_their_type(self):
+        array1, array2 = numpy.random.rand(30, 20), numpy.random.rand(20, 10)
+        array1[array1 < 0.8] = 0
+        for transport, granularity, product_type in (("pickle", "sparse", SparseMatrixAdapter),
+                                                     ("memmap", "block", MemmapMatrixAdapter)):
+            with self.subTest(transport=transport, granularity=granularity):
+                # executing command under test
+                with commands_container.config.pair_cache.override("enabled"), \
+                        commands_container.config.transport.override(transport), \
+                        commands_container.config.granularity.override(granularity):
+                    with multiprocessing.Pool() as pool:
+                        result_matrix = multiprocess_matrices_multiplication(
+                            pool=pool, matrices=[NDArrayMatrixAdapter(matrix=array1), NDArrayMatrixAdapter(matrix=array2)])
+                self.assertIsInstance(result_matrix, product_type)
+                numpy.testing.assert_array_almost_equal(to_ndarray(matrix=result_matrix), numpy.dot(array1, array2))
+
+    def test_integer_matrices_integer_precision_multiplication(self):
+        array1 = numpy.random.randint(-128, 128, size=(30, 20)).astype(numpy.int8)
+        array2 = numpy.random.randint(-128, 128, size=(20, 10)).astype(numpy.int8)
+        # executing command under test
+        with commands_container.config.precision.override("integer"), \
+                commands_container.config.granularity.override("cell"):
+            with multiprocessing.Pool() as pool:
+                result_matrix = multiprocess_matrices_multiplication(
+                    pool=pool, matrices=[NDArrayMatrixAdapter(matrix=array1), NDArrayMatrixAdapter(matrix=array2)])
+        numpy.testing.assert_array_equal(
+            to_ndarray(matrix=result_matrix), numpy.dot(array1.astype(numpy.int64), array2.astype(numpy.int64)))
+        self.assertEqual(numpy.int64, to_ndarray(matrix=result_matrix).dtype)
+
+    def test_integer_matrices_integer_precision_transport_and_execution_multiplication(self):
+        array1 = numpy.random.randint(-128, 128, size=(30, 20)).astype(numpy.int8)
+        array2 = numpy.random.randint(-128, 128, size=(20, 10)).astype(numpy.int8)
+        for transport, execution, granularity in (("shared_memory", "pool", "block"), ("memmap", "pool", "block"),
+                                                  ("pickle", "strassen", "block"), ("pickle", "pool", "sparse")):
+            with self.subTest(transport=transport, execution=execution, granularity=granularity):
+                # executing command under test
+                with commands_container.config.precision.override("integer"), \
+                        commands_container.config.transport.override(transport), \
+                        commands_container.config.execution.override(execution), \
+                        commands_container.config.strassen_threshold.override(4), \
+                        commands_container.config.granularity.override(granularity), \
+                        commands_container.config.sparse_output.override("dense"):
+                    with multiprocessing.Pool() as pool:
+                        result_matrix = multiprocess_matrices_multiplication(
+                            pool=pool, matrices=[NDArrayMatrixAdapter(matrix=array1), NDArrayMatrixAdapter(matrix=array2)])
+                numpy.testing.assert_array_equal(
+                    to_ndarray(matrix=result_matrix), numpy.dot(array1.astype(numpy.int64), array2.astype(numpy.int64)))
+                self.assertEqual(numpy.int64, to_ndarray(matrix=result_matrix).dtype)
+
     def test_invalid_sequence_ten_matrices_multiplication(self):
         # generating random matrix pair
         matrix_container = MatrixContainer()
@@ -1,4 +1,6 @@
 import multiprocessing
+import os
+import tempfile
 import unittest
 from unittest.mock import Mock
 from functools import reduce
@@ -7,7 +9,10 @@ import numpy
 from dependency_injector import containers, providers
 
 from matrix_multiplication import multiprocess_matrices_multiplication
-from matrix_multiplication.matrix.adapters import to_ndarray
+from matrix_multiplication.commands.dispatching import CostModel, load_cost_model
+from matrix_multiplication.commands.planning import MemoryBudgetExceededError
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+from matrix_multiplication.utils.matrix_multiplication import commands_container
 from tests.functional.utils.container import MatrixContainer
 from tests.functional.utils.matrix import RandomMatrixFactory, ZeroMatrixFactory, MatrixSequenceFactory, ValidShapeSequenceFactory, InvalidShapeSequenceFactory
 
@@ -55,6 +60,126 @@ class TestMultiprocessMatrixSequenceMultiplication(unittest.TestCase):
             numpy.testing.assert_array_almost_equal(
                 to_ndarray(matrix=result_matrix), expected_result_matrix)
 
+    def test_ten_random_matrices_shared_memory_multiplication(self):
+        # generating random matrix sequence
+        matrix_container = MatrixContainer()
+        matrix_container.matrix_factory.override(
+            providers.Factory(RandomMatrixFactory))
+        matrix_container.matrix_sequence_factory.override(providers.Factory(
+            MatrixSequenceFactory, matrix_factory=matrix_container.matrix_factory))
+        matrix_container.shape_sequence_factory.override(
+            providers.Factory(ValidShapeSequenceFactory))
+        generate_matrix_sequence = matrix_container.generate_matrix_sequence()
+        matrices = generate_matrix_sequence(length=10)
+        # calculating expected result
+        expected_result_matrix = reduce(lambda m1, m2: numpy.dot(
+            m1, to_ndarray(m2)), matrices[1:], to_ndarray(matrices[0]))
+        # executing command under test with operands placed in shared memory
+        with commands_container.config.transport.override("shared_memory"):
+            with multiprocessing.Pool() as pool:
+                result_matrix = multiprocess_matrices_multiplication(
+                    pool=pool, matrices=matrices)
+                numpy.testing.assert_array_almost_equal(
+                    to_ndarray(matrix=result_matrix), expected_result_matrix)
+
+    def test_ten_random_matrices_memmap_multiplication(self):
+        # generating random matrix sequence
+        matrix_container = MatrixContainer()
+        matrix_container.matrix_factory.override(
+            providers.Factory(RandomMatrixFactory))
+        matrix_container.matrix_sequence_factory.override(providers.Factory(
+            MatrixSequenceFactory, matrix_factory=matrix_container.matrix_factory))
+        matrix_container.shape_sequence_factory.override(
+            providers.Factory(ValidShapeSequenceFactory))
+        generate_matrix_sequence = matrix_container.generate_matrix_sequence()
+        matrices = generate_matrix_sequence(length=10)
+        # calculating expected result
+        expected_result_matrix = reduce(lambda m1, m2: numpy.dot(
+            m1, to_ndarray(m2)), matrices[1:], to_ndarray(matrices[0]))
+        # executing command under test with operands and results placed in memory-mapped files
+        with tempfile.TemporaryDirectory() as directory:
+            with commands_container.config.transport.override("memmap"), \
+                    commands_container.config.memmap_directory.override(directory):
+                with multiprocessing.Pool() as pool:
+                    result_matrix = multiprocess_matrices_multiplication(
+                        pool=pool, matrices=matrices)
+                    numpy.testing.assert_array_almost_equal(
+                        to_ndarray(matrix=result_matrix), expected_result_matrix)
+            # only the result file is left
+            self.assertEqual([result_matrix.path], [os.path.join(directory, name) for name in os.listdir(directory)])
+            result_matrix.release()
+            self.assertEqual([], os.listdir(directory))
+
+    def test_ten_random_matrices_adaptive_execution_multiplication(self):
+        # generating random matrix sequence
+        matrix_container = MatrixContainer()
+        matrix_container.matrix_factory.override(
+            providers.Factory(RandomMatrixFactory))
+        matrix_container.matrix_sequence_factory.override(providers.Factory(
+            MatrixSequenceFactory, matrix_factory=matrix_container.matrix_factory))
+        matrix_container.shape_sequence_factory.override(
+            providers.Factory(ValidShapeSequenceFactory))
+        generate_matrix_sequence = matrix_container.generate_matrix_sequence()
+        matrices = generate_matrix_sequence(length=10)
+        # calculating expected result
+        expected_result_matrix = reduce(lambda m1, m2: numpy.dot(
+            m1, to_ndarray(m2)), matrices[1:], to_ndarray(matrices[0]))
+        # executing command under test with the execution mode chosen per product by the calibrated cost model
+        with tempfile.TemporaryDirectory() as directory:
+            cost_model_path = os.path.join(directory, "cost_model.json")
+            # the cost model singleton is replaced, so the model is calibrated with the pool of this test
+            with commands_container.config.execution.override("adaptive"), \
+                    commands_container.config.cost_model_path.override(cost_model_path), \
+                    commands_container.cost_model.override(providers.Singleton(
+                        load_cost_model, pool=commands_container.pool, path=cost_model_path)):
+                with multiprocessing.Pool() as pool:
+                    result_matrix = multiprocess_matrices_multiplication(
+                        pool=pool, matrices=matrices)
+                    numpy.testing.assert_array_almost_equal(
+                        to_ndarray(matrix=result_matrix), expected_result_matrix)
+            # the calibrated cost model is saved for the next start
+            self.assertEqual(CostModel.load(path=cost_model_path).to_dict().keys(), CostModel().to_dict().keys())
+
+    def test_ten_random_matrices_unordered_completion_multiplication(self):
+        # generating random matrix sequence
+        matrix_container = MatrixContainer()
+        matrix_container.matrix_factory.override(
+            providers.Factory(RandomMatrixFactory))
+        matrix_container.matrix_sequence_factory.override(providers.Factory(
+            MatrixSequenceFactory, matrix_factory=matrix_container.matrix_factory))
+        matrix_container.shape_sequence_factory.override(
+            providers.Factory(ValidShapeSequenceFactory))
+        generate_matrix_sequence = matrix_container.generate_matrix_sequence()
+        matrices = generate_matrix_sequence(length=10)
+        # calculating expected result
+        expected_result_matrix = reduce(lambda m1, m2: numpy.dot(
+            m1, to_ndarray(m2)), matrices[1:], to_ndarray(matrices[0]))
+        # executing command under test collecting results as soon as they are ready
+        with commands_container.config.ordered.override(False):
+            with multiprocessing.Pool() as pool:
+                result_matrix = multiprocess_matrices_multiplication(
+                    pool=pool, matrices=matrices)
+                numpy.testing.assert_array_almost_equal(
+                    to_ndarray(matrix=result_matrix), expected_result_matrix)
+
+    def test_generated_sequence_multiplication(self):
+        arrays = [numpy.random.rand(rows, columns) for rows, columns in ((4, 6), (6, 3), (3, 5))]
+        expected_result_matrix = reduce(numpy.dot, arrays)
+        # executing command under test on the sequence walked only once
+        with multiprocessing.Pool() as pool:
+            result_matrix = multiprocess_matrices_multiplication(
+                pool=pool, matrices=(NDArrayMatrixAdapter(matrix=array) for array in arrays))
+        numpy.testing.assert_array_almost_equal(
+            to_ndarray(matrix=result_matrix), expected_result_matrix)
+
+    def test_sequence_exceeding_memory_budget_multiplication(self):
+        matrices = [NDArrayMatrixAdapter(matrix=numpy.zeros((64, 64))) for _ in range(3)]
+        # executing command under test
+        with commands_container.config.memory_budget.override(64 * 64 * 8 * 3):
+            with self.assertRaises(MemoryBudgetExceededError):
+                with multiprocessing.Pool() as pool:
+                    multiprocess_matrices_multiplication(pool=pool, matrices=matrices)
+
     def test_invalid_sequence_ten_matrices_multiplication(self):
         # generating random matrix sequence
         matrix_container = MatrixContainer()
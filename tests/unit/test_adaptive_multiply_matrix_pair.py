@@ -0,0 +1,109 @@
+"""This module tests methods of :class:`CostModel` and :class:`AdaptiveMultiplyMatrixPair`
+in :module:`matrix_multiplication.commands.dispatching`
+"""
+from __future__ import annotations
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+import numpy
+
+from matrix_multiplication.abc.task import TaskProcessor
+from matrix_multiplication.commands.dispatching import CostModel, AdaptiveMultiplyMatrixPair, pool_size
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+
+# inline is the fastest for small products, threads for medium and processes for large ones
+COST_MODEL = CostModel(inline_rate=1e9, thread_rate=2e9, process_rate=8e9, thread_overhead=1e-4,
+                       process_overhead=5e-2, transfer_rate=1e12)
+
+
+class TestCostModel(unittest.TestCase):
+    """This test case checks if the cost model chooses the fastest execution mode and survives saving
+    """
+
+    def test_mode_depends_on_shapes(self):
+        self.assertEqual("inline", COST_MODEL.choose(shape1=(4, 4), shape2=(4, 4)))
+        self.assertEqual("threads", COST_MODEL.choose(shape1=(300, 300), shape2=(300, 300)))
+        self.assertEqual("processes", COST_MODEL.choose(shape1=(2000, 2000), shape2=(2000, 2000)))
+
+    def test_saved_model_is_loaded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cost_model.json")
+            COST_MODEL.save(path=path)
+            self.assertEqual(COST_MODEL.to_dict(), CostModel.load(path=path).to_dict())
+
+    def test_column_blocks_are_sent_for_each_row_of_tiles(self):
+        cost_model = CostModel(process_overhead=0., process_rate=1e30, transfer_rate=1.)
+        # 4 x 4 tiles of 8 x 8 result, both operands are sent twice and the result once
+        self.assertEqual(8 * (2 * 8 * 5 + 2 * 5 * 8 + 8 * 8), cost_model.estimate(
+            shape1=(8, 5), shape2=(5, 8), mode="processes", tile_size=4))
+        self.assertEqual(8 * (8 * 5 + 5 * 8 + 8 * 8), cost_model.estimate(shape1=(8, 5), shape2=(5, 8), mode="processes"))
+
+    def test_pool_size_is_the_number_of_workers(self):
+        self.assertEqual(3, pool_size(pool=Mock(_processes=3)))
+        self.assertEqual(2, pool_size(pool=Mock(_processes=3), processes=2))
+
+    def test_unknown_mode_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            COST_MODEL.estimate(shape1=(1, 1), shape2=(1, 1), mode="gpu")
+
+
+class TestCall(unittest.TestCase):
+    """This test case checks if the adaptive command evaluates the products in the chosen way
+    """
+
+    def _multiply(self, size: int):
+        array1, array2 = numpy.random.rand(size, size), numpy.random.rand(size, size)
+        task_processor = Mock(TaskProcessor, side_effect=lambda tasks: [task() for task in tasks])
+        multiply_matrix_pair = AdaptiveMultiplyMatrixPair(
+            cost_model=COST_MODEL, task_processor=task_processor, processes=2, threads=2)
+        result = multiply_matrix_pair(matrix1=NDArrayMatrixAdapter(matrix=array1), matrix2=NDArrayMatrixAdapter(matrix=array2))
+        numpy.testing.assert_array_almost_equal(numpy.dot(array1, array2), to_ndarray(matrix=result))
+        return task_processor
+
+    def test_small_product_is_calculated_inline(self):
+        self._multiply(size=4).assert_not_called()
+
+    def test_medium_product_is_calculated_by_threads(self):
+        self._multiply(size=300).assert_not_called()
+
+    def test_threads_are_given_by_the_thread_task_processor(self):
+        thread_task_processor = Mock(TaskProcessor, side_effect=lambda tasks: [task() for task in tasks])
+        multiply_matrix_pair = AdaptiveMultiplyMatrixPair(
+            cost_model=COST_MODEL, task_processor=Mock(TaskProcessor), threads=2,
+            thread_task_processor=thread_task_processor)
+        array = numpy.random.rand(300, 300)
+        for _ in range(2):
+            result = multiply_matrix_pair(matrix1=NDArrayMatrixAdapter(matrix=array), matrix2=NDArrayMatrixAdapter(matrix=array))
+            numpy.testing.assert_array_almost_equal(numpy.dot(array, array), to_ndarray(matrix=result))
+        self.assertEqual(2, thread_task_processor.call_count)
+
+    def test_mode_is_chosen_for_the_itemsize_of_the_operands(self):
+        cost_model = Mock(CostModel, wraps=COST_MODEL)
+        multiply_matrix_pair = AdaptiveMultiplyMatrixPair(
+            cost_model=cost_model, task_processor=Mock(TaskProcessor), processes=2, tasks_per_worker=2)
+        array = numpy.ones(shape=(4, 4), dtype=numpy.float32)
+        multiply_matrix_pair(matrix1=NDArrayMatrixAdapter(matrix=array), matrix2=NDArrayMatrixAdapter(matrix=array))
+        cost_model.choose.assert_called_once_with(shape1=(4, 4), shape2=(4, 4), itemsize=4, tile_size=2)
+
+    def test_large_product_is_calculated_by_processes_in_tiles(self):
+        cost_model = CostModel(inline_rate=1., thread_rate=1., process_rate=1e12, thread_overhead=1., process_overhead=0.)
+        tile_counts = list()
+
+        def process_tasks(tasks):
+            results = [task() for task in tasks]
+            tile_counts.append(len(results))
+            return results
+
+        task_processor = Mock(TaskProcessor, side_effect=process_tasks)
+        multiply_matrix_pair = AdaptiveMultiplyMatrixPair(
+            cost_model=cost_model, task_processor=task_processor, processes=2, tasks_per_worker=2)
+        array1, array2 = numpy.random.rand(8, 5), numpy.random.rand(5, 8)
+        result = multiply_matrix_pair(matrix1=NDArrayMatrixAdapter(matrix=array1), matrix2=NDArrayMatrixAdapter(matrix=array2))
+        numpy.testing.assert_array_almost_equal(numpy.dot(array1, array2), to_ndarray(matrix=result))
+        # 8 x 8 result split between 2 workers with 2 tasks each gives 4 x 4 tiles
+        self.assertEqual([4], tile_counts)
+
+if __name__ == "__main__":
+    unittest.main()
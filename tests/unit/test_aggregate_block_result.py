@@ -0,0 +1,41 @@
+"""This module tests methods of :class:`AggregateBlockResult` in :module:`matrix_multiplication.commands.matrix_multiplication`
+"""
+from __future__ import annotations
+import unittest
+
+import numpy
+
+from matrix_multiplication.commands.matrix_multiplication import AggregateBlockResult
+from matrix_multiplication.matrix.adapters import to_ndarray
+
+
+class TestCall(unittest.TestCase):
+    def test_tiles_placed_in_row_major_order(self):
+        expected_matrix = numpy.arange(30, dtype=float).reshape((5, 6))
+        tiles = [expected_matrix[0:4, 0:4], expected_matrix[0:4, 4:6],
+                 expected_matrix[4:5, 0:4], expected_matrix[4:5, 4:6]]
+        aggregate_result = AggregateBlockResult(tile_size=4)
+        matrix = aggregate_result(shape=(5, 6), results=tiles)
+        numpy.testing.assert_array_equal(to_ndarray(matrix=matrix), expected_matrix)
+
+    def test_unordered_tiles_placed_by_index(self):
+        expected_matrix = numpy.arange(30, dtype=float).reshape((5, 6))
+        tiles = [(3, expected_matrix[4:5, 4:6]), (0, expected_matrix[0:4, 0:4]),
+                 (2, expected_matrix[4:5, 0:4]), (1, expected_matrix[0:4, 4:6])]
+        aggregate_result = AggregateBlockResult(tile_size=4, ordered=False)
+        matrix = aggregate_result(shape=(5, 6), results=tiles)
+        numpy.testing.assert_array_equal(to_ndarray(matrix=matrix), expected_matrix)
+
+    def test_missing_tiles_raise_value_error(self):
+        aggregate_result = AggregateBlockResult(tile_size=4)
+        with self.assertRaises(ValueError):
+            aggregate_result(shape=(5, 6), results=[numpy.zeros(shape=(4, 4))])
+
+    def test_no_tiles_produce_empty_matrix_of_given_shape(self):
+        aggregate_result = AggregateBlockResult(tile_size=4)
+        matrix = aggregate_result(shape=(0, 3), results=[])
+        self.assertEqual((matrix.column_len(), matrix.row_len()), (0, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
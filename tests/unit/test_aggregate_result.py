@@ -4,11 +4,38 @@ from __future__ import annotations
 import unittest
 from unittest.mock import Mock, call
 
+import numpy
+
 from matrix_multiplication.commands.matrix_multiplication import AggregateResult
+from matrix_multiplication.matrix.adapters import to_ndarray
 
 
 class TestCall(unittest.TestCase):
-    pass
+    def test_results_placed_in_row_major_order(self):
+        aggregate_result = AggregateResult()
+        matrix = aggregate_result(shape=(2, 3), results=iter([0.0, 1.0, 2.0, 3.0, 4.0, 5.0]))
+        numpy.testing.assert_array_equal(to_ndarray(matrix=matrix), numpy.arange(6, dtype=float).reshape((2, 3)))
+
+    def test_unordered_results_placed_by_index(self):
+        aggregate_result = AggregateResult(ordered=False)
+        matrix = aggregate_result(shape=(2, 2), results=[(3, 3.0), (0, 0.0), (2, 2.0), (1, 1.0)])
+        numpy.testing.assert_array_equal(to_ndarray(matrix=matrix), numpy.arange(4, dtype=float).reshape((2, 2)))
+
+    def test_result_dtype_preserved(self):
+        aggregate_result = AggregateResult()
+        matrix = aggregate_result(shape=(1, 2), results=[numpy.int64(1), numpy.int64(2)])
+        self.assertEqual(numpy.int64, to_ndarray(matrix=matrix).dtype)
+
+    def test_missing_results_raise_value_error(self):
+        aggregate_result = AggregateResult()
+        with self.assertRaises(ValueError):
+            aggregate_result(shape=(2, 2), results=[0.0, 1.0, 2.0])
+
+    def test_no_results_produce_empty_matrix_of_given_shape(self):
+        aggregate_result = AggregateResult()
+        matrix = aggregate_result(shape=(0, 3), results=[])
+        self.assertEqual((matrix.column_len(), matrix.row_len()), (0, 3))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,36 @@
+"""This module tests methods of :class:`AsyncMultiprocessTaskProcessor` in :module:`matrix_multiplication.task.processor`
+"""
+from __future__ import annotations
+import unittest
+import unittest.mock as mock
+from multiprocessing.pool import ThreadPool
+
+from dependency_injector import containers, providers
+
+from matrix_multiplication.abc.task import Task
+from matrix_multiplication.task.processor import AsyncMultiprocessTaskProcessor
+
+
+class Container(containers.DeclarativeContainer):
+    processor = providers.Factory(AsyncMultiprocessTaskProcessor)
+
+
+class TestCall(unittest.IsolatedAsyncioTestCase):
+    async def test_results_returned_in_task_order(self):
+        tasks = [mock.Mock(Task, return_value=i * i) for i in range(10)]
+        container = Container()
+        with ThreadPool(processes=4) as pool:
+            processor = container.processor(pool=pool)
+            self.assertEqual([i * i for i in range(10)], await processor(tasks=tasks))
+
+    async def test_task_error_raised(self):
+        tasks = [mock.Mock(Task, return_value=0), mock.Mock(Task, side_effect=ValueError)]
+        container = Container()
+        with ThreadPool(processes=2) as pool:
+            processor = container.processor(pool=pool)
+            with self.assertRaises(ValueError):
+                await processor(tasks=tasks)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""This module tests methods of :class:`BuildBatchTasks` and :class:`MultiplyMatrixBatch`
+in :module:`matrix_multiplication.commands.batching`
+"""
+from __future__ import annotations
+import unittest
+from unittest.mock import Mock
+
+import numpy
+
+from matrix_multiplication.abc.task import TaskProcessor
+from matrix_multiplication.commands.batching import BuildBatchTasks, MultiplyMatrixBatch
+from matrix_multiplication.kernel import Precision
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+
+
+def _chain(*shapes):
+    return [NDArrayMatrixAdapter(matrix=numpy.random.rand(*shape)) for shape in shapes]
+
+
+class TestCall(unittest.TestCase):
+    """This test case checks if the chains are packed into batches bounded by their cost
+    """
+
+    def test_small_chains_share_one_task(self):
+        build_tasks = BuildBatchTasks(batch_cost=1 << 20)
+        tasks = list(build_tasks(chains=[_chain((2, 3), (3, 2)) for _ in range(100)]))
+        self.assertEqual(1, len(tasks))
+        self.assertEqual(100, len(tasks[0]()))
+
+    def test_batches_are_bounded_by_cost(self):
+        # each chain costs 2 * 2 * 2 * 2 flops plus 8 elements
+        build_tasks = BuildBatchTasks(batch_cost=48)
+        tasks = list(build_tasks(chains=[_chain((2, 2), (2, 2)) for _ in range(10)]))
+        self.assertEqual([2] * 5, [len(task()) for task in tasks])
+
+    def test_large_chain_gets_own_task(self):
+        build_tasks = BuildBatchTasks(batch_cost=100)
+        tasks = list(build_tasks(chains=[_chain((1, 1), (1, 1)), _chain((10, 10), (10, 10)), _chain((1, 1), (1, 1))]))
+        self.assertEqual([1, 1, 1], [len(task()) for task in tasks])
+
+    def test_products_are_returned_in_chain_order(self):
+        chains = [_chain((2, 3), (3, 4), (4, 1)), _chain((5, 5)), _chain((1, 2), (2, 3))]
+        task_processor = Mock(TaskProcessor, side_effect=lambda tasks: (task() for task in tasks))
+        multiply_matrix_batch = MultiplyMatrixBatch(build_tasks=BuildBatchTasks(batch_cost=20),
+                                                    task_processor=task_processor)
+        products = multiply_matrix_batch(chains=chains)
+        self.assertEqual(len(chains), len(products))
+        for chain, product in zip(chains, products):
+            expected = to_ndarray(matrix=chain[0])
+            for matrix in chain[1:]:
+                expected = numpy.dot(expected, to_ndarray(matrix=matrix))
+            numpy.testing.assert_array_almost_equal(expected, to_ndarray(matrix=product))
+
+    def test_unordered_results_are_put_in_chain_order(self):
+        chains = [_chain((1, 1)) for _ in range(4)]
+        task_processor = Mock(TaskProcessor, side_effect=lambda tasks: reversed(list(enumerate(task() for task in tasks))))
+        multiply_matrix_batch = MultiplyMatrixBatch(build_tasks=BuildBatchTasks(batch_cost=1),
+                                                    task_processor=task_processor, ordered=False)
+        products = multiply_matrix_batch(chains=chains)
+        self.assertEqual([to_ndarray(matrix=chain[0]).tolist() for chain in chains],
+                         [to_ndarray(matrix=product).tolist() for product in products])
+
+    def test_single_matrix_chain_is_copied_in_output_type(self):
+        array = numpy.arange(6, dtype=numpy.int8).reshape(2, 3)
+        task_processor = Mock(TaskProcessor, side_effect=lambda tasks: (task() for task in tasks))
+        for mode, dtype in (("native", numpy.int8), ("integer", numpy.int64)):
+            with self.subTest(mode=mode):
+                multiply_matrix_batch = MultiplyMatrixBatch(
+                    build_tasks=BuildBatchTasks(precision=Precision.from_mode(mode=mode)), task_processor=task_processor)
+                product, = multiply_matrix_batch(chains=[[NDArrayMatrixAdapter(matrix=array)]])
+                self.assertEqual(dtype, product.dtype)
+                numpy.testing.assert_array_equal(array, to_ndarray(matrix=product))
+                # the product is owned by the batch, so it must not be the matrix of the caller
+                self.assertFalse(numpy.shares_memory(array, product.get_row_block(0, product.column_len())))
+
+    def test_non_positive_batch_cost_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            BuildBatchTasks(batch_cost=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
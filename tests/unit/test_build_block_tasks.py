@@ -0,0 +1,55 @@
+"""This module tests methods of :class:`BuildBlockTasks` in :module:`matrix_multiplication.commands.matrix_multiplication`
+"""
+from __future__ import annotations
+import unittest
+from unittest.mock import Mock
+
+import numpy
+
+from matrix_multiplication.commands.matrix_multiplication import BuildBlockTasks
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter
+
+
+class TestCall(unittest.TestCase):
+    """This test case checks if the tile task builder for matrix pair multiplication works correctly
+    """
+
+    def test_zero_sized_matrices_generate_zero_tasks(self):
+        matrix1, matrix2 = Mock(), Mock()
+        matrix1.column_len = Mock(return_value=0)
+        matrix2.row_len = Mock(return_value=0)
+        build_tasks = BuildBlockTasks(tile_size=4)
+        tasks = list(build_tasks(matrix1=matrix1, matrix2=matrix2))
+        self.assertEqual(0, len(tasks))
+
+    def test_tile_count_rounds_up_to_cover_matrix(self):
+        matrix1 = NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(10, 3)))
+        matrix2 = NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(3, 5)))
+        build_tasks = BuildBlockTasks(tile_size=4)
+        tasks = list(build_tasks(matrix1=matrix1, matrix2=matrix2))
+        self.assertEqual(3 * 2, len(tasks))
+
+    def test_tiles_cover_matrix_product(self):
+        array1, array2 = numpy.random.rand(7, 3), numpy.random.rand(3, 5)
+        build_tasks = BuildBlockTasks(tile_size=4)
+        tasks = build_tasks(matrix1=NDArrayMatrixAdapter(matrix=array1), matrix2=NDArrayMatrixAdapter(matrix=array2))
+        tiles = [task() for task in tasks]
+        result = numpy.block([tiles[0:2], tiles[2:4]])
+        numpy.testing.assert_array_almost_equal(result, numpy.dot(array1, array2))
+
+    def test_column_blocks_are_laid_out_by_columns(self):
+        kernel = Mock(return_value=numpy.zeros(shape=(4, 4)))
+        build_tasks = BuildBlockTasks(tile_size=4, kernel=kernel)
+        for task in build_tasks(matrix1=NDArrayMatrixAdapter(matrix=numpy.random.rand(8, 6)),
+                                matrix2=NDArrayMatrixAdapter(matrix=numpy.random.rand(6, 8))):
+            task()
+        self.assertEqual(4, kernel.call_count)
+        self.assertTrue(all(columns.flags.f_contiguous for (_, columns), _ in kernel.call_args_list))
+
+    def test_non_positive_tile_size_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            BuildBlockTasks(tile_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""This module tests methods of :class:`BuildSharedBlockTasks` in :module:`matrix_multiplication.commands.matrix_multiplication`
+"""
+from __future__ import annotations
+import unittest
+from unittest.mock import Mock
+
+import numpy
+
+from matrix_multiplication.abc.storage import ABCArrayReference
+from matrix_multiplication.commands.matrix_multiplication import BuildSharedBlockTasks
+from matrix_multiplication.matrix.shared import SharedArray
+
+
+class TestCall(unittest.TestCase):
+    def test_zero_sized_result_generate_zero_tasks(self):
+        matrix1, matrix2, result = Mock(ABCArrayReference), Mock(ABCArrayReference), Mock(ABCArrayReference)
+        result.shape = Mock(return_value=(0, 0))
+        build_tasks = BuildSharedBlockTasks(tile_size=4)
+        self.assertEqual(0, len(list(build_tasks(matrix1=matrix1, matrix2=matrix2, result=result))))
+
+    def test_tile_count_rounds_up_to_cover_result(self):
+        matrix1, matrix2, result = Mock(ABCArrayReference), Mock(ABCArrayReference), Mock(ABCArrayReference)
+        result.shape = Mock(return_value=(10, 5))
+        build_tasks = BuildSharedBlockTasks(tile_size=4)
+        self.assertEqual(3 * 2, len(list(build_tasks(matrix1=matrix1, matrix2=matrix2, result=result))))
+
+    def test_tasks_write_matrix_product_into_shared_result(self):
+        array1, array2 = numpy.random.rand(7, 3), numpy.random.rand(3, 5)
+        matrix1, matrix2 = SharedArray.from_ndarray(array=array1), SharedArray.from_ndarray(array=array2)
+        result = SharedArray(shape=(7, 5), dtype=float)
+        build_tasks = BuildSharedBlockTasks(tile_size=4)
+        for task in build_tasks(matrix1=matrix1.reference, matrix2=matrix2.reference, result=result.reference):
+            task()
+        numpy.testing.assert_array_almost_equal(result.array, numpy.dot(array1, array2))
+        for shared_array in (matrix1, matrix2, result):
+            shared_array.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
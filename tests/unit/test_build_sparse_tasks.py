@@ -0,0 +1,77 @@
+"""This module tests methods of :class:`BuildSparseTasks` and :class:`AggregateSparseResult`
+in :module:`matrix_multiplication.commands.sparse`
+"""
+from __future__ import annotations
+import unittest
+
+import numpy
+
+from matrix_multiplication.commands.sparse import BuildSparseTasks, AggregateSparseResult
+from matrix_multiplication.kernel import Precision
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+from matrix_multiplication.matrix.sparse import SparseMatrixAdapter
+
+
+class TestCall(unittest.TestCase):
+    """This test case checks if the sparse task builder skips empty rows and the bands cover the product
+    """
+
+    def setUp(self):
+        self.array1 = numpy.array([[0., 2., 0.], [0., 0., 0.], [1., 0., 3.], [0., 0., 0.]])
+        self.array2 = numpy.array([[0., 4.], [5., 0.], [-1., 0.]])
+
+    def test_empty_rows_get_no_tasks(self):
+        build_tasks = BuildSparseTasks(band_nnz=1)
+        tasks = list(build_tasks(matrix1=NDArrayMatrixAdapter(matrix=self.array1),
+                                 matrix2=NDArrayMatrixAdapter(matrix=self.array2)))
+        self.assertEqual([[0], [2]], [task()[0].tolist() for task in tasks])
+
+    def test_zero_matrix_generates_zero_tasks(self):
+        build_tasks = BuildSparseTasks()
+        tasks = list(build_tasks(matrix1=NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(5, 3))),
+                                 matrix2=NDArrayMatrixAdapter(matrix=self.array2)))
+        self.assertEqual(0, len(tasks))
+
+    def test_bands_cover_matrix_product(self):
+        array1, array2 = numpy.random.rand(40, 30), numpy.random.rand(30, 20)
+        array1[numpy.random.rand(40, 30) < 0.9] = 0
+        array2[numpy.random.rand(30, 20) < 0.9] = 0
+        for band_nnz in (1, 10, 1000):
+            with self.subTest(band_nnz=band_nnz):
+                tasks = BuildSparseTasks(band_nnz=band_nnz)(
+                    matrix1=SparseMatrixAdapter.from_ndarray(array=array1), matrix2=NDArrayMatrixAdapter(matrix=array2))
+                result = AggregateSparseResult()(shape=(40, 20), results=[task() for task in tasks])
+                numpy.testing.assert_array_almost_equal(numpy.dot(array1, array2), to_ndarray(matrix=result))
+
+    def test_cancelled_products_are_not_stored(self):
+        tasks = BuildSparseTasks()(matrix1=NDArrayMatrixAdapter(matrix=numpy.array([[1., 1.]])),
+                                   matrix2=NDArrayMatrixAdapter(matrix=numpy.array([[1., 2.], [-1., 3.]])))
+        result = AggregateSparseResult()(shape=(1, 2), results=[task() for task in tasks])
+        self.assertEqual(1, result.nnz)
+        numpy.testing.assert_array_equal([[0., 5.]], to_ndarray(matrix=result))
+
+    def test_unordered_bands_are_aggregated_into_dense_matrix(self):
+        tasks = BuildSparseTasks(band_nnz=1)(matrix1=NDArrayMatrixAdapter(matrix=self.array1),
+                                             matrix2=NDArrayMatrixAdapter(matrix=self.array2))
+        results = reversed(list(enumerate(task() for task in tasks)))
+        result = AggregateSparseResult(output="dense", ordered=False)(shape=(4, 2), results=results)
+        self.assertIsInstance(result, NDArrayMatrixAdapter)
+        numpy.testing.assert_array_equal(numpy.dot(self.array1, self.array2), to_ndarray(matrix=result))
+
+    def test_products_are_summed_up_in_accumulation_type(self):
+        array1 = numpy.random.randint(-128, 128, size=(12, 9)).astype(numpy.int8)
+        array2 = numpy.random.randint(-128, 128, size=(9, 7)).astype(numpy.int8)
+        tasks = BuildSparseTasks(band_nnz=10, precision=Precision.from_mode("integer"))(
+            matrix1=NDArrayMatrixAdapter(matrix=array1), matrix2=NDArrayMatrixAdapter(matrix=array2))
+        result = AggregateSparseResult(output="dense")(shape=(12, 7), results=[task() for task in tasks])
+        self.assertEqual(numpy.int64, to_ndarray(matrix=result).dtype)
+        numpy.testing.assert_array_equal(
+            numpy.dot(array1.astype(numpy.int64), array2.astype(numpy.int64)), to_ndarray(matrix=result))
+
+    def test_non_positive_band_size_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            BuildSparseTasks(band_nnz=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,8 @@ from __future__ import annotations
 import unittest
 from unittest.mock import Mock, call
 
+import numpy
+
 from matrix_multiplication.commands.matrix_multiplication import BuildTasks
 
 
@@ -16,7 +18,7 @@ class TestCall(unittest.TestCase):
         matrix1.column_len = Mock(return_value=0)
         matrix2.row_len = Mock(return_value=0)
         build_tasks = BuildTasks()
-        tasks = build_tasks(matrix1=matrix1, matrix2=matrix2)
+        tasks = list(build_tasks(matrix1=matrix1, matrix2=matrix2))
         self.assertEqual(matrix1.column_len() * matrix2.row_len(), len(tasks))
 
     def test_first_matrix_with_zero_rows_called_get_row_zero_times(self):
@@ -24,7 +26,7 @@ class TestCall(unittest.TestCase):
         matrix1.column_len = Mock(return_value=0)
         matrix2.row_len = Mock(return_value=0)
         build_tasks = BuildTasks()
-        tasks = build_tasks(matrix1=matrix1, matrix2=matrix2)
+        tasks = list(build_tasks(matrix1=matrix1, matrix2=matrix2))
         self.assertEqual(matrix1.column_len() * matrix2.row_len(), len(tasks))
 
     def test_second_matrix_with_zero_cols_called_get_column_zero_times(self):
@@ -32,25 +34,43 @@ class TestCall(unittest.TestCase):
         matrix1.column_len = Mock(return_value=0)
         matrix2.row_len = Mock(return_value=0)
         build_tasks = BuildTasks()
-        tasks = build_tasks(matrix1=matrix1, matrix2=matrix2)
+        tasks = list(build_tasks(matrix1=matrix1, matrix2=matrix2))
         self.assertEqual(matrix1.column_len() * matrix2.row_len(), len(tasks))
 
     def test_matrix1_with_one_row_and_matrix2_with_one_col_generate_single_task(self):
         matrix1, matrix2 = Mock(), Mock()
         matrix1.column_len = Mock(return_value=1)
+        matrix1.get_row_block = Mock(return_value=numpy.zeros(shape=(1, 3)))
         matrix2.row_len = Mock(return_value=1)
+        matrix2.get_column_block = Mock(return_value=numpy.zeros(shape=(3, 1)))
         build_tasks = BuildTasks()
-        tasks = build_tasks(matrix1=matrix1, matrix2=matrix2)
+        tasks = list(build_tasks(matrix1=matrix1, matrix2=matrix2))
         self.assertEqual(matrix1.column_len() * matrix2.row_len(), len(tasks))
 
     def test_matrix1_with_ten_rows_and_matrix2_with_ten_cols_generate_hundreed_tasks(self):
         matrix1, matrix2 = Mock(), Mock()
         matrix1.column_len = Mock(return_value=10)
+        matrix1.get_row_block = Mock(return_value=numpy.zeros(shape=(10, 3)))
         matrix2.row_len = Mock(return_value=10)
+        matrix2.get_column_block = Mock(return_value=numpy.zeros(shape=(3, 10)))
         build_tasks = BuildTasks()
-        tasks = build_tasks(matrix1=matrix1, matrix2=matrix2)
+        tasks = list(build_tasks(matrix1=matrix1, matrix2=matrix2))
         self.assertEqual(matrix1.column_len() * matrix2.row_len(), len(tasks))
 
+    def test_operands_are_sliced_in_bulk(self):
+        matrix1, matrix2 = Mock(), Mock()
+        matrix1.column_len = Mock(return_value=4)
+        matrix1.get_row_block = Mock(return_value=numpy.arange(8).reshape((4, 2)))
+        matrix2.row_len = Mock(return_value=3)
+        matrix2.get_column_block = Mock(return_value=numpy.arange(6).reshape((2, 3)))
+        build_tasks = BuildTasks()
+        cells = [task() for task in build_tasks(matrix1=matrix1, matrix2=matrix2)]
+        matrix1.get_row_block.assert_called_once_with(0, 4)
+        matrix2.get_column_block.assert_called_once_with(0, 3)
+        matrix1.get_row.assert_not_called()
+        matrix2.get_column.assert_not_called()
+        numpy.testing.assert_array_equal(numpy.dot(numpy.arange(8).reshape((4, 2)), numpy.arange(6).reshape((2, 3))).ravel(), cells)
+
 
 if __name__ == "__main__":
     unittest.main()
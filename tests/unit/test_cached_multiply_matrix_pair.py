@@ -0,0 +1,121 @@
+"""This module tests methods of :class:`CachedMultiplyMatrixPair` and :class:`ProductCache` in :module:`matrix_multiplication.commands.caching`
+"""
+from __future__ import annotations
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+import numpy
+
+from matrix_multiplication.abc.matrix import ABCMatrix
+from matrix_multiplication.abc.matrix_multiplication import ABCAsyncMultiplyMatrixPair, ABCMultiplyMatrixPair
+from matrix_multiplication.commands.caching import AsyncCachedMultiplyMatrixPair, CachedMultiplyMatrixPair, ProductCache
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+from matrix_multiplication.matrix.mapped import MemmapMatrixAdapter
+from matrix_multiplication.matrix.sparse import SparseMatrixAdapter
+
+
+def multiply_matrix_pair_mock() -> Mock:
+    return Mock(ABCMultiplyMatrixPair, side_effect=lambda matrix1, matrix2: NDArrayMatrixAdapter(
+        matrix=numpy.dot(to_ndarray(matrix=matrix1), to_ndarray(matrix=matrix2))))
+
+
+class TestCall(unittest.TestCase):
+    def test_identical_operands_multiplied_once(self):
+        multiply_matrix_pair = multiply_matrix_pair_mock()
+        array1, array2 = numpy.random.rand(3, 4), numpy.random.rand(4, 2)
+        command = CachedMultiplyMatrixPair(multiply_matrix_pair=multiply_matrix_pair, cache=ProductCache())
+        for i in range(3):
+            # every call gets operands equal by content but distinct by identity
+            result = command(matrix1=NDArrayMatrixAdapter(matrix=array1.copy()),
+                             matrix2=NDArrayMatrixAdapter(matrix=array2.copy()))
+            numpy.testing.assert_array_almost_equal(to_ndarray(matrix=result), numpy.dot(array1, array2))
+        multiply_matrix_pair.assert_called_once()
+
+    def test_hits_and_misses_counted(self):
+        cache = ProductCache()
+        command = CachedMultiplyMatrixPair(multiply_matrix_pair=multiply_matrix_pair_mock(), cache=cache)
+        matrix1, matrix2 = NDArrayMatrixAdapter(matrix=numpy.ones(shape=(2, 2))), NDArrayMatrixAdapter(matrix=numpy.eye(2))
+        command(matrix1=matrix1, matrix2=matrix2)
+        command(matrix1=matrix1, matrix2=matrix2)
+        command(matrix1=matrix2, matrix2=matrix1)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_operands_of_different_shape_with_same_data_do_not_collide(self):
+        multiply_matrix_pair = multiply_matrix_pair_mock()
+        command = CachedMultiplyMatrixPair(multiply_matrix_pair=multiply_matrix_pair, cache=ProductCache())
+        data = numpy.arange(4, dtype=float)
+        command(matrix1=NDArrayMatrixAdapter(matrix=data.reshape((1, 4))), matrix2=NDArrayMatrixAdapter(matrix=data.reshape((4, 1))))
+        result = command(matrix1=NDArrayMatrixAdapter(matrix=data.reshape((4, 1))), matrix2=NDArrayMatrixAdapter(matrix=data.reshape((1, 4))))
+        self.assertEqual((result.column_len(), result.row_len()), (4, 4))
+
+    def test_sparse_product_is_returned_as_it_is(self):
+        product = SparseMatrixAdapter.from_ndarray(array=numpy.eye(2))
+        multiply_matrix_pair = Mock(ABCMultiplyMatrixPair, return_value=product)
+        cache = ProductCache()
+        command = CachedMultiplyMatrixPair(multiply_matrix_pair=multiply_matrix_pair, cache=cache)
+        matrix = NDArrayMatrixAdapter(matrix=numpy.eye(2))
+        for i in range(2):
+            self.assertIs(product, command(matrix1=matrix, matrix2=matrix))
+        self.assertEqual(0, cache.size)
+
+    def test_sparse_and_memory_mapped_operands_bypass_cache(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        array = numpy.random.rand(3, 3)
+        mapped = MemmapMatrixAdapter.from_matrix(
+            matrix=NDArrayMatrixAdapter(matrix=array), path=os.path.join(directory.name, "matrix.npy"))
+        for matrix in (SparseMatrixAdapter.from_ndarray(array=array), mapped):
+            with self.subTest(matrix=type(matrix).__name__):
+                product = Mock(ABCMatrix)
+                multiply_matrix_pair = Mock(ABCMultiplyMatrixPair, return_value=product)
+                cache = ProductCache()
+                command = CachedMultiplyMatrixPair(multiply_matrix_pair=multiply_matrix_pair, cache=cache)
+                self.assertIs(product, command(matrix1=matrix, matrix2=NDArrayMatrixAdapter(matrix=array)))
+                self.assertIs(product, command(matrix1=NDArrayMatrixAdapter(matrix=array), matrix2=matrix))
+                self.assertEqual((0, 0), (cache.hits, cache.misses))
+
+
+class TestProductCache(unittest.TestCase):
+    def test_least_recently_used_product_evicted(self):
+        matrix = numpy.zeros(shape=(2, 2))
+        cache = ProductCache(max_bytes=2 * matrix.nbytes)
+        cache.put(key=b"a", matrix=matrix)
+        cache.put(key=b"b", matrix=matrix)
+        cache.get(key=b"a")
+        cache.put(key=b"c", matrix=matrix)
+        self.assertIsNone(cache.get(key=b"b"))
+        self.assertIsNotNone(cache.get(key=b"a"))
+        self.assertEqual(2 * matrix.nbytes, cache.size)
+
+    def test_product_larger_than_cache_not_cached(self):
+        cache = ProductCache(max_bytes=8)
+        cache.put(key=b"a", matrix=numpy.zeros(shape=(2, 2)))
+        self.assertEqual(0, cache.size)
+
+
+class TestAsyncCall(unittest.IsolatedAsyncioTestCase):
+    async def test_cache_is_shared_with_synchronous_command(self):
+        cache = ProductCache()
+        array1, array2 = numpy.random.rand(3, 4), numpy.random.rand(4, 2)
+        CachedMultiplyMatrixPair(multiply_matrix_pair=multiply_matrix_pair_mock(), cache=cache)(
+            matrix1=NDArrayMatrixAdapter(matrix=array1), matrix2=NDArrayMatrixAdapter(matrix=array2))
+        multiply_matrix_pair = AsyncMock(ABCAsyncMultiplyMatrixPair)
+        command = AsyncCachedMultiplyMatrixPair(multiply_matrix_pair=multiply_matrix_pair, cache=cache)
+        result = await command(matrix1=NDArrayMatrixAdapter(matrix=array1.copy()),
+                               matrix2=NDArrayMatrixAdapter(matrix=array2.copy()))
+        numpy.testing.assert_array_almost_equal(to_ndarray(matrix=result), numpy.dot(array1, array2))
+        multiply_matrix_pair.assert_not_called()
+
+    async def test_sparse_operands_bypass_cache(self):
+        cache = ProductCache()
+        matrix1 = SparseMatrixAdapter.from_ndarray(array=numpy.eye(3))
+        multiply_matrix_pair = AsyncMock(ABCAsyncMultiplyMatrixPair, return_value=matrix1)
+        command = AsyncCachedMultiplyMatrixPair(multiply_matrix_pair=multiply_matrix_pair, cache=cache)
+        self.assertIs(matrix1, await command(matrix1=matrix1, matrix2=matrix1))
+        self.assertEqual((0, 0), (cache.hits, cache.misses))
+
+
+if __name__ == "__main__":
+    unittest.main()
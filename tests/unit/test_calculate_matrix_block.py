@@ -0,0 +1,22 @@
+from __future__ import annotations
+import unittest
+import random
+
+import numpy
+
+from matrix_multiplication.commands.matrix_multiplication import CalculateBlock
+
+
+class TestCall(unittest.TestCase):
+    """This test case checks if the calculation of any result matrix tile works correctly
+    """
+    def test_calculation(self):
+        n = random.randint(10, 20)
+        rows = numpy.random.rand(4, n)
+        columns = numpy.random.rand(n, 3)
+        command = CalculateBlock(rows=rows, columns=columns)
+        numpy.testing.assert_array_almost_equal(numpy.dot(rows, columns), command.__call__())
+
+
+if __name__ == "__main__":
+    unittest.main()
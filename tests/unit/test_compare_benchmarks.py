@@ -0,0 +1,32 @@
+"""This module tests :func:`compare_runs` in :module:`benchmarks.compare`
+"""
+from __future__ import annotations
+import unittest
+
+from benchmarks.compare import compare_runs
+
+
+def run(*timings):
+    return {"cases": [{"name": name, "params": {"size": size}, "min": timing} for name, size, timing in timings]}
+
+
+class TestCompareRuns(unittest.TestCase):
+    def test_slowdown_above_threshold_flagged(self):
+        comparisons = compare_runs(baseline=run(("pair", 8, 1.0)), current=run(("pair", 8, 1.5)), threshold=0.1)
+        self.assertTrue(comparisons[0]["regression"])
+
+    def test_slowdown_below_threshold_not_flagged(self):
+        comparisons = compare_runs(baseline=run(("pair", 8, 1.0)), current=run(("pair", 8, 1.05)), threshold=0.1)
+        self.assertFalse(comparisons[0]["regression"])
+
+    def test_slowdown_below_min_delta_not_flagged(self):
+        comparisons = compare_runs(baseline=run(("pair", 8, 0.001)), current=run(("pair", 8, 0.002)), min_delta=0.01)
+        self.assertFalse(comparisons[0]["regression"])
+
+    def test_only_common_cases_compared(self):
+        comparisons = compare_runs(baseline=run(("pair", 8, 1.0), ("pair", 16, 1.0)), current=run(("pair", 16, 1.0), ("pair", 32, 1.0)))
+        self.assertEqual([{"size": 16}], [comparison["params"] for comparison in comparisons])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""This module tests methods of :class:`ExecutePlan` and :class:`ConcurrentExecutePlan` in :module:`matrix_multiplication.commands.scheduling`
+"""
+from __future__ import annotations
+import threading
+import unittest
+from unittest.mock import Mock, call
+
+from matrix_multiplication.commands.planning import LeafPlan, ProductPlan
+from matrix_multiplication.commands.scheduling import ExecutePlan, ConcurrentExecutePlan
+
+
+def balanced_plan() -> ProductPlan:
+    # (M0 M1) (M2 M3)
+    return ProductPlan(
+        left=ProductPlan(left=LeafPlan(index=0, shape=(2, 2)), right=LeafPlan(index=1, shape=(2, 2))),
+        right=ProductPlan(left=LeafPlan(index=2, shape=(2, 2)), right=LeafPlan(index=3, shape=(2, 2))))
+
+
+class TestExecutePlanCall(unittest.TestCase):
+    def test_pairs_multiplied_in_plan_order(self):
+        multiply_matrix_pair = Mock(side_effect=lambda matrix1, matrix2: (matrix1, matrix2))
+        matrices = ["a", "b", "c", "d"]
+        result = ExecutePlan(multiply_matrix_pair=multiply_matrix_pair)(plan=balanced_plan(), matrices=matrices)
+        self.assertEqual((("a", "b"), ("c", "d")), result)
+
+    def test_leaf_plan_returns_matrix(self):
+        multiply_matrix_pair = Mock()
+        command = ExecutePlan(multiply_matrix_pair=multiply_matrix_pair)
+        self.assertEqual("a", command(plan=LeafPlan(index=0, shape=(1, 1)), matrices=["a"]))
+        multiply_matrix_pair.assert_not_called()
+
+
+class TestConcurrentExecutePlanCall(unittest.TestCase):
+    def test_pairs_multiplied_in_plan_order(self):
+        multiply_matrix_pair = Mock(side_effect=lambda matrix1, matrix2: (matrix1, matrix2))
+        matrices = ["a", "b", "c", "d"]
+        command = ConcurrentExecutePlan(multiply_matrix_pair=multiply_matrix_pair)
+        self.assertEqual((("a", "b"), ("c", "d")), command(plan=balanced_plan(), matrices=matrices))
+        multiply_matrix_pair.assert_has_calls(
+            [call(matrix1="a", matrix2="b"), call(matrix1="c", matrix2="d")], any_order=True)
+
+    def test_independent_products_run_concurrently(self):
+        # both independent products have to reach the barrier, otherwise it is broken by timeout
+        barrier = threading.Barrier(parties=2, timeout=5)
+
+        def multiply_matrix_pair(matrix1, matrix2):
+            if isinstance(matrix1, str):
+                barrier.wait()
+            return (matrix1, matrix2)
+
+        command = ConcurrentExecutePlan(multiply_matrix_pair=multiply_matrix_pair)
+        self.assertEqual((("a", "b"), ("c", "d")), command(plan=balanced_plan(), matrices=["a", "b", "c", "d"]))
+
+    def test_product_error_is_raised(self):
+        multiply_matrix_pair = Mock(side_effect=ValueError)
+        command = ConcurrentExecutePlan(multiply_matrix_pair=multiply_matrix_pair)
+        with self.assertRaises(ValueError):
+            command(plan=balanced_plan(), matrices=["a", "b", "c", "d"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""This module checks numerical equivalence of the kernels in :module:`matrix_multiplication.kernel.kernels`
+"""
+from __future__ import annotations
+import unittest
+import random
+
+import numpy
+
+from matrix_multiplication.kernel import PythonKernel, NumpyKernel, BLASKernel, Precision
+
+KERNELS = (PythonKernel(), NumpyKernel(), BLASKernel())
+
+
+class TestCall(unittest.TestCase):
+    """This test case checks if all the kernels produce the same results
+    """
+
+    def test_vector_products_are_equivalent(self):
+        n = random.randint(10, 20)
+        row, column = numpy.random.rand(n), numpy.random.rand(n)
+        expected_value = sum([row[i] * column[i] for i in range(0, n)])
+        for kernel in KERNELS:
+            with self.subTest(kernel=type(kernel).__name__):
+                self.assertAlmostEqual(expected_value, kernel(row, column))
+
+    def test_python_lists_products_are_equivalent(self):
+        n = random.randint(10, 20)
+        row, column = [random.random() for i in range(n)], [random.random() for i in range(n)]
+        expected_value = sum([row[i] * column[i] for i in range(0, n)])
+        for kernel in KERNELS:
+            with self.subTest(kernel=type(kernel).__name__):
+                self.assertAlmostEqual(expected_value, kernel(row, column))
+
+    def test_block_products_are_equivalent(self):
+        rows, columns = numpy.random.rand(7, 11), numpy.random.rand(11, 5)
+        expected_tile = rows @ columns
+        for kernel in KERNELS:
+            with self.subTest(kernel=type(kernel).__name__):
+                numpy.testing.assert_array_almost_equal(expected_tile, kernel(rows, columns))
+
+    def test_strided_block_products_are_equivalent(self):
+        matrix1, matrix2 = numpy.random.rand(8, 12), numpy.random.rand(12, 10)
+        rows, columns = matrix1[1:7:2, ::3], matrix2[::3, 2:9]
+        expected_tile = rows @ columns
+        for kernel in KERNELS:
+            with self.subTest(kernel=type(kernel).__name__):
+                numpy.testing.assert_array_almost_equal(expected_tile, kernel(rows, columns))
+
+    def test_integer_block_products_are_equal(self):
+        rows, columns = numpy.random.randint(-50, 50, size=(6, 9)), numpy.random.randint(-50, 50, size=(9, 4))
+        expected_tile = rows @ columns
+        for kernel in KERNELS:
+            with self.subTest(kernel=type(kernel).__name__):
+                numpy.testing.assert_array_equal(expected_tile, kernel(rows, columns))
+
+    def test_empty_inner_dimension_produces_zeros(self):
+        rows, columns = numpy.zeros(shape=(3, 0)), numpy.zeros(shape=(0, 2))
+        for kernel in KERNELS:
+            with self.subTest(kernel=type(kernel).__name__):
+                numpy.testing.assert_array_equal(numpy.zeros(shape=(3, 2)), kernel(rows, columns))
+
+
+class TestPrecision(unittest.TestCase):
+    """This test case checks if the kernels sum up and return the products in the types of the precision
+    """
+
+    def test_native_precision_keeps_operand_type(self):
+        rows, columns = numpy.random.rand(4, 3).astype(numpy.float32), numpy.random.rand(3, 2).astype(numpy.float32)
+        for kernel in KERNELS:
+            with self.subTest(kernel=type(kernel).__name__):
+                self.assertEqual(numpy.float32, kernel(rows, columns).dtype)
+                self.assertEqual(numpy.float32, kernel(rows[0], columns[:, 0]).dtype)
+
+    def test_mixed_precision_accumulates_in_float64(self):
+        precision = Precision.from_mode(mode="mixed")
+        # float32 sums lose the small terms added to the large one
+        rows, columns = numpy.array([[1e8, 1., 1., 1., 1.]], dtype=numpy.float32), numpy.ones((5, 1), dtype=numpy.float32)
+        for kernel_type in (PythonKernel, NumpyKernel, BLASKernel):
+            with self.subTest(kernel=kernel_type.__name__):
+                tile = kernel_type(precision=precision)(rows, columns)
+                self.assertEqual(numpy.float32, tile.dtype)
+                self.assertEqual(numpy.float32(1e8 + 4), tile[0, 0])
+
+    def test_integer_precision_accumulates_in_int64(self):
+        precision = Precision.from_mode(mode="integer")
+        rows, columns = numpy.full((2, 3), 100, dtype=numpy.int8), numpy.full((3, 2), 100, dtype=numpy.int8)
+        for kernel_type in (PythonKernel, NumpyKernel, BLASKernel):
+            with self.subTest(kernel=kernel_type.__name__):
+                numpy.testing.assert_array_equal(numpy.full((2, 2), 30000, dtype=numpy.int64),
+                                                 kernel_type(precision=precision)(rows, columns))
+
+    def test_integer_precision_rejects_overflow_and_floats(self):
+        kernel = BLASKernel(precision=Precision.from_mode(mode="integer"))
+        with self.assertRaises(OverflowError):
+            kernel(numpy.full((2, 2), 2 ** 32), numpy.full((2, 2), 2 ** 31))
+        with self.assertRaises(ValueError):
+            kernel(numpy.ones((2, 2)), numpy.ones((2, 2)))
+
+    def test_unknown_mode_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            Precision.from_mode(mode="float16")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+"""This module tests lazy attributes of :module:`matrix_multiplication`
+"""
+from __future__ import annotations
+import subprocess
+import sys
+import unittest
+
+
+class TestLazyImports(unittest.TestCase):
+    """This test case checks if the workers importing tasks and kernels do not import the containers
+    """
+
+    def _imported_modules(self, statement: str):
+        script = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+        return subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout.split()
+
+    def test_task_import_skips_containers(self):
+        modules = self._imported_modules(
+            statement="from matrix_multiplication.commands.matrix_multiplication import CalculateBlock")
+        self.assertNotIn("matrix_multiplication.containers", modules)
+        self.assertNotIn("dependency_injector", modules)
+
+    def test_public_names_are_imported_on_access(self):
+        modules = self._imported_modules(statement="from matrix_multiplication import multiprocess_matrices_multiplication")
+        self.assertIn("matrix_multiplication.containers", modules)
+
+    def test_unknown_name_raises_attribute_error(self):
+        import matrix_multiplication
+        with self.assertRaises(AttributeError):
+            matrix_multiplication.missing_function
+
+
+if __name__ == "__main__":
+    unittest.main()
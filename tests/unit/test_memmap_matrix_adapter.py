@@ -0,0 +1,71 @@
+"""This module tests methods of :class:`MemmapMatrixAdapter` in :module:`matrix_multiplication.matrix.mapped`
+"""
+from __future__ import annotations
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy
+
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+from matrix_multiplication.matrix.mapped import MemmapMatrixAdapter
+
+
+class TestMemmapMatrixAdapter(unittest.TestCase):
+    """This test case checks if the matrices are read from and written to memory-mapped files
+    """
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._directory.name, name)
+
+    def test_npy_file_is_opened_with_its_shape_and_dtype(self):
+        array = numpy.random.rand(5, 3).astype(numpy.float32)
+        numpy.save(self._path("matrix.npy"), array)
+        matrix = MemmapMatrixAdapter.open(path=self._path("matrix.npy"))
+        self.assertEqual((5, 3), (matrix.column_len(), matrix.row_len()))
+        self.assertEqual(numpy.float32, matrix.dtype)
+        numpy.testing.assert_array_equal(array, to_ndarray(matrix=matrix))
+
+    def test_raw_file_requires_dtype(self):
+        numpy.arange(6, dtype=numpy.int64).tofile(self._path("matrix.bin"))
+        with self.assertRaises(ValueError):
+            MemmapMatrixAdapter.open(path=self._path("matrix.bin"), shape=(2, 3))
+        matrix = MemmapMatrixAdapter.open(path=self._path("matrix.bin"), shape=(2, 3), dtype=numpy.int64)
+        numpy.testing.assert_array_equal([1, 4], matrix.get_column(1))
+
+    def test_reference_opens_same_data_after_pickling(self):
+        array = numpy.random.rand(4, 6)
+        matrix = MemmapMatrixAdapter.from_matrix(
+            matrix=NDArrayMatrixAdapter(matrix=array), path=self._path("matrix.npy"), order="F")
+        reference = pickle.loads(pickle.dumps(matrix.reference))
+        opened = reference.open()
+        self.assertTrue(opened.flags.f_contiguous)
+        numpy.testing.assert_array_equal(array, opened)
+
+    def test_writable_reference_writes_into_file(self):
+        matrix = MemmapMatrixAdapter.create(path=self._path("result.npy"), shape=(2, 2), dtype=float)
+        result = matrix.reference.open()
+        result[1, :] = [3., 4.]
+        result.flush()
+        numpy.testing.assert_array_equal([[0., 0.], [3., 4.]], numpy.load(self._path("result.npy")))
+
+    def test_temporary_file_is_removed_on_release(self):
+        matrix = MemmapMatrixAdapter.create(path=self._path("result.npy"), shape=(2, 2), dtype=float, temporary=True)
+        matrix.release()
+        self.assertFalse(os.path.exists(self._path("result.npy")))
+
+    def test_persisted_file_is_kept_on_release(self):
+        matrix = MemmapMatrixAdapter.create(path=self._path("result.npy"), shape=(2, 2), dtype=float, temporary=True)
+        matrix.persist(path=self._path("kept.npy"))
+        self.assertEqual(self._path("kept.npy"), matrix.path)
+        matrix.release()
+        self.assertTrue(os.path.exists(self._path("kept.npy")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ from dependency_injector import containers, providers
 
 from matrix_multiplication.abc.task import Task
 from matrix_multiplication.commands.matrix_multiplication import MultiplyMatrixSequence
+from matrix_multiplication.commands.planning import LeafPlan, ProductPlan
 
 
 class CommandContainer(containers.DeclarativeContainer):
@@ -36,6 +37,20 @@ class TestCall(unittest.TestCase):
         command = container.matrix_sequence_multiplication(multiply_matrix_pair=multiply_matrix_pair)
         self.assertEqual(command(matrices), multiply_matrix_pair())
 
+    def test_pairs_multiplied_in_plan_order(self):
+        multiply_matrix_pair = Mock()
+        matrices = [Mock() for i in range(3)]
+        plan_matrix_chain = Mock(return_value=ProductPlan(
+            left=LeafPlan(index=0, shape=(1, 2)),
+            right=ProductPlan(left=LeafPlan(index=1, shape=(2, 3)), right=LeafPlan(index=2, shape=(3, 4)))))
+        container = CommandContainer()
+        command = container.matrix_sequence_multiplication(
+            multiply_matrix_pair=multiply_matrix_pair, plan_matrix_chain=plan_matrix_chain)
+        command(matrices)
+        multiply_matrix_pair.assert_has_calls(
+            [call(matrix1=matrices[1], matrix2=matrices[2]),
+             call(matrix1=matrices[0], matrix2=multiply_matrix_pair())], any_order=False)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,159 @@
+"""This module tests mutation of :class:`matrix_multiplication.matrix.adapters.NDArrayMatrixAdapter`
+"""
+from __future__ import annotations
+import unittest
+
+import numpy
+
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+
+
+class TestAppend(unittest.TestCase):
+    """This test case checks if the rows are appended keeping the matrix two-dimensional
+    """
+
+    def test_append_keeps_matrix_shape(self):
+        array = numpy.arange(6, dtype=float).reshape((2, 3))
+        matrix = NDArrayMatrixAdapter(matrix=array)
+        matrix.append([6., 7., 8.])
+        self.assertEqual(3, matrix.column_len())
+        self.assertEqual(3, matrix.row_len())
+        numpy.testing.assert_array_equal(numpy.arange(9, dtype=float).reshape((3, 3)), to_ndarray(matrix))
+
+    def test_append_does_not_modify_given_array(self):
+        array = numpy.zeros(shape=(2, 2))
+        matrix = NDArrayMatrixAdapter(matrix=array)
+        matrix.append([1., 1.])
+        matrix.append([2., 2.])
+        numpy.testing.assert_array_equal(numpy.zeros(shape=(2, 2)), array)
+
+    def test_append_to_empty_matrix_adopts_row_length(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.empty(shape=(0, 0)))
+        for index in range(100):
+            matrix.append([index, index + 1])
+        expected = numpy.array([[index, index + 1] for index in range(100)], dtype=float)
+        numpy.testing.assert_array_equal(expected, to_ndarray(matrix))
+
+    def test_append_row_of_different_length_raises(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(2, 2)))
+        with self.assertRaises(ValueError):
+            matrix.append([1., 2., 3.])
+
+    def test_append_promotes_dtype(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(1, 2), dtype=int))
+        matrix.append([0.5, 1.5])
+        self.assertEqual(numpy.dtype(float), matrix.get_row(1).dtype)
+        numpy.testing.assert_array_equal([0.5, 1.5], matrix.get_row(1))
+
+
+class TestExtend(unittest.TestCase):
+    """This test case checks if the rows are appended in bulk
+    """
+
+    def test_extend_appends_all_rows(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.ones(shape=(1, 3)))
+        matrix.extend([[2., 2., 2.], [3., 3., 3.]])
+        matrix.append([4., 4., 4.])
+        expected = numpy.repeat(numpy.arange(1., 5.), 3).reshape((4, 3))
+        numpy.testing.assert_array_equal(expected, to_ndarray(matrix))
+
+    def test_extend_followed_by_reshape(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.empty(shape=(0, 0)))
+        matrix.extend(numpy.arange(6, dtype=float).reshape((6, 1)))
+        matrix.reshape((2, 3))
+        numpy.testing.assert_array_equal(numpy.arange(6, dtype=float).reshape((2, 3)), to_ndarray(matrix))
+        matrix.append([6., 7., 8.])
+        self.assertEqual(3, matrix.column_len())
+
+    def test_extend_reads_generator_of_rows(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.empty(shape=(0, 0)))
+        matrix.extend([float(index)] * 3 for index in range(4))
+        numpy.testing.assert_array_equal(numpy.repeat(numpy.arange(4.), 3).reshape((4, 3)), to_ndarray(matrix))
+
+    def test_extend_by_no_rows_changes_nothing(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.ones(shape=(2, 3)))
+        matrix.extend([])
+        matrix.extend(row for row in [])
+        numpy.testing.assert_array_equal(numpy.ones(shape=(2, 3)), to_ndarray(matrix))
+
+
+class TestBlocks(unittest.TestCase):
+    """This test case checks if the row and the column blocks are sliced from the matrix
+    """
+
+    def test_row_block_is_slice_of_rows(self):
+        array = numpy.random.rand(5, 4)
+        matrix = NDArrayMatrixAdapter(matrix=array)
+        numpy.testing.assert_array_equal(array[1:3, :], matrix.get_row_block(1, 3))
+
+    def test_column_block_is_slice_of_columns(self):
+        array = numpy.random.rand(5, 4)
+        matrix = NDArrayMatrixAdapter(matrix=array)
+        numpy.testing.assert_array_equal(array[:, 2:4], matrix.get_column_block(2, 4))
+
+    def test_blocks_do_not_include_spare_capacity(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(1, 2)))
+        matrix.append([1., 1.])
+        self.assertEqual((2, 2), matrix.get_column_block(0, 2).shape)
+        self.assertEqual((2, 2), matrix.get_row_block(0, 10).shape)
+
+
+class TestColumnMajorCache(unittest.TestCase):
+    """This test case checks if the columns are read from the cached column-major copy of the matrix
+    """
+
+    def test_columns_are_contiguous(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.random.rand(6, 4), owned=True)
+        self.assertTrue(matrix.get_column(1).flags.c_contiguous)
+        self.assertTrue(matrix.get_column_block(1, 3).flags.f_contiguous)
+
+    def test_column_major_copy_is_made_once(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.random.rand(6, 4), owned=True)
+        self.assertIs(matrix.get_column(0).base, matrix.get_column(3).base)
+
+    def test_fortran_ordered_matrix_is_not_copied(self):
+        array = numpy.asfortranarray(numpy.random.rand(6, 4))
+        matrix = NDArrayMatrixAdapter(matrix=array)
+        self.assertTrue(numpy.shares_memory(array, matrix.get_column(2)))
+
+    def test_append_invalidates_cache(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(2, 2)), owned=True)
+        numpy.testing.assert_array_equal([0., 0.], matrix.get_column(0))
+        matrix.append([1., 2.])
+        numpy.testing.assert_array_equal([0., 0., 1.], matrix.get_column(0))
+        numpy.testing.assert_array_equal([[0.], [0.], [2.]], matrix.get_column_block(1, 2))
+
+    def test_reshape_invalidates_cache(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.arange(6, dtype=float).reshape((2, 3)), owned=True)
+        numpy.testing.assert_array_equal([0., 3.], matrix.get_column(0))
+        matrix.reshape((3, 2))
+        numpy.testing.assert_array_equal([0., 2., 4.], matrix.get_column(0))
+
+    def test_mutation_of_wrapped_array_is_seen(self):
+        array = numpy.zeros(shape=(3, 2))
+        matrix = NDArrayMatrixAdapter(matrix=array)
+        numpy.testing.assert_array_equal([0., 0., 0.], matrix.get_column(0))
+        array[:, 0] = 1.
+        numpy.testing.assert_array_equal([1., 1., 1.], matrix.get_column(0))
+        numpy.testing.assert_array_equal(array, matrix.get_column_block(0, 2))
+
+    def test_rows_of_owned_array_are_read_only(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(2, 2)), owned=True)
+        numpy.testing.assert_array_equal([0., 0.], matrix.get_column(0))
+        with self.assertRaises(ValueError):
+            matrix.get_row(0)[0] = 1.
+        with self.assertRaises(ValueError):
+            matrix.get_row_block(0, 2)[:] = 1.
+        numpy.testing.assert_array_equal([0., 0.], matrix.get_column(0))
+
+    def test_rows_of_wrapped_array_are_writable(self):
+        array = numpy.zeros(shape=(2, 2))
+        matrix = NDArrayMatrixAdapter(matrix=array)
+        matrix.get_row(0)[0] = 1.
+        numpy.testing.assert_array_equal([1., 0.], matrix.get_column(0))
+
+    def test_appended_rows_are_cached(self):
+        matrix = NDArrayMatrixAdapter(matrix=numpy.zeros(shape=(2, 2)))
+        matrix.append([1., 2.])
+        self.assertIs(matrix.get_column(0).base, matrix.get_column(1).base)
+        self.assertTrue(matrix.get_column(0).flags.c_contiguous)
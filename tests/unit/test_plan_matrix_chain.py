@@ -0,0 +1,46 @@
+"""This module tests methods of :class:`PlanMatrixChain` in :module:`matrix_multiplication.commands.planning`
+"""
+from __future__ import annotations
+import unittest
+
+from matrix_multiplication.commands.planning import PlanMatrixChain, LeftToRightPlanMatrixChain
+
+# classic matrix chain from "Introduction to Algorithms" with 15125 scalar multiplications in the optimal order
+SHAPES = [(30, 35), (35, 15), (15, 5), (5, 10), (10, 20), (20, 25)]
+
+
+class TestCall(unittest.TestCase):
+    def test_optimal_parenthesization_found(self):
+        plan = PlanMatrixChain()(shapes=SHAPES)
+        self.assertEqual("((M0 (M1 M2)) ((M3 M4) M5))", repr(plan))
+
+    def test_optimal_cost_is_estimated_in_flops(self):
+        plan = PlanMatrixChain()(shapes=SHAPES)
+        self.assertEqual(2 * 15125, plan.cost())
+
+    def test_plan_shape_equals_chain_product_shape(self):
+        plan = PlanMatrixChain()(shapes=SHAPES)
+        self.assertEqual((30, 25), plan.shape())
+
+    def test_optimal_cost_does_not_exceed_left_to_right_cost(self):
+        optimal_plan = PlanMatrixChain()(shapes=SHAPES)
+        left_to_right_plan = LeftToRightPlanMatrixChain()(shapes=SHAPES)
+        self.assertLessEqual(optimal_plan.cost(), left_to_right_plan.cost())
+
+    def test_single_matrix_plan_is_leaf(self):
+        plan = PlanMatrixChain()(shapes=[(3, 4)])
+        self.assertEqual((repr(plan), plan.cost()), ("M0", 0))
+
+    def test_empty_chain_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            PlanMatrixChain()(shapes=[])
+
+
+class TestLeftToRightCall(unittest.TestCase):
+    def test_chain_folded_from_left_to_right(self):
+        plan = LeftToRightPlanMatrixChain()(shapes=SHAPES[:4])
+        self.assertEqual("(((M0 M1) M2) M3)", repr(plan))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""This module tests methods of :class:`PlanMatrixSequence` in :module:`matrix_multiplication.commands.planning`
+"""
+from __future__ import annotations
+import unittest
+from unittest.mock import Mock
+
+from matrix_multiplication.commands.planning import (
+    LeafPlan, ProductPlan, PlanMatrixChain, LeftToRightPlanMatrixChain, PlanMatrixSequence, MemoryBudgetExceededError)
+from matrix_multiplication.kernel import Precision
+from matrix_multiplication.matrix.shape import MatrixShape
+
+
+def shapes(*dimensions, itemsize: int = 8):
+    return (MatrixShape(shape=(rows, columns), itemsize=itemsize)
+            for rows, columns in zip(dimensions[:-1], dimensions[1:]))
+
+
+class TestCall(unittest.TestCase):
+    """This test case checks if the sequence is planned in one pass reading the shapes only
+    """
+
+    def test_generator_is_planned_and_kept(self):
+        sequence_plan = PlanMatrixSequence()(matrices=shapes(2, 3, 4, 5))
+        self.assertEqual(3, len(sequence_plan.matrices))
+        self.assertEqual([(2, 4), (2, 5)], sequence_plan.intermediate_shapes)
+        self.assertEqual(2 * (2 * 3 * 4 + 2 * 4 * 5), sequence_plan.flops)
+
+    def test_intermediate_shapes_follow_chain_order(self):
+        sequence_plan = PlanMatrixSequence(plan_matrix_chain=PlanMatrixChain())(matrices=shapes(10, 100, 5, 50))
+        self.assertEqual([(10, 5), (10, 50)], sequence_plan.intermediate_shapes)
+
+    def test_peak_bytes_holds_operands_and_products(self):
+        # operands 2x3, 3x4, 4x5 (26 elements), the first product 2x4 is held while the result 2x5 is calculated
+        sequence_plan = PlanMatrixSequence(plan_matrix_chain=LeftToRightPlanMatrixChain())(
+            matrices=shapes(2, 3, 4, 5, itemsize=4))
+        self.assertEqual(4 * (6 + 12 + 20 + 8 + 10), sequence_plan.peak_bytes)
+
+    def test_products_are_sized_in_output_type_of_precision(self):
+        # two 1000x1000 int8 operands are multiplied into 1000x1000 int64 product
+        matrices = [MatrixShape(shape=(1000, 1000), itemsize=1) for _ in range(2)]
+        sequence_plan = PlanMatrixSequence(precision=Precision.from_mode(mode="integer"))(matrices=matrices)
+        self.assertEqual(2 * 1000 * 1000 + 8 * 1000 * 1000, sequence_plan.peak_bytes)
+        sequence_plan = PlanMatrixSequence()(matrices=matrices)
+        self.assertEqual(3 * 1000 * 1000, sequence_plan.peak_bytes)
+
+    def test_concurrent_peak_bytes_sums_independent_products(self):
+        # operands 30x2 and 2x30 alternately (360 elements); each half of the chain holds a 30x30 product (900)
+        # and its 60 elements result, the halves are multiplied into 30x30 result
+        leaves = [LeafPlan(index=index, shape=(30, 2) if index % 2 == 0 else (2, 30)) for index in range(6)]
+        plan = ProductPlan(left=ProductPlan(left=ProductPlan(left=leaves[0], right=leaves[1]), right=leaves[2]),
+                           right=ProductPlan(left=leaves[3], right=ProductPlan(left=leaves[4], right=leaves[5])))
+        plan_matrix_chain = Mock(return_value=plan)
+        for scheduling, peak in (("sequential", 60 + 960), ("concurrent", 960 + 960)):
+            with self.subTest(scheduling=scheduling):
+                sequence_plan = PlanMatrixSequence(plan_matrix_chain=plan_matrix_chain, scheduling=scheduling)(
+                    matrices=shapes(30, 2, 30, 2, 30, 2, 30))
+                self.assertEqual(8 * (360 + peak), sequence_plan.peak_bytes)
+
+    def test_unknown_scheduling_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            PlanMatrixSequence(scheduling="parallel")
+
+    def test_invalid_sequence_raises_value_error(self):
+        for matrices in ((MatrixShape(shape=shape) for shape in ((2, 3), (4, 5))), []):
+            with self.subTest(matrices=matrices):
+                with self.assertRaises(ValueError):
+                    PlanMatrixSequence()(matrices=matrices)
+
+    def test_exceeded_memory_budget_raises_error(self):
+        command = PlanMatrixSequence(memory_budget=1000)
+        self.assertLessEqual(command(matrices=shapes(2, 3, 4, 5)).peak_bytes, 1000)
+        with self.assertRaises(MemoryBudgetExceededError):
+            command(matrices=shapes(20, 30, 40))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""This module tests methods of :class:`PrecisionMultiplyMatrixPair` in :module:`matrix_multiplication.commands.precision`
+"""
+from __future__ import annotations
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+import numpy
+
+from matrix_multiplication.abc.matrix_multiplication import ABCAsyncMultiplyMatrixPair, ABCMultiplyMatrixPair
+from matrix_multiplication.commands.precision import AsyncPrecisionMultiplyMatrixPair, PrecisionMultiplyMatrixPair
+from matrix_multiplication.kernel import Precision
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+from matrix_multiplication.matrix.mapped import MemmapMatrixAdapter
+from matrix_multiplication.matrix.sparse import SparseMatrixAdapter
+
+
+def multiply(matrix1, matrix2):
+    return NDArrayMatrixAdapter(matrix=numpy.dot(to_ndarray(matrix=matrix1), to_ndarray(matrix=matrix2)))
+
+
+class TestCall(unittest.TestCase):
+    """This test case checks if the operands and the product are converted to the types of the precision
+    """
+
+    def test_operands_are_sent_in_compute_type(self):
+        multiply_matrix_pair = Mock(ABCMultiplyMatrixPair, side_effect=multiply)
+        command = PrecisionMultiplyMatrixPair(
+            multiply_matrix_pair=multiply_matrix_pair, precision=Precision.from_mode(mode="float32"))
+        result = command(matrix1=NDArrayMatrixAdapter(matrix=numpy.random.rand(3, 4)),
+                         matrix2=NDArrayMatrixAdapter(matrix=numpy.random.rand(4, 2)))
+        operands = multiply_matrix_pair.call_args.kwargs
+        self.assertEqual(numpy.float32, operands["matrix1"].dtype)
+        self.assertEqual(numpy.float32, operands["matrix2"].dtype)
+        self.assertEqual(numpy.float32, result.dtype)
+
+    def test_matrices_of_compute_type_are_passed_as_they_are(self):
+        matrix1 = NDArrayMatrixAdapter(matrix=numpy.random.rand(3, 4).astype(numpy.float32))
+        matrix2 = SparseMatrixAdapter.from_ndarray(array=numpy.eye(4))
+        multiply_matrix_pair = Mock(ABCMultiplyMatrixPair, side_effect=multiply)
+        command = PrecisionMultiplyMatrixPair(
+            multiply_matrix_pair=multiply_matrix_pair, precision=Precision.from_mode(mode="mixed"))
+        command(matrix1=matrix1, matrix2=matrix2)
+        operands = multiply_matrix_pair.call_args.kwargs
+        self.assertIs(matrix1, operands["matrix1"])
+        # sparse matrices stay sparse
+        self.assertIsInstance(operands["matrix2"], SparseMatrixAdapter)
+        self.assertEqual(numpy.float32, operands["matrix2"].dtype)
+
+    def test_memory_mapped_operands_are_converted_into_temporary_files(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        array1, array2 = numpy.random.rand(5, 4), numpy.random.rand(4, 3)
+        matrix1 = MemmapMatrixAdapter.from_matrix(
+            matrix=NDArrayMatrixAdapter(matrix=array1), path=os.path.join(directory.name, "matrix1.npy"))
+        matrix2 = MemmapMatrixAdapter.from_matrix(
+            matrix=NDArrayMatrixAdapter(matrix=array2), path=os.path.join(directory.name, "matrix2.npy"), order="F")
+        operands = list()
+
+        def record(matrix1, matrix2):
+            operands.extend((matrix1, matrix2))
+            operands.append([(matrix.dtype, matrix.reference.order, matrix.path) for matrix in (matrix1, matrix2)])
+            return multiply(matrix1=matrix1, matrix2=matrix2)
+
+        command = PrecisionMultiplyMatrixPair(
+            multiply_matrix_pair=Mock(ABCMultiplyMatrixPair, side_effect=record),
+            precision=Precision.from_mode(mode="float32"), directory=directory.name)
+        result = command(matrix1=matrix1, matrix2=matrix2)
+        converted1, converted2, ((dtype1, order1, path1), (dtype2, order2, path2)) = operands
+        self.assertIsInstance(converted1, MemmapMatrixAdapter)
+        self.assertIsInstance(converted2, MemmapMatrixAdapter)
+        self.assertEqual((numpy.float32, numpy.float32), (dtype1, dtype2))
+        self.assertEqual(("C", "F"), (order1, order2))
+        # the converted copies are removed once the product is calculated
+        self.assertFalse(os.path.exists(path1) or os.path.exists(path2))
+        numpy.testing.assert_allclose(numpy.dot(array1, array2), to_ndarray(matrix=result), rtol=1e-5)
+
+    def test_native_precision_does_not_convert(self):
+        matrix1, matrix2 = NDArrayMatrixAdapter(matrix=numpy.ones((2, 2))), NDArrayMatrixAdapter(matrix=numpy.ones((2, 2)))
+        multiply_matrix_pair = Mock(ABCMultiplyMatrixPair)
+        PrecisionMultiplyMatrixPair(multiply_matrix_pair=multiply_matrix_pair)(matrix1=matrix1, matrix2=matrix2)
+        multiply_matrix_pair.assert_called_once_with(matrix1=matrix1, matrix2=matrix2)
+
+    def test_integer_precision_rejects_float_operands(self):
+        command = PrecisionMultiplyMatrixPair(
+            multiply_matrix_pair=Mock(ABCMultiplyMatrixPair), precision=Precision.from_mode(mode="integer"))
+        with self.assertRaises(ValueError):
+            command(matrix1=NDArrayMatrixAdapter(matrix=numpy.ones((2, 2))),
+                    matrix2=NDArrayMatrixAdapter(matrix=numpy.ones((2, 2))))
+
+
+class TestAsyncCall(unittest.IsolatedAsyncioTestCase):
+    """This test case checks if the awaited products are converted to the types of the precision
+    """
+
+    async def test_operands_and_product_are_converted(self):
+        multiply_matrix_pair = AsyncMock(ABCAsyncMultiplyMatrixPair, side_effect=multiply)
+        command = AsyncPrecisionMultiplyMatrixPair(
+            multiply_matrix_pair=multiply_matrix_pair, precision=Precision.from_mode(mode="mixed"))
+        array1, array2 = numpy.random.rand(3, 4), numpy.random.rand(4, 2)
+        result = await command(matrix1=NDArrayMatrixAdapter(matrix=array1), matrix2=NDArrayMatrixAdapter(matrix=array2))
+        operands = multiply_matrix_pair.call_args.kwargs
+        self.assertEqual((numpy.float32, numpy.float32), (operands["matrix1"].dtype, operands["matrix2"].dtype))
+        self.assertEqual(numpy.float32, result.dtype)
+        numpy.testing.assert_allclose(numpy.dot(array1, array2), to_ndarray(matrix=result), rtol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main()
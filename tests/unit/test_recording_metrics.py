@@ -0,0 +1,62 @@
+"""This module tests methods of :class:`RecordingMetrics` in :module:`matrix_multiplication.metrics.recorders`
+"""
+from __future__ import annotations
+import json
+import os
+import tempfile
+import unittest
+from multiprocessing.pool import ThreadPool
+
+from matrix_multiplication.commands.matrix_multiplication import CalculateCell
+from matrix_multiplication.metrics import RecordingMetrics
+from matrix_multiplication.task.processor import MultiprocessTaskProcessor, StreamingTaskProcessor
+
+
+class TestSummary(unittest.TestCase):
+    def test_stage_times_summed_by_name(self):
+        metrics = RecordingMetrics()
+        metrics.record_stage(name="build_tasks", start=0.0, duration=1.0)
+        metrics.record_stage(name="build_tasks", start=2.0, duration=0.5)
+        self.assertEqual({"build_tasks": 1.5}, metrics.summary()["stages"])
+
+    def test_worker_busy_and_idle_time_calculated(self):
+        metrics = RecordingMetrics()
+        metrics.record_task(name="CalculateBlock", worker=1, submitted=0.0, started=1.0, finished=2.0, size=10)
+        metrics.record_task(name="CalculateBlock", worker=2, submitted=0.0, started=1.0, finished=4.0, size=20)
+        summary = metrics.summary()
+        self.assertEqual({1: {"busy": 1.0, "idle": 2.0}, 2: {"busy": 3.0, "idle": 0.0}}, summary["workers"])
+        self.assertEqual((2, 30, 2.0), (summary["tasks"], summary["serialized_bytes"], summary["queue_wait"]))
+
+    def test_trace_exported_in_chrome_trace_format(self):
+        metrics = RecordingMetrics()
+        metrics.record_stage(name="build_tasks", start=1.0, duration=1.0)
+        metrics.record_task(name="CalculateBlock", worker=1, submitted=0.0, started=1.0, finished=2.0, size=10)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            metrics.export_trace(path=path)
+            with open(path, mode="r") as trace_file:
+                events = json.load(trace_file)["traceEvents"]
+        self.assertEqual(["build_tasks", "queue_wait", "CalculateBlock"], [event["name"] for event in events])
+        self.assertTrue(all(event["ph"] == "X" for event in events))
+
+
+class TestInstrumentedProcessing(unittest.TestCase):
+    def test_batch_processor_records_each_task(self):
+        tasks = [CalculateCell(row=[i], column=[1]) for i in range(5)]
+        metrics = RecordingMetrics()
+        with ThreadPool(processes=2) as pool:
+            results = MultiprocessTaskProcessor(pool=pool, metrics=metrics)(tasks=tasks)
+        self.assertEqual(list(range(5)), results)
+        self.assertEqual(5, metrics.summary()["tasks"])
+
+    def test_streaming_processor_records_each_task(self):
+        tasks = [CalculateCell(row=[i], column=[1]) for i in range(5)]
+        metrics = RecordingMetrics()
+        with ThreadPool(processes=2) as pool:
+            results = list(StreamingTaskProcessor(pool=pool, window=2, metrics=metrics)(tasks=tasks))
+        self.assertEqual(list(range(5)), results)
+        self.assertEqual(5, metrics.summary()["tasks"])
+
+
+if __name__ == "__main__":
+    unittest.main()
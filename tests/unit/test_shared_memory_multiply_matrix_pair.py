@@ -0,0 +1,49 @@
+"""This module tests methods of :class:`SharedMemoryMultiplyMatrixPair` in :module:`matrix_multiplication.commands.matrix_multiplication`
+"""
+from __future__ import annotations
+import unittest
+from unittest.mock import Mock, patch
+
+import numpy
+
+from matrix_multiplication.abc.task import TaskProcessor
+from matrix_multiplication.commands.matrix_multiplication import BuildSharedBlockTasks, SharedMemoryMultiplyMatrixPair
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+from matrix_multiplication.matrix.shared import SharedArray, SharedMatrixAdapter
+
+
+class TestCall(unittest.TestCase):
+    """This test case checks if the operands are copied into shared memory block by block
+    """
+
+    def test_operands_are_copied_in_row_blocks(self):
+        array1, array2 = numpy.random.rand(10, 4), numpy.random.rand(4, 6)
+        matrix1 = Mock(wraps=NDArrayMatrixAdapter(matrix=array1))
+        command = SharedMemoryMultiplyMatrixPair(
+            build_tasks=BuildSharedBlockTasks(tile_size=4),
+            task_processor=Mock(TaskProcessor, side_effect=lambda tasks: [task() for task in tasks]))
+        # three rows of the first operand fit the chunk
+        with patch("matrix_multiplication.matrix.shared._COPY_CHUNK_BYTES", 3 * 4 * 8):
+            result = command(matrix1=matrix1, matrix2=NDArrayMatrixAdapter(matrix=array2))
+        self.assertIn(((0, 3), {}), matrix1.get_row_block.call_args_list)
+        self.assertNotIn(((0, 10), {}), matrix1.get_row_block.call_args_list)
+        self.assertIsInstance(result, SharedMatrixAdapter)
+        numpy.testing.assert_array_almost_equal(numpy.dot(array1, array2), to_ndarray(matrix=result))
+        result.release()
+
+    def test_shared_operands_are_not_copied(self):
+        array1, array2 = numpy.random.rand(5, 4), numpy.random.rand(4, 3)
+        matrix1 = SharedMatrixAdapter(shared_array=SharedArray.from_ndarray(array=array1))
+        command = SharedMemoryMultiplyMatrixPair(
+            build_tasks=BuildSharedBlockTasks(tile_size=4),
+            task_processor=Mock(TaskProcessor, side_effect=lambda tasks: [task() for task in tasks]))
+        result = command(matrix1=matrix1, matrix2=NDArrayMatrixAdapter(matrix=array2))
+        # the operand given in shared memory is still usable after the product
+        numpy.testing.assert_array_equal(array1, to_ndarray(matrix=matrix1))
+        numpy.testing.assert_array_almost_equal(numpy.dot(array1, array2), to_ndarray(matrix=result))
+        for matrix in (matrix1, result):
+            matrix.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""This module tests methods of :class:`SparseMatrixAdapter` in :module:`matrix_multiplication.matrix.sparse`
+"""
+from __future__ import annotations
+import unittest
+
+import numpy
+
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+from matrix_multiplication.matrix.sparse import SparseMatrixAdapter
+
+
+def _sparse_array(shape, density=0.1):
+    array = numpy.random.rand(*shape)
+    array[numpy.random.rand(*shape) >= density] = 0
+    return array
+
+
+class TestSparseMatrixAdapter(unittest.TestCase):
+    """This test case checks if the compressed matrix is read the same way as the dense one
+    """
+
+    def test_only_non_zeros_are_stored(self):
+        array = _sparse_array(shape=(30, 20))
+        matrix = SparseMatrixAdapter.from_ndarray(array=array)
+        self.assertEqual(numpy.count_nonzero(array), matrix.nnz)
+        self.assertEqual((30, 20), (matrix.column_len(), matrix.row_len()))
+
+    def test_rows_and_columns_are_dense(self):
+        array = _sparse_array(shape=(30, 20))
+        matrix = SparseMatrixAdapter.from_ndarray(array=array)
+        numpy.testing.assert_array_equal(array[4, :], matrix.get_row(4))
+        numpy.testing.assert_array_equal(array[:, 7], matrix.get_column(7))
+        numpy.testing.assert_array_equal(array[5:9, :], matrix.get_row_block(5, 9))
+        numpy.testing.assert_array_equal(array[:, 3:11], matrix.get_column_block(3, 11))
+
+    def test_compressed_matrix_equals_dense_matrix(self):
+        array = _sparse_array(shape=(2500, 6))
+        matrix = SparseMatrixAdapter.from_matrix(matrix=NDArrayMatrixAdapter(matrix=array))
+        numpy.testing.assert_array_equal(array, to_ndarray(matrix=matrix))
+
+    def test_take_rows_returns_compressed_rows(self):
+        array = numpy.array([[0., 1., 0.], [0., 0., 0.], [2., 0., 3.]])
+        data, indices, indptr = SparseMatrixAdapter.from_ndarray(array=array).take_rows(rows=numpy.array([2, 0]))
+        numpy.testing.assert_array_equal([2., 3., 1.], data)
+        numpy.testing.assert_array_equal([0, 2, 1], indices)
+        numpy.testing.assert_array_equal([0, 2, 3], indptr)
+
+    def test_mismatched_arrays_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            SparseMatrixAdapter(data=[1., 2.], indices=[0], indptr=[0, 2], shape=(1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
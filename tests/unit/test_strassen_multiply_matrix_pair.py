@@ -0,0 +1,130 @@
+"""This module tests :class:`StrassenMultiplyMatrixPair` and :func:`strassen`
+in :module:`matrix_multiplication.commands.strassen`
+"""
+from __future__ import annotations
+import unittest
+from unittest.mock import Mock
+
+import numpy
+
+from matrix_multiplication.abc.kernel import ABCKernel
+from matrix_multiplication.abc.task import TaskProcessor
+from matrix_multiplication.commands.strassen import StrassenMultiplyMatrixPair, strassen
+from matrix_multiplication.kernel import BLASKernel, Precision
+from matrix_multiplication.matrix.adapters import NDArrayMatrixAdapter, to_ndarray
+
+
+class TestStrassen(unittest.TestCase):
+    """This test case checks if Strassen's product matches the classical one
+    """
+
+    def test_odd_shapes_are_padded(self):
+        for shape1, shape2 in (((9, 7), (7, 11)), ((16, 16), (16, 16)), ((5, 33), (33, 3))):
+            with self.subTest(shape1=shape1, shape2=shape2):
+                array1, array2 = numpy.random.rand(*shape1), numpy.random.rand(*shape2)
+                numpy.testing.assert_array_almost_equal(
+                    numpy.dot(array1, array2), strassen(left=array1, right=array2, threshold=2))
+
+    def test_integer_product_is_exact(self):
+        array1, array2 = numpy.random.randint(-9, 9, size=(13, 10)), numpy.random.randint(-9, 9, size=(10, 6))
+        numpy.testing.assert_array_equal(numpy.dot(array1, array2), strassen(left=array1, right=array2, threshold=1))
+
+    def test_integer_precision_product_is_exact(self):
+        array1 = numpy.random.randint(-128, 128, size=(13, 10)).astype(numpy.int8)
+        array2 = numpy.random.randint(-128, 128, size=(10, 6)).astype(numpy.int8)
+        product = strassen(left=array1, right=array2, threshold=1, precision=Precision.from_mode("integer"))
+        self.assertEqual(numpy.int64, product.dtype)
+        numpy.testing.assert_array_equal(numpy.dot(array1.astype(numpy.int64), array2.astype(numpy.int64)), product)
+
+    def test_overflow_of_quadrant_sums_raises_overflow_error(self):
+        # the result cells are 4 * 2 ** 60, the quadrant sums multiplied on the second level reach 2 ** 64
+        array = numpy.full(shape=(4, 4), fill_value=2 ** 30, dtype=numpy.int64)
+        precision = Precision.from_mode("integer")
+        precision.prepare(left=array, right=array)
+        with self.assertRaises(OverflowError):
+            strassen(left=array, right=array, threshold=1, kernel=BLASKernel(precision=precision), precision=precision)
+
+    def test_mixed_precision_product_is_combined_in_float64(self):
+        array1 = numpy.random.rand(16, 16).astype(numpy.float32)
+        array2 = numpy.random.rand(16, 16).astype(numpy.float32)
+        precision = Precision.from_mode("mixed")
+        # the kernel is built the way the container builds it
+        kernel = BLASKernel(precision=precision)
+        leaf_products = list()
+        leaf_kernel = kernel.accumulating()
+
+        def multiply_leaf(left, right):
+            leaf_products.append(leaf_kernel(left, right))
+            return leaf_products[-1]
+
+        product = strassen(left=array1, right=array2, threshold=4,
+                           kernel=Mock(ABCKernel, **{"accumulating.return_value": multiply_leaf}), precision=precision)
+        self.assertEqual(49, len(leaf_products))
+        self.assertTrue(all(leaf_product.dtype == numpy.float64 for leaf_product in leaf_products))
+        # the leaves are combined in float64 and rounded to float32 once
+        self.assertEqual(numpy.float32, product.dtype)
+        numpy.testing.assert_allclose(
+            numpy.dot(array1.astype(numpy.float64), array2.astype(numpy.float64)), product, rtol=1e-6)
+        self.assertEqual(numpy.float32, kernel(array1, array2).dtype)
+
+    def test_kernel_is_used_below_threshold(self):
+        kernel = Mock(ABCKernel, side_effect=BLASKernel())
+        kernel.accumulating.return_value = kernel
+        array1, array2 = numpy.random.rand(8, 8), numpy.random.rand(8, 8)
+        strassen(left=array1, right=array2, threshold=4, kernel=kernel)
+        # one level of the recursion makes seven 4 x 4 products
+        self.assertEqual(7, kernel.call_count)
+
+
+class TestCall(unittest.TestCase):
+    """This test case checks if the unrolled sub-products are sent to the task processor and assembled back
+    """
+
+    def _multiply(self, shape1, shape2, threshold: int, depth: int, ordered: bool = True):
+        array1, array2 = numpy.random.rand(*shape1), numpy.random.rand(*shape2)
+        task_counts = list()
+
+        def process_tasks(tasks):
+            results = [task() for task in tasks]
+            task_counts.append(len(results))
+            return results if ordered else reversed(list(enumerate(results)))
+
+        multiply_matrix_pair = StrassenMultiplyMatrixPair(
+            task_processor=Mock(TaskProcessor, side_effect=process_tasks), threshold=threshold, depth=depth,
+            ordered=ordered)
+        result = multiply_matrix_pair(matrix1=NDArrayMatrixAdapter(matrix=array1), matrix2=NDArrayMatrixAdapter(matrix=array2))
+        numpy.testing.assert_array_almost_equal(numpy.dot(array1, array2), to_ndarray(matrix=result))
+        return task_counts
+
+    def test_top_level_sends_seven_tasks(self):
+        self.assertEqual([7], self._multiply(shape1=(20, 15), shape2=(15, 17), threshold=4, depth=1))
+
+    def test_two_levels_send_forty_nine_tasks(self):
+        self.assertEqual([49], self._multiply(shape1=(21, 21), shape2=(21, 21), threshold=4, depth=2))
+
+    def test_small_product_sends_one_task(self):
+        self.assertEqual([1], self._multiply(shape1=(4, 30), shape2=(30, 30), threshold=4, depth=2))
+
+    def test_unordered_results_are_assembled_by_index(self):
+        self.assertEqual([7], self._multiply(shape1=(10, 10), shape2=(10, 10), threshold=2, depth=1, ordered=False))
+
+    def test_integer_precision_sub_products_are_exact(self):
+        array1 = numpy.random.randint(-128, 128, size=(20, 15)).astype(numpy.int8)
+        array2 = numpy.random.randint(-128, 128, size=(15, 17)).astype(numpy.int8)
+        multiply_matrix_pair = StrassenMultiplyMatrixPair(
+            task_processor=Mock(TaskProcessor, side_effect=lambda tasks: [task() for task in tasks]), threshold=4,
+            depth=1, precision=Precision.from_mode("integer"))
+        result = multiply_matrix_pair(matrix1=NDArrayMatrixAdapter(matrix=array1), matrix2=NDArrayMatrixAdapter(matrix=array2))
+        self.assertEqual(numpy.int64, to_ndarray(matrix=result).dtype)
+        numpy.testing.assert_array_equal(
+            numpy.dot(array1.astype(numpy.int64), array2.astype(numpy.int64)), to_ndarray(matrix=result))
+
+    def test_invalid_parameters_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            StrassenMultiplyMatrixPair(task_processor=Mock(TaskProcessor), threshold=0)
+        with self.assertRaises(ValueError):
+            StrassenMultiplyMatrixPair(task_processor=Mock(TaskProcessor), depth=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""This module tests methods of :class:`StreamingTaskProcessor` in :module:`matrix_multiplication.task.processor`
+"""
+from __future__ import annotations
+import unittest
+import unittest.mock as mock
+from multiprocessing.pool import Pool, ThreadPool
+
+from dependency_injector import containers, providers
+
+from matrix_multiplication.abc.task import Task
+from matrix_multiplication.task.processor import StreamingTaskProcessor
+
+
+class Container(containers.DeclarativeContainer):
+    processor = providers.Factory(StreamingTaskProcessor)
+
+
+class InFlightCountingPool(object):
+    """Pool stub running tasks on result collection and tracking the number of tasks in flight
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def apply_async(self, task):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        result = mock.Mock()
+        result.get = mock.Mock(side_effect=lambda: self._complete(task))
+        return result
+
+    def _complete(self, task):
+        self.in_flight -= 1
+        return task()
+
+
+class TestCall(unittest.TestCase):
+    def test_each_task_ran_once(self):
+        tasks = [mock.Mock(Task) for i in range(10)]
+        pool = mock.Mock(Pool)
+        container = Container()
+        processor = container.processor(pool=pool, window=3)
+        list(processor(tasks=tasks))
+        pool.apply_async.assert_has_calls([mock.call(task) for task in tasks], any_order=True)
+
+    def test_tasks_in_flight_never_exceed_window(self):
+        tasks = [mock.Mock(Task, return_value=i) for i in range(10)]
+        pool = InFlightCountingPool()
+        container = Container()
+        processor = container.processor(pool=pool, window=3)
+        self.assertEqual(list(range(10)), list(processor(tasks=tasks)))
+        self.assertEqual(3, pool.max_in_flight)
+
+    def test_tasks_pulled_lazily(self):
+        tasks = (mock.Mock(Task, return_value=i) for i in range(10))
+        container = Container()
+        processor = container.processor(pool=InFlightCountingPool(), window=2)
+        results = processor(tasks=tasks)
+        next(results)
+        # the first result is yielded when the third task is about to be submitted
+        self.assertEqual(7, len(list(tasks)))
+
+    def test_unordered_results_yielded_with_indices(self):
+        tasks = [mock.Mock(Task, return_value=i * i) for i in range(10)]
+        container = Container()
+        with ThreadPool(processes=4) as pool:
+            processor = container.processor(pool=pool, window=3, ordered=False)
+            results = list(processor(tasks=tasks))
+        self.assertEqual([(i, i * i) for i in range(10)], sorted(results))
+
+    def test_unordered_task_error_raised(self):
+        tasks = [mock.Mock(Task, side_effect=ValueError)]
+        container = Container()
+        with ThreadPool(processes=1) as pool:
+            processor = container.processor(pool=pool, ordered=False)
+            with self.assertRaises(ValueError):
+                list(processor(tasks=tasks))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""This module tests methods of :class:`ThreadPoolTaskProcessor` in :module:`matrix_multiplication.task.processor`
+"""
+from __future__ import annotations
+import concurrent.futures
+import threading
+import unittest
+import unittest.mock as mock
+
+import numpy
+from dependency_injector import containers, providers
+
+from matrix_multiplication.abc.task import Task
+from matrix_multiplication.metrics import RecordingMetrics
+from matrix_multiplication.task.processor import ThreadPoolTaskProcessor
+
+
+class Container(containers.DeclarativeContainer):
+    processor = providers.Factory(ThreadPoolTaskProcessor)
+
+
+class TestCall(unittest.TestCase):
+    def test_results_are_returned_in_task_order(self):
+        tasks = [mock.Mock(Task, return_value=i) for i in range(20)]
+        container = Container()
+        processor = container.processor(max_workers=4, window=3)
+        self.assertEqual(list(range(20)), list(processor(tasks=tasks)))
+        for task in tasks:
+            task.assert_called_once_with()
+
+    def test_unordered_results_are_indexed(self):
+        tasks = [mock.Mock(Task, return_value=i * 10) for i in range(20)]
+        container = Container()
+        processor = container.processor(max_workers=4, window=3, ordered=False)
+        self.assertEqual([(i, i * 10) for i in range(20)], sorted(processor(tasks=tasks)))
+
+    def test_operands_are_shared_by_reference(self):
+        array = numpy.zeros(shape=(4, 4))
+        tasks = [mock.Mock(Task, side_effect=lambda: array) for _ in range(4)]
+        container = Container()
+        processor = container.processor(max_workers=2)
+        for result in processor(tasks=tasks):
+            self.assertIs(array, result)
+
+    def test_tasks_run_by_threads_of_given_executor(self):
+        threads = set()
+        tasks = [mock.Mock(Task, side_effect=lambda: threads.add(threading.get_ident())) for _ in range(8)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="worker") as executor:
+            container = Container()
+            processor = container.processor(executor=executor)
+            list(processor(tasks=tasks))
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_task_error_is_raised(self):
+        tasks = [mock.Mock(Task, side_effect=ValueError("failed"))]
+        container = Container()
+        processor = container.processor(max_workers=1)
+        with self.assertRaises(ValueError):
+            list(processor(tasks=tasks))
+
+    def test_tasks_are_recorded_by_thread(self):
+        metrics = RecordingMetrics()
+        tasks = [TaskStub(value=i) for i in range(6)]
+        container = Container()
+        processor = container.processor(max_workers=2, metrics=metrics)
+        self.assertEqual(list(range(6)), list(processor(tasks=tasks)))
+        summary = metrics.summary()
+        self.assertEqual(6, summary["tasks"])
+        self.assertEqual(0, summary["serialized_bytes"])
+        self.assertNotIn(threading.get_ident(), summary["workers"])
+
+
+class TaskStub(Task):
+    def __init__(self, value: int) -> None:
+        self._value = value
+
+    def __call__(self) -> int:
+        return self._value
+
+
+if __name__ == "__main__":
+    unittest.main()
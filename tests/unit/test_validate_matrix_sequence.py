@@ -28,5 +28,14 @@ class TestCall(unittest.TestCase):
         command(matrices=matrices)
         validate_matrix_pair.assert_has_calls([call(matrix1=matrices[i], matrix2=matrices[i+1]) for i in range(0, len(matrices) - 1)], any_order=True)
 
+    def test_generator_is_validated_pairwise(self):
+        validate_matrix_pair = Mock(return_value=True)
+        matrices = [Mock() for i in range(4)]
+        container = CommandContainer()
+        command = container.validate_matrix_sequence(validate_matrix_pair=validate_matrix_pair)
+        self.assertTrue(command(matrices=(matrix for matrix in matrices)))
+        validate_matrix_pair.assert_has_calls([call(matrix1=matrices[i], matrix2=matrices[i+1]) for i in range(0, len(matrices) - 1)])
+
+
 if __name__ == "__main__":
     unittest.main()